@@ -0,0 +1,172 @@
+"""Persistent on-disk cache of the results of design checks."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+from desssign.common.fingerprint import fingerprint
+
+if TYPE_CHECKING:
+    from desssign.common.design_check import CheckSummary
+
+
+def get_code_version() -> str:
+    """Return the installed version of desssign, which invalidates cached results on upgrade."""
+    try:
+        return version("desssign")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class CacheStats(NamedTuple):
+    """
+    Statistics of a :class:`CheckCache`.
+
+    :param hits: Number of lookups found in the cache.
+    :param misses: Number of lookups not found in the cache.
+    :param evictions: Number of entries removed to respect the size limit.
+    :param entries: Number of entries in the cache.
+    :param size: Total size of the entries in bytes.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class CheckCache:
+    """
+    On-disk cache of check summaries, keyed by a hash of the inputs of the checks.
+
+    Every entry is a small JSON file named by its key, holding the summaries of all check
+    families of a member under a combination. The entries are kept in the order of their
+    last use, restored from the modification times of the files, and the least recently
+    used entries are removed once the total size exceeds `max_size`.
+
+    :param directory: Directory of the cache, created if needed.
+    :param max_size: Maximum total size of the entries in bytes.
+    :param code_version: Version of the design code implementation, part of every key.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_size: int = 256 * 1024**2,
+        code_version: str | None = None,
+    ) -> None:
+        """Init the CheckCache object."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.code_version = get_code_version() if code_version is None else code_version
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Sizes of the entries in the order of their last use
+        files = sorted(
+            (path.stat().st_mtime_ns, path.stem, path.stat().st_size)
+            for path in self.directory.glob("*.json")
+        )
+        self._sizes: OrderedDict[str, int] = OrderedDict(
+            (key, size) for _, key, size in files
+        )
+        self._size = sum(self._sizes.values())
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._sizes)
+
+    def __repr__(self) -> str:
+        """Return a string representation of CheckCache object."""
+        return f"{self.__class__.__name__}({self.directory}, entries={len(self)})"
+
+    @property
+    def stats(self) -> CacheStats:
+        """Statistics of the cache."""
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._sizes),
+            size=self._size,
+        )
+
+    def get_key(
+        self, member_print: str, combination_print: str, families: tuple[str, ...]
+    ) -> str:
+        """
+        Return the key of the checks of a member under a combination.
+
+        :param member_print: Fingerprint of the section, material and other inputs of the member,
+                             see :func:`member_fingerprint`.
+        :param combination_print: Fingerprint of the internal forces and the load duration class,
+                                  see :func:`combination_fingerprint`.
+        :param families: Names of the check families.
+        """
+        return fingerprint(member_print, combination_print, families, self.code_version)
+
+    def get(self, key: str) -> dict[str, dict[str, Any]] | None:
+        """
+        Return the cached fields of the check summaries by their family, or None.
+
+        :param key: Key of the checks, see :meth:`get_key`.
+        """
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, encoding="utf-8") as file:
+                entry: dict[str, dict[str, Any]] = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            self._size -= self._sizes.pop(key, 0)
+            self.misses += 1
+            return None
+
+        self._sizes.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, summaries: list[CheckSummary]) -> None:
+        """
+        Cache the check summaries of a member under a combination, their combination is not stored.
+
+        :param key: Key of the checks, see :meth:`get_key`.
+        :param summaries: The check summaries of all families.
+        """
+        entry = {}
+        for summary in summaries:
+            fields = summary._asdict()
+            del fields["combination"]
+            entry[summary.family] = fields
+        content = json.dumps(entry)
+        with open(self.directory / f"{key}.json", "w", encoding="utf-8") as file:
+            file.write(content)
+
+        self._size += len(content.encode()) - self._sizes.pop(key, 0)
+        self._sizes[key] = len(content.encode())
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits its size limit."""
+        while self._size > self.max_size and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self._size -= size
+            (self.directory / f"{key}.json").unlink(missing_ok=True)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for key in self._sizes:
+            (self.directory / f"{key}.json").unlink(missing_ok=True)
+        self._sizes.clear()
+        self._size = 0
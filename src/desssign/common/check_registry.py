@@ -0,0 +1,312 @@
+"""Registry of design checks evaluated by batched kernels."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+import numpy as np
+
+from desssign.common.design_check import INTERNAL_FORCES
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from desssign.common.design_check import Member1DChecks
+    from desssign.loads.load_case_combination import DesignLoadCaseCombination
+
+
+@dataclass(frozen=True)
+class QuantityDefinition:
+    """
+    Intermediate quantity shared by several check kernels, e.g. a stress.
+
+    :param name: Unique name of the quantity.
+    :param function: Function evaluating the quantity from its inputs.
+    :param inputs: Names of the inputs passed to the function, see :class:`CheckInputs`.
+    """
+
+    name: str
+    function: Callable[..., Any]
+    inputs: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class CheckDefinition:
+    """
+    Design check evaluated by a batched kernel.
+
+    The kernel is called with the declared inputs as keyword arguments, named by the last part
+    of the dotted input names, and returns the usages of shape (n_rows, n_points).
+
+    :param name: Unique name of the check.
+    :param family: Name of the check family, see :attr:`Member1DChecks.check_families`.
+    :param code: Design code of the check.
+    :param paragraph: Paragraph of the design code.
+    :param kernel: Function evaluating the usages from the inputs.
+    :param inputs: Names of the inputs passed to the kernel, see :class:`CheckInputs`.
+    :param include_peaks: Whether the peak values of the internal forces are checked.
+    """
+
+    name: str
+    family: str
+    code: str
+    paragraph: str
+    kernel: Callable[..., npt.NDArray[np.float64]]
+    inputs: tuple[str, ...]
+    include_peaks: bool = True
+
+
+class CheckInputs:
+    """
+    Lazily evaluated inputs of the check kernels for one block of internal forces.
+
+    Every input is evaluated at most once per block. Input names are resolved as:
+
+    - the internal forces, e.g. 'axial_forces', with shape (n_rows, n_points),
+    - the quantities of the registry,
+    - 'section.<name>': attribute of the section of the member,
+    - 'member.<name>': attribute of the member,
+    - 'strength.<name>': design strength of the material per row, with shape (n_rows, 1),
+    - 'checks.<name>': attribute of the :class:`Member1DChecks` object, called if it is a method.
+
+    :param registry: The registry of the quantities.
+    :param checks: The design checks of the member.
+    :param forces: Internal forces of shape (6, n_rows, n_points).
+    :param load_duration_codes: Load duration code of every row.
+    """
+
+    def __init__(
+        self,
+        registry: CheckRegistry,
+        checks: Member1DChecks,
+        forces: npt.NDArray[np.float64],
+        load_duration_codes: npt.NDArray[np.int_] | None,
+    ) -> None:
+        """Init the CheckInputs object."""
+        self.registry = registry
+        self.checks = checks
+        self.forces = forces
+        self.load_duration_codes = load_duration_codes
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        """Return the value of an input."""
+        if name not in self._values:
+            self._values[name] = self._evaluate(name)
+        return self._values[name]
+
+    def get_arguments(self, inputs: tuple[str, ...]) -> dict[str, Any]:
+        """Return the keyword arguments of a kernel declaring the inputs."""
+        return {name.rsplit(".", 1)[-1]: self[name] for name in inputs}
+
+    def _evaluate(self, name: str) -> Any:
+        """Evaluate an input."""
+        if name in INTERNAL_FORCES:
+            return self.forces[INTERNAL_FORCES.index(name)]
+
+        quantity = self.registry.quantities.get(name)
+        if quantity is not None:
+            return quantity.function(**self.get_arguments(quantity.inputs))
+
+        source, _, attribute = name.partition(".")
+        if source == "section":
+            return getattr(self.checks.member.section, attribute)
+        if source == "member":
+            return getattr(self.checks.member, attribute)
+        if source == "strength":
+            if self.load_duration_codes is None:
+                raise ValueError(
+                    f"Input '{name}' requires the load duration classes of the combinations."
+                )
+            material = self.checks.member.section.material
+            return material.get_design_strengths(attribute, self.load_duration_codes)[
+                :, np.newaxis
+            ]
+        if source == "checks":
+            value = getattr(self.checks, attribute)
+            return value() if callable(value) else value
+
+        raise KeyError(f"Unknown check input: '{name}'.")
+
+
+class CheckPipeline:
+    """
+    Ordered checks evaluated together for a member.
+
+    The checks of a pipeline share their inputs, so stresses and strengths needed by several
+    checks are evaluated once.
+
+    :param registry: The registry of the checks.
+    :param checks: Definitions of the checks of the pipeline.
+    """
+
+    def __init__(
+        self, registry: CheckRegistry, checks: tuple[CheckDefinition, ...]
+    ) -> None:
+        """Init the CheckPipeline object."""
+        self.registry = registry
+        self.checks = checks
+
+    @property
+    def references(self) -> dict[str, tuple[str, str]]:
+        """Design code and paragraph of every check family."""
+        return {check.family: (check.code, check.paragraph) for check in self.checks}
+
+    def evaluate(
+        self,
+        member_checks: Member1DChecks,
+        forces: npt.NDArray[np.float64],
+        load_duration_codes: npt.NDArray[np.int_] | None,
+        include_peaks: bool | None = None,
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """
+        Evaluate the usages of the checks for a block of internal forces.
+
+        :param member_checks: The design checks of the member.
+        :param forces: Internal forces of shape (6, n_rows, n_points), see
+                       :meth:`Member1DChecks.get_internal_forces_block`.
+        :param load_duration_codes: Load duration code of every row.
+        :param include_peaks: Only evaluate the checks with this value of `include_peaks`,
+                              all checks are evaluated if not provided.
+        :return: Usages of shape (n_rows, n_points) of every check family.
+        """
+        inputs = CheckInputs(self.registry, member_checks, forces, load_duration_codes)
+        return {
+            check.family: check.kernel(**inputs.get_arguments(check.inputs))
+            for check in self.checks
+            if include_peaks in (None, check.include_peaks)
+        }
+
+    def run(
+        self,
+        member_checks: Member1DChecks,
+        combinations: list[DesignLoadCaseCombination],
+    ) -> None:
+        """
+        Evaluate the checks for the combinations and save their summaries.
+
+        :param member_checks: The design checks of the member.
+        :param combinations: The load case combinations (or envelopes) to check.
+        """
+        load_duration_codes = [
+            getattr(combination, "load_duration_code", None)
+            for combination in combinations
+        ]
+        for include_peaks in sorted({check.include_peaks for check in self.checks}):
+            forces, owners, lengths = member_checks.get_internal_forces_block(
+                combinations, include_peaks=include_peaks
+            )
+            codes = (
+                None
+                if None in load_duration_codes
+                else np.array(load_duration_codes, dtype=int)[owners]
+            )
+            usages = self.evaluate(member_checks, forces, codes, include_peaks)
+            member_checks.summarize_usages(
+                combinations, usages, owners, lengths, self.references
+            )
+
+
+class CheckRegistry:
+    """Registry of the design checks and of the quantities shared by them."""
+
+    def __init__(self) -> None:
+        """Init the CheckRegistry object."""
+        self.checks: dict[str, CheckDefinition] = {}
+        self.quantities: dict[str, QuantityDefinition] = {}
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether a check is registered."""
+        return name in self.checks
+
+    def add_check(self, definition: CheckDefinition) -> None:
+        """
+        Register a check.
+
+        :param definition: Definition of the check.
+        """
+        if definition.name in self.checks:
+            raise ValueError(f"Check '{definition.name}' is already registered.")
+        self.checks[definition.name] = definition
+
+    def add_quantity(self, definition: QuantityDefinition) -> None:
+        """
+        Register a quantity shared by check kernels.
+
+        :param definition: Definition of the quantity.
+        """
+        if definition.name in self.quantities:
+            raise ValueError(f"Quantity '{definition.name}' is already registered.")
+        self.quantities[definition.name] = definition
+
+    def check(
+        self,
+        name: str,
+        family: str,
+        code: str,
+        paragraph: str,
+        inputs: tuple[str, ...],
+        include_peaks: bool = True,
+    ) -> Callable[[Callable[..., npt.NDArray[np.float64]]], Callable[..., npt.NDArray[np.float64]]]:
+        """
+        Return a decorator registering a check kernel.
+
+        :param name: Unique name of the check.
+        :param family: Name of the check family.
+        :param code: Design code of the check.
+        :param paragraph: Paragraph of the design code.
+        :param inputs: Names of the inputs passed to the kernel.
+        :param include_peaks: Whether the peak values of the internal forces are checked.
+        """
+
+        def decorator(
+            kernel: Callable[..., npt.NDArray[np.float64]]
+        ) -> Callable[..., npt.NDArray[np.float64]]:
+            self.add_check(
+                CheckDefinition(
+                    name=name,
+                    family=family,
+                    code=code,
+                    paragraph=paragraph,
+                    kernel=kernel,
+                    inputs=inputs,
+                    include_peaks=include_peaks,
+                )
+            )
+            return kernel
+
+        return decorator
+
+    def quantity(
+        self, name: str, inputs: tuple[str, ...]
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Return a decorator registering a quantity shared by check kernels.
+
+        :param name: Unique name of the quantity.
+        :param inputs: Names of the inputs passed to the function.
+        """
+
+        def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+            self.add_quantity(QuantityDefinition(name, function, inputs))
+            return function
+
+        return decorator
+
+    def pipeline(self, *names: str) -> CheckPipeline:
+        """
+        Return the pipeline of the registered checks.
+
+        :param names: Names of the checks, in order of evaluation.
+        """
+        missing = [name for name in names if name not in self.checks]
+        if missing:
+            raise KeyError(f"Checks are not registered: {missing}.")
+        return CheckPipeline(self, tuple(self.checks[name] for name in names))
+
+
+# Registry shared by all member types, the checks register on import of their modules
+check_registry = CheckRegistry()
@@ -1,17 +1,46 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 from abc import abstractmethod
+from collections.abc import Mapping
+from collections.abc import MutableMapping
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import NamedTuple
+from typing import TypeVar
 
 import numpy as np
 
 from desssign.common.enums import CheckResult
+from desssign.common.fingerprint import combination_fingerprint
+from desssign.common.fingerprint import member_fingerprint
+from desssign.common.instrumentation import instrument
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
     import numpy.typing as npt
+    from framesss.pre.cases import EnvelopeCombination
     from framesss.pre.member_1d import Member1D
+
+    from desssign.common.check_cache import CheckCache
+    from desssign.common.check_registry import CheckPipeline
     from desssign.loads.load_case_combination import DesignLoadCaseCombination
 
+# Internal forces of `Member1DResults` in the order returned by `Member1DChecks.get_internal_forces`
+INTERNAL_FORCES = (
+    "axial_forces",
+    "shear_forces_y",
+    "shear_forces_z",
+    "torsional_moments",
+    "bending_moments_y",
+    "bending_moments_z",
+)
+PEAK_INTERNAL_FORCES = tuple(f"peak_{quantity}" for quantity in INTERNAL_FORCES)
+
 
 class Check:
     """Abstract class for design checks."""
@@ -45,13 +74,81 @@ class Check:
         return CheckResult(CheckResult.FAIL)
 
 
+class CheckSummary(NamedTuple):
+    """
+    Governing result of one design check for one load case combination.
+
+    :param family: Name of the check family, i.e. the attribute of :class:`Member1DChecks` holding the checks.
+    :param combination: The load case combination (or envelope) the check was performed for.
+    :param max_usage: Maximum usage along the member.
+    :param position: Position of the maximum usage along the local x-axis of the member.
+    :param code: Design code of the check.
+    :param paragraph: Paragraph of the design code.
+    """
+
+    family: str
+    combination: Any
+    max_usage: float
+    position: float
+    code: str
+    paragraph: str
+
+
 class Member1DChecks:
     """
     Abstract class for performing design checks on 1D members.
+
+    :cvar check_families: Names of the attributes holding `dict[combination, Check]` of every check family,
+                          see :meth:`get_check_families` for the families performed for the member.
+    :cvar member_attributes: Attributes of the member the checks depend on (besides its results),
+                             these are copied when the checks run outside the main process.
+    :cvar pipeline: Pipeline of the registered check kernels evaluated by :meth:`perform_fused_uls_checks`.
+    :ivar summaries: Check summaries that were computed elsewhere (e.g. in a worker process)
+                     and merged back, keyed by check family and combination.
+    :ivar top_k: Number of checks and summaries with the highest usages kept per check family,
+                 all are kept if None, see :meth:`set_retention`.
+    :ivar envelope_bounds: Bounds of the internal forces, the positions of the peaks and the bounds
+                           of the peak forces of envelopes, see :meth:`save_envelope_bounds`.
     """
 
+    check_families: tuple[str, ...] = ()
+    member_attributes: tuple[str, ...] = ("section",)
+    pipeline: CheckPipeline | None = None
+
     def __init__(self, member: Member1D) -> None:
         self.member = member
+        self.summaries: MutableMapping[tuple[str, Any], CheckSummary] = {}
+        self.top_k: int | None = None
+        self.envelope_bounds: dict[
+            Any,
+            tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]],
+        ] = {}
+
+    def set_retention(self, top_k: int | None) -> None:
+        """
+        Keep only the checks with the highest usages of every check family.
+
+        The checks of the families are replaced by :class:`TopKChecks` and the :attr:`summaries`
+        by :class:`TopKSummaries`, so the checks and the summaries of combinations outside the
+        `top_k` highest usages are dropped as soon as they are performed or merged.
+
+        :param top_k: Number of kept checks per check family, all checks are kept if None.
+        """
+        self.top_k = top_k
+        self.summaries = (
+            dict(self.summaries) if top_k is None else TopKSummaries(top_k, self.summaries)
+        )
+        for family in self.check_families:
+            checks = getattr(self, family)
+            setattr(
+                self,
+                family,
+                dict(checks) if top_k is None else TopKChecks(top_k, checks),
+            )
+
+    def get_check_families(self) -> tuple[str, ...]:
+        """Return the check families performed for the member, all :attr:`check_families` by default."""
+        return self.check_families
 
     @abstractmethod
     def max_usage(self) -> float:
@@ -65,6 +162,342 @@ class Member1DChecks:
             return CheckResult(CheckResult.PASS)
         return CheckResult(CheckResult.FAIL)
 
+    def discard_combinations(self, combinations: Iterable[Any]) -> None:
+        """
+        Remove the checks and the summaries of the combinations of every check family.
+
+        :param combinations: The load case combinations (or envelopes).
+        """
+        for combination in combinations:
+            self.envelope_bounds.pop(combination, None)
+            for family in self.check_families:
+                getattr(self, family).pop(combination, None)
+                self.summaries.pop((family, combination), None)
+
+    def order_by_severity(
+        self,
+        combinations: list[DesignLoadCaseCombination],
+    ) -> list[DesignLoadCaseCombination]:
+        """
+        Order the combinations by a cheap estimate of their severity, the most severe first.
+
+        The severity is the sum of the peak bending moments of the load cases weighted by their
+        factors in the combination. Combinations whose load cases have no results on the member
+        are estimated from their own peak bending moments.
+
+        :param combinations: The load case combinations to order.
+        """
+        results = self.member.results
+        peaks: dict[Any, float] = {}
+
+        def get_peak(case: Any) -> float:
+            if case not in peaks:
+                peaks[case] = sum(
+                    float(np.max(np.abs(moments[case])))
+                    for moments in (results.bending_moments_y, results.bending_moments_z)
+                    if case in moments and moments[case].size
+                )
+            return peaks[case]
+
+        def get_severity(combination: DesignLoadCaseCombination) -> float:
+            load_cases = getattr(combination, "load_cases", None)
+            if load_cases and all(
+                case in results.bending_moments_y for case in load_cases
+            ):
+                return sum(
+                    abs(factor) * get_peak(case) for case, factor in load_cases.items()
+                )
+            return get_peak(combination)
+
+        return sorted(combinations, key=get_severity, reverse=True)
+
+    def screen_uls_checks(
+        self,
+        combinations: list[DesignLoadCaseCombination],
+    ) -> CheckResult:
+        """
+        Perform the ULS checks until any check fails.
+
+        Combinations are evaluated one by one in the order given by :meth:`order_by_severity`.
+
+        :param combinations: The load case combinations to check.
+        :return: FAIL as soon as a usage exceeds 1.0, PASS if all combinations were checked.
+        """
+        for combination in self.order_by_severity(combinations):
+            self.member.perform_uls_checks([combination])
+            for family in self.check_families:
+                check = getattr(self, family).get(combination)
+                if check is not None and check.max_usage > 1.0:
+                    return CheckResult(CheckResult.FAIL)
+        return CheckResult(CheckResult.PASS)
+
+    def save_envelope_bounds(self, envelope: EnvelopeCombination) -> None:
+        """
+        Save bounds of the internal forces of the envelope's cases to :attr:`envelope_bounds`.
+
+        The bounds are not forces of any single case. The first row holds the minimum and the
+        second row the maximum axial forces over all cases, both rows of the other internal
+        forces hold their maximum absolute values, each taken independently at every point.
+        Checks of the bounds are thus conservative for checks increasing with the absolute
+        shear forces and moments, such as the wood checks. The peak values of every case are
+        kept at their own positions, so the envelope usage is never below the usage of any
+        of its cases. The results of the member are left untouched.
+
+        :param envelope: The envelope of load case combinations.
+        """
+        if not envelope.cases:
+            raise ValueError(f"Envelope '{envelope.label}' has no cases.")
+
+        results = self.member.results
+
+        # Shapes (n_cases, n_forces, n_points) and (n_forces, n_peaks of all cases)
+        forces = np.array(
+            [
+                self.get_internal_forces(case, include_peaks=False)
+                for case in envelope.cases
+            ]
+        )
+        peak_x_local = np.concatenate(
+            [np.zeros(0)]
+            + [results.peak_x_local.get(case, np.zeros(0)) for case in envelope.cases]
+        )
+        # Peaks missing for a quantity are zero at the peak positions of the case
+        peak_forces = np.array(
+            [
+                np.concatenate(
+                    [np.zeros(0)]
+                    + [
+                        getattr(results, quantity).get(
+                            case,
+                            np.zeros_like(
+                                results.peak_x_local.get(case, np.zeros(0))
+                            ),
+                        )
+                        for case in envelope.cases
+                    ]
+                )
+                for quantity in PEAK_INTERNAL_FORCES
+            ]
+        )
+
+        bounds = []
+        # Values of shape (n_forces, n_cases, n_points), the peaks of every case are kept
+        # at their own positions
+        for values in (forces.transpose(1, 0, 2), peak_forces[:, np.newaxis, :]):
+            axial = np.array([np.min(values[0], axis=0), np.max(values[0], axis=0)])
+            others = np.max(np.abs(values[1:]), axis=1)
+            bounds.append(
+                np.concatenate((axial[np.newaxis], np.repeat(others[:, np.newaxis], 2, axis=1)))
+            )
+        self.envelope_bounds[envelope] = (bounds[0], peak_x_local, bounds[1])
+
+    def get_positions(
+        self,
+        combination: DesignLoadCaseCombination,
+        include_peaks: bool = True,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Get the positions along the member matching the arrays of :meth:`get_internal_forces`.
+
+        :param combination: The load case combination.
+        :param include_peaks: Whether the positions of the peak values are appended.
+        """
+        x_local = self.member.x_local
+        if not include_peaks:
+            return x_local
+
+        if combination in self.envelope_bounds:
+            peak_x_local = self.envelope_bounds[combination][1]
+        else:
+            peak_x_local = self.member.results.peak_x_local.get(combination, np.zeros(0))
+        return np.concatenate((x_local, peak_x_local))
+
+    def summarize(self) -> list[CheckSummary]:
+        """
+        Summarize the performed design checks.
+
+        The usages of each check are evaluated once, previously merged :attr:`summaries`
+        are returned as well.
+
+        :return: One summary per check family and combination.
+        """
+        summaries = dict(self.summaries)
+        n_points = self.member.x_local.shape[0]
+
+        for family in self.check_families:
+            checks: dict[Any, Check] = getattr(self, family)
+            for combination, check in checks.items():
+                usages = check.usages
+                index = int(np.argmax(usages))
+                positions = self.get_positions(
+                    combination, include_peaks=usages.shape[-1] > n_points
+                )
+                column = index % usages.shape[-1]
+                position = (
+                    float(positions[column])
+                    if positions.shape[0] == usages.shape[-1]
+                    else float("nan")
+                )
+                summaries[(family, combination)] = CheckSummary(
+                    family=family,
+                    combination=combination,
+                    max_usage=float(usages.flat[index]),
+                    position=position,
+                    code=check.code,
+                    paragraph=check.paragraph,
+                )
+
+        return list(summaries.values())
+
+    @instrument()
+    def perform_cached_uls_checks(
+        self,
+        combinations: list[DesignLoadCaseCombination],
+        cache: CheckCache,
+    ) -> None:
+        """
+        Perform the ULS checks, reusing the cached results of checks with identical inputs.
+
+        A combination is only checked if it misses the cache, the summaries of all its
+        check families are then added to the cache as one entry. Cached results are saved
+        to :attr:`summaries`.
+
+        :param combinations: The load case combinations to check.
+        :param cache: The cache of the check results.
+        """
+        member_print = member_fingerprint(self.member)
+        families = self.get_check_families()
+        missed: dict[Any, str] = {}
+        for combination in combinations:
+            key = cache.get_key(
+                member_print, combination_fingerprint(self.member, combination), families
+            )
+            entry = cache.get(key)
+            if entry is None:
+                missed[combination] = key
+                continue
+            for family, fields in entry.items():
+                # Drop the checks of previous runs, which could be out of date
+                getattr(self, family).pop(combination, None)
+                self.summaries[(family, combination)] = CheckSummary(
+                    combination=combination, **fields
+                )
+
+        if not missed:
+            return
+
+        self.member.perform_uls_checks(list(missed))
+        checked: dict[Any, list[CheckSummary]] = {combination: [] for combination in missed}
+        for summary in self.summarize():
+            if summary.combination in checked:
+                checked[summary.combination].append(summary)
+        for combination, summaries in checked.items():
+            cache.put(missed[combination], summaries)
+
+    @instrument()
+    def perform_fused_uls_checks(
+        self,
+        combinations: list[DesignLoadCaseCombination],
+    ) -> None:
+        """
+        Perform the checks of the :attr:`pipeline` for all combinations in a single vectorised pass.
+
+        Only the summaries of the checks are saved, see :attr:`summaries`. Checks without
+        a pipeline are performed one combination at a time by the check methods of the member,
+        and are replaced by their summaries as well.
+
+        :param combinations: The load case combinations (or envelopes) to check.
+        """
+        if self.pipeline is not None:
+            self.pipeline.run(self, combinations)
+            return
+
+        self.member.perform_uls_checks(combinations)
+        checked = set(combinations)
+        for summary in self.summarize():
+            if summary.combination in checked:
+                getattr(self, summary.family).pop(summary.combination, None)
+                self.summaries[(summary.family, summary.combination)] = summary
+
+    @instrument()
+    def get_internal_forces_block(
+        self,
+        combinations: list[DesignLoadCaseCombination],
+        include_peaks: bool = True,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+        """
+        Stack the internal forces of several combinations into a single zero-padded block.
+
+        Every combination contributes one row (two rows for envelopes) to the block.
+
+        :param combinations: The load case combinations.
+        :param include_peaks: Whether the peak values are appended to the rows.
+        :return: Internal forces of shape (6, n_rows, n_points) in the order of :meth:`get_internal_forces`,
+                 the index of the combination of every row and the number of valid points of every row.
+        """
+        rows = []
+        owners: list[int] = []
+        for index, combination in enumerate(combinations):
+            # Envelopes may miss some internal forces, which default to a single row
+            forces = np.array(
+                np.broadcast_arrays(*self.get_internal_forces(combination, include_peaks))
+            )
+            forces = forces.reshape(len(INTERNAL_FORCES), -1, forces.shape[-1])
+            rows.extend(forces.transpose(1, 0, 2))
+            owners.extend([index] * forces.shape[1])
+
+        lengths = np.array([row.shape[-1] for row in rows], dtype=int)
+        block = np.zeros((len(INTERNAL_FORCES), len(rows), lengths.max(initial=0)))
+        for index, row in enumerate(rows):
+            block[:, index, : row.shape[-1]] = row
+        return block, np.array(owners, dtype=int), lengths
+
+    def summarize_usages(
+        self,
+        combinations: list[DesignLoadCaseCombination],
+        usages: dict[str, npt.NDArray[np.float64]],
+        owners: npt.NDArray[np.int_],
+        lengths: npt.NDArray[np.int_],
+        references: dict[str, tuple[str, str]],
+    ) -> None:
+        """
+        Save the summaries of usages evaluated for a block of combinations to :attr:`summaries`.
+
+        :param combinations: The load case combinations of the block.
+        :param usages: Usages of shape (n_rows, n_points) of every check family.
+        :param owners: Index of the combination of every row, see :meth:`get_internal_forces_block`.
+        :param lengths: Number of valid points of every row.
+        :param references: Design code and paragraph of every check family.
+        """
+        n_points = self.member.x_local.shape[0]
+        starts = np.searchsorted(owners, np.arange(len(combinations) + 1))
+
+        for family, family_usages in usages.items():
+            valid = np.arange(family_usages.shape[-1]) < lengths[:, np.newaxis]
+            masked = np.where(valid, family_usages, -np.inf)
+            code, paragraph = references[family]
+
+            for index, combination in enumerate(combinations):
+                block = masked[starts[index] : starts[index + 1]]
+                row, column = np.unravel_index(int(np.argmax(block)), block.shape)
+                length = int(lengths[starts[index]])
+                positions = self.get_positions(
+                    combination, include_peaks=length > n_points
+                )
+                self.summaries[(family, combination)] = CheckSummary(
+                    family=family,
+                    combination=combination,
+                    max_usage=float(block[row, column]),
+                    position=(
+                        float(positions[column])
+                        if positions.shape[0] == length
+                        else float("nan")
+                    ),
+                    code=code,
+                    paragraph=paragraph,
+                )
+
+    @instrument()
     def get_internal_forces(
         self,
         combination: DesignLoadCaseCombination,
@@ -77,7 +510,13 @@ class Member1DChecks:
         npt.NDArray[np.float64],
         npt.NDArray[np.float64],
     ]:
-        """Get the internal forces for a given load case combination."""
+        """Get the internal forces for a given load case combination, or the bounds of an envelope."""
+        if combination in self.envelope_bounds:
+            forces, _, peak_forces = self.envelope_bounds[combination]
+            if include_peaks:
+                forces = np.concatenate((forces, peak_forces), axis=-1)
+            return tuple(forces)  # type: ignore[return-value]
+
         # Determine the default array sizes from the member dimensions
         default_length = self.member.x_local.shape[0]
 
@@ -133,13 +572,13 @@ class Member1DChecks:
             combination, np.zeros(default_peak_length)
         )
 
-        # Concatenating the regular and peak forces/moments
-        concatenated_axial = np.concatenate((axial, axial_peaks))
-        concatenated_shear_y = np.concatenate((shear_y, shear_y_peaks))
-        concatenated_shear_z = np.concatenate((shear_z, shear_z_peaks))
-        concatenated_torsion = np.concatenate((torsion, torsion_peaks))
-        concatenated_bending_y = np.concatenate((bending_y, bending_y_peaks))
-        concatenated_bending_z = np.concatenate((bending_z, bending_z_peaks))
+        # Concatenating the regular and peak forces/moments (along the member for envelopes)
+        concatenated_axial = np.concatenate((axial, axial_peaks), axis=-1)
+        concatenated_shear_y = np.concatenate((shear_y, shear_y_peaks), axis=-1)
+        concatenated_shear_z = np.concatenate((shear_z, shear_z_peaks), axis=-1)
+        concatenated_torsion = np.concatenate((torsion, torsion_peaks), axis=-1)
+        concatenated_bending_y = np.concatenate((bending_y, bending_y_peaks), axis=-1)
+        concatenated_bending_z = np.concatenate((bending_z, bending_z_peaks), axis=-1)
 
         return (
             concatenated_axial,
@@ -149,3 +588,127 @@ class Member1DChecks:
             concatenated_bending_y,
             concatenated_bending_z,
         )
+
+
+# Checks or their summaries, both ranked by their maximum usage
+RankedT = TypeVar("RankedT", Check, CheckSummary)
+
+
+class TopKChecks(MutableMapping[Any, RankedT], Generic[RankedT]):
+    """
+    Checks of one check family keyed by combination, keeping only the `top_k` highest usages.
+
+    A new check is kept only if it belongs to the `top_k` highest maximum usages, replacing
+    the check with the lowest maximum usage, so the storage never exceeds `top_k` checks.
+    Summaries of checks are kept in the same way, see :class:`TopKSummaries`.
+
+    :param top_k: Number of kept checks.
+    :param checks: Initial checks.
+    """
+
+    def __init__(self, top_k: int, checks: Mapping[Any, RankedT] | None = None) -> None:
+        """Init the TopKChecks object."""
+        if top_k < 1:
+            raise ValueError("At least one check must be kept.")
+        self.top_k = top_k
+        self._checks: dict[Any, RankedT] = {}
+        # Min-heap of (max usage, insertion number, combination)
+        self._heap: list[tuple[float, int, Any]] = []
+        self._counter = itertools.count()
+        if checks is not None:
+            self.update(checks)
+
+    def __getitem__(self, combination: Any) -> RankedT:
+        """Return the check of the combination."""
+        return self._checks[combination]
+
+    def __setitem__(self, combination: Any, check: RankedT) -> None:
+        """Keep the check if it belongs to the `top_k` highest usages."""
+        if combination in self._checks:
+            del self[combination]
+
+        item = (check.max_usage, next(self._counter), combination)
+        if len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, item)
+        elif item[0] > self._heap[0][0]:
+            _, _, dropped = heapq.heapreplace(self._heap, item)
+            del self._checks[dropped]
+        else:
+            return
+        self._checks[combination] = check
+
+    def __delitem__(self, combination: Any) -> None:
+        """Remove the check of the combination."""
+        del self._checks[combination]
+        self._heap = [item for item in self._heap if item[2] != combination]
+        heapq.heapify(self._heap)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the combinations of the kept checks."""
+        return iter(self._checks)
+
+    def __len__(self) -> int:
+        """Return the number of kept checks."""
+        return len(self._checks)
+
+    def __repr__(self) -> str:
+        """Return a string representation of TopKChecks object."""
+        return f"{self.__class__.__name__}(top_k={self.top_k}, checks={len(self)})"
+
+
+class TopKSummaries(MutableMapping[tuple[str, Any], CheckSummary]):
+    """
+    Check summaries keyed by check family and combination, keeping only the `top_k` highest usages per family.
+
+    The summaries of every family are kept in a :class:`TopKChecks`, so the storage never
+    exceeds `top_k` summaries per family, whichever path of the checks saved them.
+
+    :param top_k: Number of kept summaries per check family.
+    :param summaries: Initial summaries.
+    """
+
+    def __init__(
+        self, top_k: int, summaries: Mapping[tuple[str, Any], CheckSummary] | None = None
+    ) -> None:
+        """Init the TopKSummaries object."""
+        if top_k < 1:
+            raise ValueError("At least one summary must be kept.")
+        self.top_k = top_k
+        self._families: dict[str, TopKChecks[CheckSummary]] = {}
+        if summaries is not None:
+            self.update(summaries)
+
+    def __getitem__(self, key: tuple[str, Any]) -> CheckSummary:
+        """Return the summary of the check family and combination."""
+        family, combination = key
+        if family not in self._families:
+            raise KeyError(key)
+        return self._families[family][combination]
+
+    def __setitem__(self, key: tuple[str, Any], summary: CheckSummary) -> None:
+        """Keep the summary if it belongs to the `top_k` highest usages of its family."""
+        family, combination = key
+        if family not in self._families:
+            self._families[family] = TopKChecks(self.top_k)
+        self._families[family][combination] = summary
+
+    def __delitem__(self, key: tuple[str, Any]) -> None:
+        """Remove the summary of the check family and combination."""
+        family, combination = key
+        if family not in self._families:
+            raise KeyError(key)
+        del self._families[family][combination]
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over the check families and combinations of the kept summaries."""
+        for family, summaries in self._families.items():
+            for combination in summaries:
+                yield family, combination
+
+    def __len__(self) -> int:
+        """Return the number of kept summaries."""
+        return sum(len(summaries) for summaries in self._families.values())
+
+    def __repr__(self) -> str:
+        """Return a string representation of TopKSummaries object."""
+        return f"{self.__class__.__name__}(top_k={self.top_k}, summaries={len(self)})"
@@ -11,3 +11,43 @@ class CheckResult(CaseInsensitiveStrEnum):
 
     PASS = "pass"
     FAIL = "fail"
+
+
+class ExecutorBackend(CaseInsensitiveStrEnum):
+    """
+    Enum for executors running the design checks of members in parallel.
+
+    :cvar THREAD: Members are checked in threads of the current process.
+    :cvar PROCESS: Members are checked in worker processes, internal forces are shared via shared memory.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class CheckMode(CaseInsensitiveStrEnum):
+    """
+    Enum for the modes of performing the design checks.
+
+    :cvar FULL: Every check is performed for every combination.
+    :cvar SCREEN: Checks of a member stop at the first combination with usage above 1.0,
+                  combinations are evaluated from the most severe one.
+    :cvar ENVELOPE: Wood members are checked once per envelope of the combinations sharing a load
+                    duration class, other members are checked for every combination.
+    """
+
+    FULL = "full"
+    SCREEN = "screen"
+    ENVELOPE = "envelope"
+
+
+class ExportFormat(CaseInsensitiveStrEnum):
+    """
+    Enum for file formats of exported check results.
+
+    :cvar CSV: Comma-separated values with a header row.
+    :cvar JSONL: JSON Lines, one JSON object per row.
+    """
+
+    CSV = "csv"
+    JSONL = "jsonl"
@@ -0,0 +1,183 @@
+"""Streaming export of the results of the design checks."""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+import math
+from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+
+from desssign.common.enums import ExportFormat
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    from framesss.pre.member_1d import Member1D
+
+    from desssign.common.design_check import CheckSummary
+
+# Columns of the exported rows
+EXPORT_COLUMNS = (
+    "member",
+    "combination",
+    "family",
+    "limit_state",
+    "max_usage",
+    "position",
+    "code",
+    "paragraph",
+)
+
+
+def get_json_value(value: Any) -> Any:
+    """
+    Return the value valid in strict JSON, infinite floats as the strings "inf" and "-inf" like in CSV.
+
+    :param value: Value of a row, NaN is written as null.
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return None if math.isnan(value) else str(value)
+    return value
+
+
+class ResultsWriter:
+    """
+    Stream the check summaries of members to a CSV or JSON Lines file.
+
+    Rows are buffered and flushed to the file whenever the buffer holds `buffer_size` rows,
+    so the memory needed does not grow with the size of the model. JSON Lines are strict
+    JSON, see :func:`get_json_value`.
+
+    :param path: Path of the written file.
+    :param file_format: Either 'csv' or 'jsonl', inferred from the suffix of the path if not provided.
+    :param compress: Whether the file is compressed by gzip, inferred from a '.gz' suffix if not provided.
+    :param governing_only: Write only the governing combination of every member and check family.
+    :param buffer_size: Maximum number of buffered rows.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        file_format: str | ExportFormat | None = None,
+        compress: bool | None = None,
+        governing_only: bool = False,
+        buffer_size: int = 1000,
+    ) -> None:
+        """Init the ResultsWriter object."""
+        if buffer_size < 1:
+            raise ValueError("The buffer must hold at least one row.")
+
+        self.path = Path(path)
+        suffixes = [suffix.lower() for suffix in self.path.suffixes]
+        self.compress = suffixes[-1:] == [".gz"] if compress is None else compress
+        if file_format is None:
+            suffix = suffixes[-2] if self.compress and len(suffixes) > 1 else suffixes[-1]
+            file_format = suffix.lstrip(".")
+        self.file_format = ExportFormat(file_format)
+        self.governing_only = governing_only
+        self.buffer_size = buffer_size
+
+        self.rows_written = 0
+        self._buffer: list[dict[str, Any]] = []
+        self._file: IO[str] | None = None
+        self._csv_writer: csv.DictWriter[str] | None = None
+
+    def __enter__(self) -> ResultsWriter:
+        """Open the file."""
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Flush the buffered rows and close the file."""
+        self.close()
+
+    def open(self) -> None:
+        """Open the file, an existing file is overwritten."""
+        if self._file is not None:
+            return
+        if self.compress:
+            self._file = gzip.open(self.path, "wt", encoding="utf-8", newline="")
+        else:
+            self._file = open(self.path, "w", encoding="utf-8", newline="")
+
+        if self.file_format == ExportFormat.CSV:
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=EXPORT_COLUMNS)
+            self._csv_writer.writeheader()
+
+    def close(self) -> None:
+        """Flush the buffered rows and close the file."""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+        self._csv_writer = None
+
+    def write_member(
+        self,
+        member: Member1D,
+        summaries: Iterable[CheckSummary] | None = None,
+    ) -> None:
+        """
+        Write the rows of all performed design checks of the member.
+
+        :param member: The checked member.
+        :param summaries: Summaries of the checks, see :meth:`Member1DChecks.summarize`.
+        """
+        if summaries is None:
+            summaries = member.design_checks.summarize()
+
+        if self.governing_only:
+            governing: dict[str, CheckSummary] = {}
+            for summary in summaries:
+                current = governing.get(summary.family)
+                if current is None or summary.max_usage > current.max_usage:
+                    governing[summary.family] = summary
+            summaries = governing.values()
+
+        for summary in summaries:
+            self._buffer.append(
+                {
+                    "member": member.label,
+                    "combination": summary.combination.label,
+                    "family": summary.family,
+                    "limit_state": str(getattr(summary.combination, "limit_state", "")),
+                    "max_usage": summary.max_usage,
+                    "position": None if math.isnan(summary.position) else summary.position,
+                    "code": summary.code,
+                    "paragraph": summary.paragraph,
+                }
+            )
+            if len(self._buffer) >= self.buffer_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered rows to the file."""
+        if not self._buffer:
+            return
+        if self._file is None:
+            raise ValueError(f"File '{self.path}' is not open.")
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerows(self._buffer)
+        else:
+            self._file.writelines(
+                json.dumps(
+                    {key: get_json_value(value) for key, value in row.items()},
+                    allow_nan=False,
+                )
+                + "\n"
+                for row in self._buffer
+            )
+        self.rows_written += len(self._buffer)
+        self._buffer.clear()
@@ -0,0 +1,117 @@
+"""Content fingerprints of the inputs of the design checks."""
+
+from __future__ import annotations
+
+import enum
+import hashlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+    from framesss.pre.member_1d import Member1D
+
+# Mantissa bits dropped from floats, so values differing only by round-off share the fingerprint
+ROUND_OFF_BITS = 16
+
+
+def fingerprint(*values: Any) -> str:
+    """
+    Return a hex digest of the content of the values.
+
+    Numbers, strings, enums, NumPy arrays, sequences, dictionaries and the attributes of objects
+    are hashed recursively, so two objects with equal attributes share the fingerprint.
+    All attributes are hashed, private ones included, except those a class lists in its
+    `fingerprint_excluded` attribute. Classes list there their caches derived from the other
+    attributes, e.g. values of cached properties, so the fingerprint doesn't depend on what
+    was evaluated already.
+    Floats are hashed with their last :data:`ROUND_OFF_BITS` mantissa bits rounded off,
+    so e.g. internal forces summed in a different order share the fingerprint.
+
+    :param values: The values to fingerprint.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update(digest, value, set())
+    return digest.hexdigest()
+
+
+def _update(digest: Any, value: Any, seen: set[int]) -> None:
+    """Feed the content of the value to the digest."""
+    if isinstance(value, float):
+        digest.update(b"float:" + _round_off(np.array(value)).tobytes())
+    elif value is None or isinstance(value, (bool, int, str, enum.Enum)):
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+    elif isinstance(value, np.ndarray):
+        array = np.ascontiguousarray(value)
+        digest.update(f"ndarray:{array.dtype.str}:{array.shape};".encode())
+        if np.issubdtype(array.dtype, np.floating):
+            array = _round_off(array)
+        digest.update(array.tobytes())
+    elif isinstance(value, np.generic):
+        _update(digest, value.item(), seen)
+    elif id(value) in seen:
+        digest.update(b"cycle;")
+    elif isinstance(value, (list, tuple)):
+        seen.add(id(value))
+        digest.update(f"{type(value).__name__}:{len(value)}[".encode())
+        for item in value:
+            _update(digest, item, seen)
+        digest.update(b"]")
+    elif isinstance(value, dict):
+        seen.add(id(value))
+        digest.update(f"dict:{len(value)}{{".encode())
+        for key, item in sorted(value.items(), key=lambda pair: repr(pair[0])):
+            _update(digest, key, seen)
+            _update(digest, item, seen)
+        digest.update(b"}")
+    elif hasattr(value, "__dict__"):
+        seen.add(id(value))
+        digest.update(f"{type(value).__qualname__}(".encode())
+        excluded = getattr(type(value), "fingerprint_excluded", ())
+        attributes = {
+            name: attribute for name, attribute in vars(value).items() if name not in excluded
+        }
+        _update(digest, attributes, seen)
+        digest.update(b")")
+    else:
+        digest.update(f"{type(value).__qualname__}:{value!r};".encode())
+
+
+def _round_off(array: npt.NDArray[np.floating[Any]]) -> npt.NDArray[np.int64]:
+    """Return the float64 bit patterns of the values rounded to the nearest multiple of the dropped bits."""
+    # Adding 0.0 turns negative zeros into positive ones
+    bits = (np.asarray(array, dtype=np.float64) + 0.0).view(np.int64)
+    half = 1 << (ROUND_OFF_BITS - 1)
+    return (bits + half) >> ROUND_OFF_BITS
+
+
+def member_fingerprint(member: Member1D) -> str:
+    """
+    Return the fingerprint of the inputs of the design checks of the member besides its results.
+
+    It covers the attributes in :attr:`Member1DChecks.member_attributes`, the length of the member
+    and the sections of its elements.
+
+    :param member: The member.
+    """
+    return fingerprint(
+        [getattr(member, name) for name in member.design_checks.member_attributes],
+        member.length,
+        [element.section for element in member.generated_elements],
+    )
+
+
+def combination_fingerprint(member: Member1D, combination: Any) -> str:
+    """
+    Return the fingerprint of the internal forces and the load duration class of a combination on the member.
+
+    :param member: The member.
+    :param combination: The load case combination.
+    """
+    return fingerprint(
+        member.design_checks.get_internal_forces(combination),
+        getattr(combination, "load_duration_code", None),
+    )
@@ -0,0 +1,153 @@
+"""Index of the governing load case combinations of the design checks."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from framesss.pre.member_1d import Member1D
+
+    from desssign.common.design_check import CheckSummary
+
+
+class GoverningEntry(NamedTuple):
+    """
+    Governing combination of one check family of one member.
+
+    :param max_usage: Maximum usage along the member.
+    :param member: The checked member.
+    :param family: Name of the check family.
+    :param combination: The load case combination (or envelope).
+    :param position: Position of the maximum usage along the local x-axis of the member.
+    :param code: Design code of the check.
+    :param paragraph: Paragraph of the design code.
+    """
+
+    max_usage: float
+    member: Member1D
+    family: str
+    combination: Any
+    position: float
+    code: str
+    paragraph: str
+
+
+class GoverningIndex:
+    """
+    Index of the top-k governing combinations for every member and check family.
+
+    Each (member, family) pair holds a bounded min-heap, so a combination is only kept
+    while it belongs to the `top_k` highest usages of the pair. The families of every
+    member are indexed as well, so the entries of a member are found without a scan.
+
+    :param top_k: Number of governing combinations kept per member and check family.
+    """
+
+    def __init__(self, top_k: int = 5) -> None:
+        """Init the GoverningIndex object."""
+        if top_k < 1:
+            raise ValueError("At least one governing combination must be kept.")
+        self.top_k = top_k
+        self._heaps: dict[
+            tuple[Member1D, str], list[tuple[float, int, GoverningEntry]]
+        ] = {}
+        self._families: dict[Member1D, set[str]] = {}
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        """Return the number of indexed entries."""
+        return sum(len(heap) for heap in self._heaps.values())
+
+    def push(self, member: Member1D, summary: CheckSummary) -> None:
+        """
+        Offer a check summary to the index.
+
+        :param member: The checked member.
+        :param summary: Summary of the check for one combination.
+        """
+        entry = GoverningEntry(member=member, **summary._asdict())
+        heap = self._heaps.setdefault((member, summary.family), [])
+        self._families.setdefault(member, set()).add(summary.family)
+        # The counter breaks ties, so that the entries themselves are never compared
+        item = (entry.max_usage, next(self._counter), entry)
+        if len(heap) < self.top_k:
+            heapq.heappush(heap, item)
+        elif item[0] > heap[0][0]:
+            heapq.heapreplace(heap, item)
+
+    def add_member(
+        self,
+        member: Member1D,
+        summaries: Iterable[CheckSummary] | None = None,
+    ) -> None:
+        """
+        Index (or re-index) all performed design checks of the member.
+
+        :param member: The checked member.
+        :param summaries: Summaries of the checks, see :meth:`Member1DChecks.summarize`.
+        """
+        if summaries is None:
+            summaries = member.design_checks.summarize()
+
+        self.discard_member(member)
+        for summary in summaries:
+            self.push(member, summary)
+
+    def discard_member(self, member: Member1D) -> None:
+        """
+        Remove all entries of the member.
+
+        :param member: The member to remove.
+        """
+        for family in self._families.pop(member, ()):
+            del self._heaps[(member, family)]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._heaps.clear()
+        self._families.clear()
+
+    def get_member_entries(
+        self, member: Member1D, family: str | None = None
+    ) -> list[GoverningEntry]:
+        """
+        Return the governing entries of one member, sorted by decreasing usage.
+
+        :param member: The checked member.
+        :param family: Only return entries of this check family.
+        """
+        families = self._families.get(member, set())
+        if family is not None:
+            families = families & {family}
+        return sorted(
+            (item[2] for heap_family in families for item in self._heaps[(member, heap_family)]),
+            key=lambda entry: entry.max_usage,
+            reverse=True,
+        )
+
+    def governing(
+        self,
+        limit: int | None = None,
+        family: str | None = None,
+    ) -> list[GoverningEntry]:
+        """
+        Return the governing entries of the whole model, sorted by decreasing usage.
+
+        :param limit: Maximum number of returned entries, all entries are returned if not provided.
+        :param family: Only return entries of this check family.
+        """
+        items = (
+            item
+            for (_, heap_family), heap in self._heaps.items()
+            if family in (None, heap_family)
+            for item in heap
+        )
+        if limit is None:
+            return [item[2] for item in sorted(items, reverse=True)]
+        return [item[2] for item in heapq.nlargest(limit, items)]
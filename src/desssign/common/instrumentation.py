@@ -0,0 +1,243 @@
+"""Counters and timers of the hot paths of the design pipeline."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import json
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+from typing import Protocol
+from typing import TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class Sink(Protocol):
+    """Receiver of the reports of :class:`Instrumentation`."""
+
+    def write(self, report: dict[str, Any]) -> None:
+        """Receive a report, see :meth:`Instrumentation.get_report`."""
+
+
+class MemorySink:
+    """Keep the reports in memory."""
+
+    def __init__(self) -> None:
+        """Init the MemorySink object."""
+        self.reports: list[dict[str, Any]] = []
+
+    @property
+    def report(self) -> dict[str, Any] | None:
+        """The last received report."""
+        return self.reports[-1] if self.reports else None
+
+    def write(self, report: dict[str, Any]) -> None:
+        """Keep the report."""
+        self.reports.append(report)
+
+
+class JsonSink:
+    """
+    Write the reports to a JSON file, a later report overwrites the file.
+
+    :param path: Path of the JSON file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Init the JsonSink object."""
+        self.path = Path(path)
+
+    def write(self, report: dict[str, Any]) -> None:
+        """Write the report to the file."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+class CallbackSink:
+    """
+    Pass the reports to a function.
+
+    :param callback: Function called with every report.
+    """
+
+    def __init__(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """Init the CallbackSink object."""
+        self.callback = callback
+
+    def write(self, report: dict[str, Any]) -> None:
+        """Pass the report to the function."""
+        self.callback(report)
+
+
+class Instrumentation:
+    """
+    Counters and wall/CPU timers of the design pipeline.
+
+    Instrumented functions check :attr:`enabled` only, so the instrumentation costs a single
+    attribute lookup per call while it is disabled. Timings are accumulated per name and sent
+    to the sinks by :meth:`flush`. Functions running in worker processes are not recorded.
+    Functions running in worker threads are recorded, the CPU times are those of the calling
+    thread, so calls overlapping in threads don't count each other's CPU time.
+
+    :ivar enabled: Whether the counters and timers record.
+    :ivar sinks: Receivers of the reports.
+    """
+
+    def __init__(self) -> None:
+        """Init the Instrumentation object."""
+        self.enabled = False
+        self.sinks: list[Sink] = []
+        self.counters: dict[str, int] = {}
+        # name -> [calls, wall time, CPU time]
+        self.timers: dict[str, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def enable(self, *sinks: Sink) -> None:
+        """
+        Start recording.
+
+        :param sinks: Receivers of the reports, added to :attr:`sinks`.
+        """
+        self.sinks.extend(sinks)
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording, the recorded values are kept."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Remove the recorded values."""
+        with self._lock:
+            self.counters.clear()
+            self.timers.clear()
+
+    def count(self, name: str, value: int = 1) -> None:
+        """
+        Increase a counter.
+
+        :param name: Name of the counter.
+        :param value: Increment of the counter.
+        """
+        if self.enabled:
+            with self._lock:
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_time(self, name: str, wall: float, cpu: float) -> None:
+        """
+        Add a timed call.
+
+        :param name: Name of the timer.
+        :param wall: Wall time of the call in seconds.
+        :param cpu: CPU time of the call in seconds.
+        """
+        with self._lock:
+            timer = self.timers.get(name)
+            if timer is None:
+                self.timers[name] = [1, wall, cpu]
+            else:
+                timer[0] += 1
+                timer[1] += wall
+                timer[2] += cpu
+
+    @contextlib.contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """
+        Time a block of code, e.g. solving the model.
+
+        :param name: Name of the timer.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            self.add_time(
+                name, time.perf_counter() - wall, time.thread_time() - cpu
+            )
+
+    def instrument(self, name: str | None = None) -> Callable[[F], F]:
+        """
+        Return a decorator timing every call of a function.
+
+        :param name: Name of the timer, the qualified name of the function if not provided.
+        """
+
+        def decorator(function: F) -> F:
+            timer_name = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return function(*args, **kwargs)
+
+                wall, cpu = time.perf_counter(), time.thread_time()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.add_time(
+                        timer_name,
+                        time.perf_counter() - wall,
+                        time.thread_time() - cpu,
+                    )
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    def get_report(self) -> dict[str, Any]:
+        """Return the recorded counters and timers, the timers sorted by decreasing wall time."""
+        with self._lock:
+            counters = dict(self.counters)
+            timers = sorted(
+                ((name, list(timer)) for name, timer in self.timers.items()),
+                key=lambda item: item[1][1],
+                reverse=True,
+            )
+        return {
+            "counters": counters,
+            "timers": {
+                name: {"calls": int(calls), "wall": wall, "cpu": cpu}
+                for name, (calls, wall, cpu) in timers
+            },
+        }
+
+    def flush(self) -> dict[str, Any]:
+        """Send the report to the sinks and return it."""
+        report = self.get_report()
+        for sink in self.sinks:
+            sink.write(report)
+        return report
+
+    @contextlib.contextmanager
+    def session(self, *sinks: Sink) -> Iterator[Instrumentation]:
+        """
+        Record a block of code, the report is sent to the sinks at its end.
+
+        :param sinks: Receivers of the report of the session.
+        """
+        previous_sinks, previous_enabled = self.sinks, self.enabled
+        self.sinks = list(sinks)
+        self.reset()
+        self.enabled = True
+        try:
+            yield self
+        finally:
+            self.enabled = previous_enabled
+            self.flush()
+            self.sinks = previous_sinks
+
+
+# Instrumentation shared by the whole package, disabled by default
+instrumentation = Instrumentation()
+instrument = instrumentation.instrument
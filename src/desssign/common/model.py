@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import weakref
 from typing import TYPE_CHECKING
+from typing import Any
 
 from framesss.enums import BeamConnection
 from framesss.enums import Element1DType
@@ -9,6 +11,20 @@ from framesss.fea.analysis.frame_xz_analysis import FrameXZAnalysis
 from framesss.fea.models.model import Model
 from framesss.pre.cases import EnvelopeCombination
 
+from desssign.common.design_check import INTERNAL_FORCES
+from desssign.common.design_check import PEAK_INTERNAL_FORCES
+from desssign.common.enums import CheckMode
+from desssign.common.enums import CheckResult
+from desssign.common.enums import ExecutorBackend
+from desssign.common.export import ResultsWriter
+from desssign.common.fingerprint import combination_fingerprint
+from desssign.common.fingerprint import member_fingerprint
+from desssign.common.governing import GoverningIndex
+from desssign.common.instrumentation import instrument
+from desssign.common.instrumentation import instrumentation
+from desssign.common.parallel import perform_uls_checks_in_parallel
+from desssign.common.result_store import MemmapResultStore
+from desssign.common.results_table import ResultsTable
 from desssign.loads.enums import LimitState
 from desssign.loads.enums import LoadDurationClass
 from desssign.loads.enums import LoadType
@@ -19,13 +35,19 @@ from desssign.loads.enums import VariableCategory
 from desssign.loads.load_case import DesignLoadCase
 from desssign.loads.load_case_combination import DesignNonlinearLoadCaseCombination
 from desssign.loads.load_case_combination import DesignLoadCaseCombination
+from desssign.loads.load_case_combination import group_by_load_duration_class
 
 from desssign.wood.wood_member import WoodMember1D
 from desssign.concrete.concrete_member import ConcreteMember1D
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from framesss.fea.node import Node
 
+    from desssign.common.check_cache import CheckCache
+    from desssign.common.governing import GoverningEntry
+    from desssign.loads.load_case_combination import DesignEnvelopeCombination
     from desssign.wood.wood_section import WoodRectangularSection
     from desssign.concrete.concrete_section import ConcreteSection
 
@@ -35,6 +57,18 @@ class DesignModel(Model):
     Class represent the entire structural analysis model.
 
     Upon :class:`framesss.fea.models.Model` class, it changes
+
+    :ivar governing_index: Index of the governing combinations of the performed design checks.
+    :ivar results_table: Columnar table of the summaries of the performed design checks.
+    :ivar check_retention: Number of checks with the highest usages kept per member and check family,
+                           see :meth:`set_check_retention`.
+    :ivar check_fingerprints: Fingerprints of the member and of every checked combination
+                              of the last incremental check run, see :meth:`get_stale_combinations`.
+    :ivar force_fingerprints: Fingerprints of the internal forces of every member and combination
+                              with the result arrays they were hashed from,
+                              see :meth:`get_combination_fingerprint`.
+    :ivar load_duration_envelopes: Envelopes per load duration class of the last envelope check run,
+                                   their checks are discarded by the next run.
     """
 
     load_combinations: set[DesignLoadCaseCombination]
@@ -44,6 +78,16 @@ class DesignModel(Model):
     def __init__(self, analysis: Analysis) -> None:
         """Init the DesignModel object."""
         super().__init__(analysis)
+        self.governing_index = GoverningIndex()
+        self.results_table = ResultsTable()
+        self.check_retention: int | None = None
+        self.check_fingerprints: dict[
+            WoodMember1D | ConcreteMember1D, tuple[str, dict[Any, str]]
+        ] = {}
+        self.force_fingerprints: dict[
+            WoodMember1D | ConcreteMember1D, dict[Any, tuple[tuple[Any, ...], str]]
+        ] = {}
+        self.load_duration_envelopes: list[DesignEnvelopeCombination] = []
 
     def add_wood_member(
         self,
@@ -76,6 +120,8 @@ class DesignModel(Model):
             aux,
             self.analysis,
         )
+        if self.check_retention is not None:
+            new_member.design_checks.set_retention(self.check_retention)
         self.members.add(new_member)
         return new_member
 
@@ -110,6 +156,8 @@ class DesignModel(Model):
             aux,
             self.analysis,
         )
+        if self.check_retention is not None:
+            new_member.design_checks.set_retention(self.check_retention)
         self.members.add(new_member)
         return new_member
 
@@ -223,19 +271,360 @@ class DesignModel(Model):
             self.load_combinations.add(new_combination)
         return new_combination
 
-    def perform_uls_checks(self, envelope: EnvelopeCombination | None = None) -> None:
-        """Perform ULS checks on the model members."""
+    @instrument("DesignModel.perform_uls_checks")
+    def perform_uls_checks(
+        self,
+        envelope: EnvelopeCombination | None = None,
+        workers: int | None = None,
+        backend: str | ExecutorBackend = ExecutorBackend.PROCESS,
+        mode: str | CheckMode = CheckMode.FULL,
+        stop_at_first_failure: bool = False,
+        writer: ResultsWriter | None = None,
+        incremental: bool = False,
+        cache: CheckCache | None = None,
+    ) -> dict[WoodMember1D | ConcreteMember1D, CheckResult] | None:
+        """
+        Perform ULS checks on the model members.
+
+        :param envelope: Envelope to check the members for, all ULS combinations are checked if not provided.
+        :param workers: Number of workers checking the members concurrently, members are checked
+                        serially if not provided.
+        :param backend: Either 'thread' or 'process'. Worker processes merge back only
+                        the summaries of the checks, see :attr:`Member1DChecks.summaries`.
+        :param mode: Either 'full', 'screen' or 'envelope'. In screening mode the checks of a member
+                     stop at the first combination exceeding a usage of 1.0. In envelope mode wood
+                     members are checked once per load duration class for a conservative envelope
+                     of its combinations.
+        :param stop_at_first_failure: Stop screening the model at the first failing member.
+        :param writer: Writer streaming the check summaries of every member as soon as the member
+                       is checked. It is opened if needed and flushed, but left open.
+        :param incremental: Re-check only the members and combinations whose inputs changed since
+                            the last incremental run, see :meth:`get_stale_combinations`.
+                            The other checks are kept. Only the serial full mode is incremental.
+        :param cache: Persistent cache of check results reused across runs and models,
+                      only used by the serial full mode.
+        :return: Pass/fail result of every screened member in screening mode, None otherwise.
+        """
+        mode = CheckMode(mode)
+        if writer is not None:
+            writer.open()
+
+        if incremental and (
+            mode != CheckMode.FULL
+            or envelope is not None
+            or (workers is not None and workers > 1)
+        ):
+            raise ValueError(
+                "Incremental checks are performed serially in full mode for all ULS "
+                "combinations, 'envelope', 'workers' and 'mode' can't be used."
+            )
+
+        if cache is not None and (
+            mode != CheckMode.FULL or (workers is not None and workers > 1)
+        ):
+            raise ValueError(
+                "Cached checks are performed serially in full mode, "
+                "'workers' and 'mode' can't be used."
+            )
+
+        try:
+            if incremental:
+                self._incremental_uls_checks(writer, cache)
+                return None
+            return self._perform_uls_checks(
+                envelope, workers, backend, mode, stop_at_first_failure, writer, cache
+            )
+        finally:
+            if writer is not None:
+                writer.flush()
+
+    def _perform_uls_checks(
+        self,
+        envelope: EnvelopeCombination | None,
+        workers: int | None,
+        backend: str | ExecutorBackend,
+        mode: CheckMode,
+        stop_at_first_failure: bool,
+        writer: ResultsWriter | None,
+        cache: CheckCache | None,
+    ) -> dict[WoodMember1D | ConcreteMember1D, CheckResult] | None:
+        """Perform ULS checks on the model members, see :meth:`perform_uls_checks`."""
         if envelope:
             combinations = envelope
         else:
-            combinations = [
-                comb
-                for comb in self.load_combinations.union(self.nonlinear_load_combinations)
-                if comb.limit_state == LimitState.ULS
-            ]
+            combinations = self.get_uls_combinations()
+
+        if mode == CheckMode.SCREEN:
+            if workers is not None and workers > 1:
+                raise ValueError(
+                    "Screening mode is performed serially, 'workers' can't be used."
+                )
+            return self._screen_uls_checks(
+                combinations, stop_at_first_failure, writer
+            )
+
+        if mode == CheckMode.ENVELOPE:
+            if envelope is not None or (workers is not None and workers > 1):
+                raise ValueError(
+                    "Envelope mode is performed serially for all ULS combinations, "
+                    "'envelope' and 'workers' can't be used."
+                )
+            self._envelope_uls_checks(combinations, writer)
+            return None
+
+        if workers is not None and workers > 1:
+            perform_uls_checks_in_parallel(
+                self.members,
+                combinations,
+                workers,
+                backend,
+                callback=lambda member: self._index_member(member, writer),
+            )
+            return None
 
         for member in self.members:
+            self._check_member(member, combinations, cache)
+            self._index_member(member, writer)
+        return None
+
+    def get_uls_combinations(
+        self,
+    ) -> list[DesignLoadCaseCombination | DesignNonlinearLoadCaseCombination]:
+        """Return all ULS load case combinations of the model."""
+        return [
+            comb
+            for comb in self.load_combinations.union(self.nonlinear_load_combinations)
+            if comb.limit_state == LimitState.ULS
+        ]
+
+    def get_stale_combinations(
+        self,
+        combinations: list[DesignLoadCaseCombination | DesignNonlinearLoadCaseCombination],
+    ) -> dict[WoodMember1D | ConcreteMember1D, tuple[str, dict[Any, str]]]:
+        """
+        Return the fingerprints of the members whose checks are out of date for some combinations.
+
+        All combinations of a member are stale if the section, material, length or other inputs
+        of its checks changed, see :func:`member_fingerprint`. Otherwise only the combinations
+        whose internal forces or load duration class changed (or which were never checked) are stale,
+        see :meth:`get_combination_fingerprint`. Members marked by :meth:`mark_dirty` are stale
+        for all combinations.
+
+        :param combinations: The load case combinations.
+        :return: The new member fingerprint and the new fingerprints of the stale combinations
+                 of every member with stale combinations.
+        """
+        stale = {}
+        for member in self.members:
+            fingerprint = member_fingerprint(member)
+            previous, checked = self.check_fingerprints.get(member, (None, {}))
+            if fingerprint != previous:
+                checked = {}
+
+            changed = {}
+            for combination in combinations:
+                combination_print = self.get_combination_fingerprint(member, combination)
+                if checked.get(combination) != combination_print:
+                    changed[combination] = combination_print
+
+            if changed or fingerprint != previous:
+                stale[member] = (fingerprint, changed)
+        return stale
+
+    def get_combination_fingerprint(
+        self,
+        member: WoodMember1D | ConcreteMember1D,
+        combination: DesignLoadCaseCombination | DesignNonlinearLoadCaseCombination,
+    ) -> str:
+        """
+        Return the fingerprint of the internal forces and the load duration class of a combination on the member.
+
+        The forces are only hashed again if any of their result arrays was replaced since they
+        were hashed last, e.g. by a new analysis, see :func:`combination_fingerprint`. Result
+        arrays modified in place aren't detected, the member must be marked by :meth:`mark_dirty`.
+
+        :param member: The member.
+        :param combination: The load case combination.
+        """
+        arrays = tuple(
+            getattr(member.results, quantity).get(combination)
+            for quantity in INTERNAL_FORCES + PEAK_INTERNAL_FORCES
+        )
+        sources = (getattr(combination, "load_duration_code", None), *arrays)
+        fingerprints = self.force_fingerprints.setdefault(member, {})
+        previous = fingerprints.get(combination)
+        if previous is not None:
+            references, combination_print = previous
+            if references[0] == sources[0] and all(
+                (reference if reference is None else reference()) is array
+                for reference, array in zip(references[1:], arrays)
+            ):
+                return combination_print
+
+        combination_print = combination_fingerprint(member, combination)
+        references = (
+            sources[0],
+            *(None if array is None else weakref.ref(array) for array in arrays),
+        )
+        fingerprints[combination] = (references, combination_print)
+        return combination_print
+
+    def mark_dirty(self, *members: WoodMember1D | ConcreteMember1D) -> None:
+        """
+        Force the next incremental check run to re-check all combinations of the members.
+
+        :param members: The members, all members if none are given.
+        """
+        for member in members or list(self.check_fingerprints):
+            self.check_fingerprints.pop(member, None)
+            self.force_fingerprints.pop(member, None)
+
+    def _check_member(
+        self,
+        member: WoodMember1D | ConcreteMember1D,
+        combinations: list[DesignLoadCaseCombination] | EnvelopeCombination,
+        cache: CheckCache | None,
+    ) -> None:
+        """Perform the ULS checks of the member, through the cache if provided."""
+        if cache is None:
             member.perform_uls_checks(combinations)
+        elif isinstance(combinations, EnvelopeCombination):
+            member.design_checks.perform_cached_uls_checks([combinations], cache)
+        else:
+            member.design_checks.perform_cached_uls_checks(combinations, cache)
+
+    def _incremental_uls_checks(
+        self,
+        writer: ResultsWriter | None,
+        cache: CheckCache | None,
+    ) -> None:
+        """
+        Re-check the stale combinations of the members, see :meth:`get_stale_combinations`.
+
+        The checks of combinations removed from the model since the last run are dropped.
+        """
+        combinations = self.get_uls_combinations()
+        stale = self.get_stale_combinations(combinations)
+        current = set(combinations)
+        for member in self.members:
+            previous, checked = self.check_fingerprints.get(member, (None, {}))
+            removed = checked.keys() - current
+            if member not in stale and not removed:
+                continue
+
+            if removed:
+                member.design_checks.discard_combinations(removed)
+                for combination in removed:
+                    self.force_fingerprints.get(member, {}).pop(combination, None)
+            fingerprint, changed = stale.get(member, (previous, {}))
+            checked = (
+                {}
+                if fingerprint != previous
+                else {
+                    combination: combination_print
+                    for combination, combination_print in checked.items()
+                    if combination not in removed
+                }
+            )
+            if changed:
+                self._check_member(member, list(changed), cache)
+            checked.update(changed)
+            self.check_fingerprints[member] = (fingerprint, checked)
+            self._index_member(member, writer)
+
+    def _envelope_uls_checks(
+        self,
+        combinations: list[DesignLoadCaseCombination | DesignNonlinearLoadCaseCombination],
+        writer: ResultsWriter | None,
+    ) -> None:
+        """Check wood members for envelopes per load duration class, other members for every combination."""
+        envelopes = group_by_load_duration_class(combinations)
+        for member in self.members:
+            # The envelopes are rebuilt every run, so the checks of the previous ones would be kept
+            member.design_checks.discard_combinations(self.load_duration_envelopes)
+            if isinstance(member, WoodMember1D):
+                member.perform_envelope_uls_checks(envelopes)
+            else:
+                member.perform_uls_checks(combinations)
+            self._index_member(member, writer)
+        self.load_duration_envelopes = envelopes
+
+    def _screen_uls_checks(
+        self,
+        combinations: list[DesignLoadCaseCombination] | EnvelopeCombination,
+        stop_at_first_failure: bool,
+        writer: ResultsWriter | None,
+    ) -> dict[WoodMember1D | ConcreteMember1D, CheckResult]:
+        """Screen the members and return their pass/fail results."""
+        results = {}
+        for member in self.members:
+            if isinstance(combinations, EnvelopeCombination):
+                member.perform_uls_checks(combinations)
+                results[member] = member.design_checks.result
+            else:
+                results[member] = member.design_checks.screen_uls_checks(combinations)
+            self._index_member(member, writer)
+
+            if stop_at_first_failure and results[member] == CheckResult.FAIL:
+                break
+        return results
+
+    def _index_member(
+        self,
+        member: WoodMember1D | ConcreteMember1D,
+        writer: ResultsWriter | None = None,
+    ) -> None:
+        """Add the performed design checks of the member to the governing index, the results table and the writer."""
+        instrumentation.count("checked_members")
+        summaries = member.design_checks.summarize()
+        self.governing_index.add_member(member, summaries)
+        self.results_table.add_member(member, summaries)
+        if writer is not None:
+            writer.write_member(member, summaries)
+
+    def set_check_retention(self, top_k: int | None) -> None:
+        """
+        Keep only the checks with the highest usages per member and check family.
+
+        Only the kept checks are summarized, so :attr:`governing_index` and :attr:`results_table`
+        hold the kept combinations only, see :meth:`Member1DChecks.set_retention`.
+
+        :param top_k: Number of kept checks, all checks are kept if None.
+        """
+        self.check_retention = top_k
+        for member in self.members:
+            member.design_checks.set_retention(top_k)
+
+    def offload_results(self, directory: str | Path) -> MemmapResultStore:
+        """
+        Move the results of all members to memory-mapped files, so only the arrays read by the checks stay resident.
+
+        The arrays of the checks performed so far are moved as well. Offload the members again
+        with :meth:`MemmapResultStore.offload_members` of the returned store to move the arrays
+        of later checks.
+
+        :param directory: Directory of the files.
+        :return: The store of the files, see :meth:`MemmapResultStore.load` to move results back to memory.
+        """
+        store = MemmapResultStore(directory)
+        store.offload_members(self.members)
+        return store
+
+    def governing(
+        self,
+        limit: int | None = 50,
+        family: str | None = None,
+    ) -> list[GoverningEntry]:
+        """
+        Return the governing combinations of the performed design checks, sorted by decreasing usage.
+
+        The entries are taken from :attr:`governing_index`, which keeps the top-k combinations
+        of every member and check family.
+
+        :param limit: Maximum number of returned entries, all entries are returned if None.
+        :param family: Only return entries of this check family (e.g. 'shear_check').
+        """
+        return self.governing_index.governing(limit=limit, family=family)
 
 
 class DesignModelFrameXZ(DesignModel):
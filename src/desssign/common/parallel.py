@@ -0,0 +1,321 @@
+"""Parallel execution of the design checks of members."""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from concurrent.futures import wait
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+from framesss.pre.cases import EnvelopeCombination
+
+from desssign.common.design_check import CheckSummary
+from desssign.common.enums import ExecutorBackend
+from desssign.loads.enums import LOAD_DURATION_MAPPING
+from desssign.loads.enums import LoadDurationClass
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from concurrent.futures import Future
+
+    from framesss.pre.member_1d import Member1D
+
+    from desssign.common.design_check import Member1DChecks
+    from desssign.loads.load_case_combination import DesignLoadCaseCombination
+
+# Arrays of `Member1DResults` shipped to the worker processes
+RESULT_QUANTITIES = (
+    "axial_forces",
+    "shear_forces_y",
+    "shear_forces_z",
+    "torsional_moments",
+    "bending_moments_y",
+    "bending_moments_z",
+    "peak_x_local",
+    "peak_axial_forces",
+    "peak_shear_forces_y",
+    "peak_shear_forces_z",
+    "peak_torsional_moments",
+    "peak_bending_moments_y",
+    "peak_bending_moments_z",
+)
+
+
+@dataclass(frozen=True)
+class CombinationProxy:
+    """
+    Picklable stand-in for a load case combination inside a worker process.
+
+    :param label: The label of the load case combination.
+    :param load_duration_code: Integer code of the load duration class of the combination.
+    """
+
+    label: str
+    load_duration_code: int | None
+
+    @property
+    def load_duration_class(self) -> LoadDurationClass:
+        """Return the load duration class of the combination."""
+        for duration_class, value in LOAD_DURATION_MAPPING.items():
+            if value == self.load_duration_code:
+                return LoadDurationClass(duration_class)
+        raise ValueError(
+            f"Can't find the load duration class with value: '{self.load_duration_code}'."
+        )
+
+
+class MemberSnapshot:
+    """
+    Picklable copy of the member data the design checks depend on.
+
+    :param label: The label of the member.
+    :param attributes: Attributes of the member, see :attr:`Member1DChecks.member_attributes`.
+    :param results: Namespace with the result dictionaries of the member.
+    """
+
+    def __init__(
+        self, label: str, attributes: dict[str, Any], results: SimpleNamespace
+    ) -> None:
+        """Init the MemberSnapshot object."""
+        self.label = label
+        self.__dict__.update(attributes)
+        self.results = results
+
+    def __repr__(self) -> str:
+        """Return a string representation of MemberSnapshot object."""
+        return f"{self.__class__.__name__}({self.label})"
+
+
+@dataclass
+class MemberCheckJob:
+    """
+    Design checks of one member to be performed in a worker process.
+
+    :param label: The label of the member.
+    :param checks_class: Class performing the design checks of the member.
+    :param attributes: Attributes of the member, see :attr:`Member1DChecks.member_attributes`.
+    :param shm_name: Name of the shared memory block holding the internal forces.
+    :param size: Number of float64 values in the shared memory block.
+    :param layout: Result quantity, case index, offset and shape of every array in the block.
+    :param combinations: Labels and load duration codes of the combinations.
+    :param envelope_label: Label of the envelope if the checks are performed for an envelope.
+    """
+
+    label: str
+    checks_class: type[Member1DChecks]
+    attributes: dict[str, Any]
+    shm_name: str
+    size: int
+    layout: list[tuple[str, int, int, tuple[int, ...]]]
+    combinations: list[tuple[str, int | None]]
+    envelope_label: str | None = None
+
+
+def perform_uls_checks_in_parallel(
+    members: Iterable[Member1D],
+    combinations: list[DesignLoadCaseCombination] | EnvelopeCombination,
+    workers: int,
+    backend: str | ExecutorBackend = ExecutorBackend.PROCESS,
+    callback: Callable[[Member1D], None] | None = None,
+) -> None:
+    """
+    Perform the ULS checks of members concurrently.
+
+    With the thread backend the members are checked in place. With the process backend only the
+    internal forces and the section data of each member are shipped to the workers (the internal
+    forces through shared memory), and the :class:`CheckSummary` of every check is merged back
+    into :attr:`Member1DChecks.summaries`.
+
+    :param members: The members to check.
+    :param combinations: The load case combinations or an envelope to check the members for.
+    :param workers: Number of worker threads or processes.
+    :param backend: Either 'thread' or 'process'.
+    :param callback: Function called in the current thread with every member whose checks finished.
+    """
+    backend = ExecutorBackend(backend)
+
+    if backend == ExecutorBackend.THREAD:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(member.perform_uls_checks, combinations): member
+                for member in members
+            }
+            for future in as_completed(futures):
+                future.result()
+                if callback is not None:
+                    callback(futures[future])
+        return
+
+    cases: list[Any] = (
+        [combinations]
+        if isinstance(combinations, EnvelopeCombination)
+        else list(combinations)
+    )
+    pending: dict[Future[list[tuple[Any, ...]]], tuple[Member1D, SharedMemory]] = {}
+
+    def collect(future: Future[list[tuple[Any, ...]]]) -> None:
+        member, shm = pending.pop(future)
+        try:
+            rows = future.result()
+        finally:
+            shm.close()
+            shm.unlink()
+
+        for family, case_index, max_usage, position, code, paragraph in rows:
+            combination = cases[case_index]
+            member.design_checks.summaries[(family, combination)] = CheckSummary(
+                family=family,
+                combination=combination,
+                max_usage=max_usage,
+                position=position,
+                code=code,
+                paragraph=paragraph,
+            )
+        if callback is not None:
+            callback(member)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            for member in members:
+                # Bound the number of shared memory blocks alive at once
+                while len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(future)
+
+                job, shm = share_member(member, cases)
+                pending[executor.submit(check_member, job)] = (member, shm)
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future)
+        finally:
+            for _, shm in pending.values():
+                shm.close()
+                shm.unlink()
+
+
+def share_member(
+    member: Member1D,
+    cases: list[Any],
+) -> tuple[MemberCheckJob, SharedMemory]:
+    """
+    Copy the results of a member into shared memory and describe its design checks.
+
+    :param member: The member to check.
+    :param cases: The load case combinations, or a single envelope.
+    :return: The job for :func:`check_member` and the shared memory block, which must be
+             unlinked by the caller.
+    """
+    arrays: list[np.ndarray] = []
+    layout: list[tuple[str, int, int, tuple[int, ...]]] = []
+    size = 0
+    for case_index, case in enumerate(cases):
+        for quantity in RESULT_QUANTITIES:
+            array = getattr(member.results, quantity).get(case)
+            if array is None:
+                continue
+            array = np.asarray(array, dtype=np.float64)
+            layout.append((quantity, case_index, size, array.shape))
+            arrays.append(array)
+            size += array.size
+
+    shm = SharedMemory(create=True, size=max(size, 1) * np.float64().itemsize)
+    buffer: np.ndarray = np.ndarray((size,), dtype=np.float64, buffer=shm.buf)
+    for (_, _, offset, _), array in zip(layout, arrays):
+        buffer[offset : offset + array.size] = array.ravel()
+    del buffer
+
+    checks_class = type(member.design_checks)
+    attributes = {
+        name: getattr(member, name) for name in checks_class.member_attributes
+    }
+    attributes["x_local"] = member.x_local
+    attributes["generated_elements"] = [
+        SimpleNamespace(
+            section=element.section,
+            sampling_points=element.sampling_points,
+            x_start=element.x_start,
+        )
+        for element in member.generated_elements
+    ]
+
+    is_envelope = isinstance(cases[0], EnvelopeCombination) if cases else False
+    job = MemberCheckJob(
+        label=member.label,
+        checks_class=checks_class,
+        attributes=attributes,
+        shm_name=shm.name,
+        size=size,
+        layout=layout,
+        combinations=(
+            []
+            if is_envelope
+            else [
+                (case.label, getattr(case, "load_duration_code", None))
+                for case in cases
+            ]
+        ),
+        envelope_label=cases[0].label if is_envelope else None,
+    )
+    return job, shm
+
+
+def check_member(job: MemberCheckJob) -> list[tuple[Any, ...]]:
+    """
+    Perform the design checks of one member in a worker process.
+
+    :param job: Description of the checks, see :func:`share_member`.
+    :return: Family, combination index, maximum usage, position, code and paragraph of every check.
+    """
+    shm = SharedMemory(name=job.shm_name)
+    try:
+        return _perform_checks(job, shm.buf)
+    finally:
+        shm.close()
+
+
+def _perform_checks(job: MemberCheckJob, buf: memoryview) -> list[tuple[Any, ...]]:
+    """Perform the checks on views of the shared memory block (released on return)."""
+    buffer: np.ndarray = np.ndarray((job.size,), dtype=np.float64, buffer=buf)
+    buffer.flags.writeable = False
+
+    cases: list[Any]
+    if job.envelope_label is not None:
+        cases = [EnvelopeCombination(job.envelope_label, [])]
+    else:
+        cases = [CombinationProxy(label, code) for label, code in job.combinations]
+
+    results = SimpleNamespace(**{quantity: {} for quantity in RESULT_QUANTITIES})
+    for quantity, case_index, offset, shape in job.layout:
+        getattr(results, quantity)[cases[case_index]] = buffer[
+            offset : offset + math.prod(shape)
+        ].reshape(shape)
+
+    checks = job.checks_class(MemberSnapshot(job.label, job.attributes, results))
+    checks.perform_uls_checks(
+        cases[0] if job.envelope_label is not None else cases
+    )
+
+    case_indices = {case: index for index, case in enumerate(cases)}
+    return [
+        (
+            summary.family,
+            case_indices[summary.combination],
+            summary.max_usage,
+            summary.position,
+            summary.code,
+            summary.paragraph,
+        )
+        for summary in checks.summarize()
+    ]
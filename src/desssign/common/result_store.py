@@ -0,0 +1,219 @@
+"""Memory-mapped on-disk store of the results and the check arrays of members."""
+
+from __future__ import annotations
+
+import itertools
+import math
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    import numpy.typing as npt
+    from framesss.pre.member_1d import Member1D
+
+    from desssign.common.design_check import Check
+
+
+class MemmapResultMapping(MutableMapping[Any, "npt.NDArray[np.float64]"]):
+    """
+    Results of one quantity of a member, keyed by load case, read lazily from a memory-mapped file.
+
+    Only the arrays that are read become resident. Arrays assigned later (e.g. envelopes
+    of internal forces) are kept in memory.
+
+    :param array: Memory-mapped flat array holding all results of the member.
+    :param index: Offset and shape of the array of every load case.
+    """
+
+    def __init__(
+        self,
+        array: np.memmap[Any, np.dtype[np.float64]],
+        index: dict[Any, tuple[int, tuple[int, ...]]],
+    ) -> None:
+        """Init the MemmapResultMapping object."""
+        self.array = array
+        self.index = index
+        self._in_memory: dict[Any, npt.NDArray[np.float64]] = {}
+
+    def __getitem__(self, key: Any) -> npt.NDArray[np.float64]:
+        """Return a read-only view of the results of a load case."""
+        if key in self._in_memory:
+            return self._in_memory[key]
+        offset, shape = self.index[key]
+        return self.array[offset : offset + math.prod(shape)].reshape(shape)
+
+    def __setitem__(self, key: Any, value: npt.NDArray[np.float64]) -> None:
+        """Keep the results of a load case in memory."""
+        self.index.pop(key, None)
+        self._in_memory[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        """Remove the results of a load case."""
+        if key in self._in_memory:
+            del self._in_memory[key]
+        else:
+            del self.index[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the load cases."""
+        yield from self.index
+        yield from self._in_memory
+
+    def __len__(self) -> int:
+        """Return the number of load cases."""
+        return len(self.index) + len(self._in_memory)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether the results of a load case are stored."""
+        return key in self._in_memory or key in self.index
+
+    def __repr__(self) -> str:
+        """Return a string representation of MemmapResultMapping object."""
+        return f"{self.__class__.__name__}(cases={len(self)}, in_memory={len(self._in_memory)})"
+
+
+class MemmapResultStore:
+    """
+    Store of the result and check arrays of members in memory-mapped `.npy` files, one file per member.
+
+    After :meth:`offload`, every result dictionary of `member.results` is replaced by
+    a :class:`MemmapResultMapping`, so the design checks read the arrays lazily from disk.
+    The arrays the usages of the performed checks are evaluated from (e.g. stresses along
+    the member) are replaced by read-only views into the same file. Checks performed later
+    keep their arrays in memory until the member is offloaded again.
+
+    :param directory: Directory of the `.npy` files, created if needed.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Init the MemmapResultStore object."""
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.files: dict[Member1D, Path] = {}
+        self._counter = itertools.count()
+
+    def __repr__(self) -> str:
+        """Return a string representation of MemmapResultStore object."""
+        return f"{self.__class__.__name__}({self.directory}, members={len(self.files)})"
+
+    @staticmethod
+    def get_result_dicts(member: Member1D) -> dict[str, MutableMapping[Any, Any]]:
+        """Return the result dictionaries of the member, keyed by the name of the quantity."""
+        return {
+            name: value
+            for name, value in vars(member.results).items()
+            if isinstance(value, MutableMapping)
+        }
+
+    @staticmethod
+    def get_check_arrays(member: Member1D) -> list[tuple[Check, str, npt.NDArray[np.float64]]]:
+        """
+        Return the float arrays held by the performed checks of the member.
+
+        :return: The check, the name of its attribute and the array, for every array of every check.
+        """
+        design_checks = getattr(member, "design_checks", None)
+        if design_checks is None:
+            return []
+        return [
+            (check, name, value)
+            for family in design_checks.check_families
+            for check in getattr(design_checks, family).values()
+            for name, value in vars(check).items()
+            if isinstance(value, np.ndarray) and value.ndim and value.dtype == np.float64
+        ]
+
+    def offload(self, member: Member1D) -> None:
+        """
+        Move the results and the check arrays of the member to a memory-mapped file.
+
+        :param member: The member with results.
+        """
+        result_dicts = self.get_result_dicts(member)
+        layout: list[tuple[str, Any, int, tuple[int, ...]]] = []
+        size = 0
+        for name, results in result_dicts.items():
+            for case, array in results.items():
+                shape = np.shape(array)
+                layout.append((name, case, size, shape))
+                size += math.prod(shape)
+
+        # Arrays shared by several checks are stored once
+        check_arrays = self.get_check_arrays(member)
+        offsets: dict[int, int] = {}
+        for _, _, array in check_arrays:
+            if id(array) not in offsets:
+                offsets[id(array)] = size
+                size += array.size
+
+        path = self.directory / f"{next(self._counter):06d}.npy"
+        array = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.float64, shape=(max(size, 1),)
+        )
+        for name, case, offset, shape in layout:
+            array[offset : offset + math.prod(shape)] = np.ravel(
+                result_dicts[name][case]
+            )
+        for _, _, values in check_arrays:
+            offset = offsets[id(values)]
+            array[offset : offset + values.size] = np.ravel(values)
+        array.flush()
+        del array
+
+        mapped = np.load(path, mmap_mode="r")
+        indices: dict[str, dict[Any, tuple[int, tuple[int, ...]]]] = {
+            name: {} for name in result_dicts
+        }
+        for name, case, offset, shape in layout:
+            indices[name][case] = (offset, shape)
+        for name, index in indices.items():
+            setattr(member.results, name, MemmapResultMapping(mapped, index))
+        views: dict[int, npt.NDArray[np.float64]] = {}
+        for check, name, values in check_arrays:
+            if id(values) not in views:
+                offset = offsets[id(values)]
+                views[id(values)] = mapped[offset : offset + values.size].reshape(values.shape)
+            setattr(check, name, views[id(values)])
+
+        previous = self.files.get(member)
+        self.files[member] = path
+        if previous is not None:
+            previous.unlink(missing_ok=True)
+
+    def offload_members(self, members: Iterable[Member1D]) -> None:
+        """
+        Move the results of the members to memory-mapped files.
+
+        :param members: The members with results.
+        """
+        for member in members:
+            self.offload(member)
+
+    def load(self, member: Member1D) -> None:
+        """
+        Move the results and the check arrays of the member back to memory and remove its file.
+
+        :param member: The member with offloaded results.
+        """
+        for name, results in self.get_result_dicts(member).items():
+            setattr(
+                member.results,
+                name,
+                {case: np.array(array) for case, array in results.items()},
+            )
+        copies: dict[int, npt.NDArray[np.float64]] = {}
+        for check, name, values in self.get_check_arrays(member):
+            if isinstance(values, np.memmap):
+                if id(values) not in copies:
+                    copies[id(values)] = np.array(values)
+                setattr(check, name, copies[id(values)])
+        path = self.files.pop(member, None)
+        if path is not None:
+            path.unlink(missing_ok=True)
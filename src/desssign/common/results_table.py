@@ -0,0 +1,228 @@
+"""Columnar table of the results of the design checks."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import numpy.typing as npt
+    from framesss.pre.member_1d import Member1D
+
+    from desssign.common.design_check import CheckSummary
+
+# Columns of the table, members and combinations are stored as ids, see `ResultsTable.members`
+RESULTS_DTYPE = np.dtype(
+    [
+        ("member", np.int64),
+        ("combination", np.int64),
+        ("family", "U40"),
+        ("limit_state", "U8"),
+        ("max_usage", np.float64),
+        ("position", np.float64),
+        ("code", "U20"),
+        ("paragraph", "U20"),
+    ]
+)
+
+
+class ResultsTable:
+    """
+    Columnar table of the check summaries of all members, one row per member, family and combination.
+
+    The rows are kept in a NumPy structured array, see :data:`RESULTS_DTYPE`. Members and
+    combinations are stored as integer ids into :attr:`members` and :attr:`combinations`.
+    Added and discarded members are pending until the rows are read, so re-checking many
+    members merges the table once with a single mask.
+
+    :param data: Rows of the table.
+    :param members: Members referenced by the ids of the 'member' column.
+    :param combinations: Combinations referenced by the ids of the 'combination' column.
+    """
+
+    def __init__(
+        self,
+        data: npt.NDArray[Any] | None = None,
+        members: list[Member1D] | None = None,
+        combinations: list[Any] | None = None,
+    ) -> None:
+        """Init the ResultsTable object."""
+        self._data = np.zeros(0, dtype=RESULTS_DTYPE) if data is None else data
+        # Rows added per member id and ids of members whose merged rows are discarded
+        self._chunks: dict[int, npt.NDArray[Any]] = {}
+        self._discarded: set[int] = set()
+        self.members: list[Member1D] = [] if members is None else members
+        self.combinations: list[Any] = [] if combinations is None else combinations
+        self._member_ids = {member: i for i, member in enumerate(self.members)}
+        self._combination_ids = {comb: i for i, comb in enumerate(self.combinations)}
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.data)
+
+    def __getitem__(self, column: str) -> npt.NDArray[Any]:
+        """Return a column of the table."""
+        return self.data[column]
+
+    def __repr__(self) -> str:
+        """Return a string representation of ResultsTable object."""
+        return f"{self.__class__.__name__}(rows={len(self)})"
+
+    @property
+    def data(self) -> npt.NDArray[Any]:
+        """Rows of the table as a structured array."""
+        if self._discarded:
+            self._data = self._data[~np.isin(self._data["member"], list(self._discarded))]
+            self._discarded.clear()
+        if self._chunks:
+            self._data = np.concatenate([self._data, *self._chunks.values()])
+            self._chunks.clear()
+        return self._data
+
+    def get_member_id(self, member: Member1D) -> int:
+        """Return the id of the member, registering it if needed."""
+        if member not in self._member_ids:
+            self._member_ids[member] = len(self.members)
+            self.members.append(member)
+        return self._member_ids[member]
+
+    def get_combination_id(self, combination: Any) -> int:
+        """Return the id of the combination, registering it if needed."""
+        if combination not in self._combination_ids:
+            self._combination_ids[combination] = len(self.combinations)
+            self.combinations.append(combination)
+        return self._combination_ids[combination]
+
+    def add_member(
+        self,
+        member: Member1D,
+        summaries: Iterable[CheckSummary] | None = None,
+    ) -> None:
+        """
+        Add (or replace) the rows of all performed design checks of the member.
+
+        :param member: The checked member.
+        :param summaries: Summaries of the checks, see :meth:`Member1DChecks.summarize`.
+        """
+        if summaries is None:
+            summaries = member.design_checks.summarize()
+
+        self.discard_member(member)
+        member_id = self.get_member_id(member)
+        rows = [
+            (
+                member_id,
+                self.get_combination_id(summary.combination),
+                summary.family,
+                str(getattr(summary.combination, "limit_state", "")),
+                summary.max_usage,
+                summary.position,
+                summary.code,
+                summary.paragraph,
+            )
+            for summary in summaries
+        ]
+        self._chunks[member_id] = np.array(rows, dtype=RESULTS_DTYPE)
+
+    def discard_member(self, member: Member1D) -> None:
+        """
+        Remove all rows of the member.
+
+        :param member: The member to remove.
+        """
+        member_id = self._member_ids.get(member)
+        if member_id is not None:
+            self._chunks.pop(member_id, None)
+            self._discarded.add(member_id)
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self._data = np.zeros(0, dtype=RESULTS_DTYPE)
+        self._chunks.clear()
+        self._discarded.clear()
+
+    def _new(self, data: npt.NDArray[Any]) -> ResultsTable:
+        """Return a table of the rows sharing the members and combinations of this table."""
+        table = ResultsTable(data, self.members, self.combinations)
+        table._member_ids = self._member_ids
+        table._combination_ids = self._combination_ids
+        return table
+
+    def filter(
+        self,
+        min_usage: float | None = None,
+        max_usage: float | None = None,
+        family: str | None = None,
+        limit_state: str | None = None,
+        members: Iterable[Member1D] | None = None,
+        combinations: Iterable[Any] | None = None,
+    ) -> ResultsTable:
+        """
+        Return the rows matching all given criteria.
+
+        :param min_usage: Minimum usage (inclusive).
+        :param max_usage: Maximum usage (inclusive).
+        :param family: Name of the check family.
+        :param limit_state: Limit state of the combinations, e.g. 'ULS'.
+        :param members: Members of the rows.
+        :param combinations: Combinations of the rows.
+        """
+        data = self.data
+        mask = np.ones(len(data), dtype=bool)
+        if min_usage is not None:
+            mask &= data["max_usage"] >= min_usage
+        if max_usage is not None:
+            mask &= data["max_usage"] <= max_usage
+        if family is not None:
+            mask &= data["family"] == family
+        if limit_state is not None:
+            mask &= np.char.upper(data["limit_state"]) == str(limit_state).upper()
+        if members is not None:
+            ids = [self._member_ids[m] for m in members if m in self._member_ids]
+            mask &= np.isin(data["member"], ids)
+        if combinations is not None:
+            ids = [self._combination_ids[c] for c in combinations if c in self._combination_ids]
+            mask &= np.isin(data["combination"], ids)
+        return self._new(data[mask])
+
+    def sort(self, by: str = "max_usage", descending: bool = True) -> ResultsTable:
+        """
+        Return the rows sorted by a column.
+
+        :param by: Name of the column.
+        :param descending: Sort from the largest value.
+        """
+        order = np.argsort(self.data[by], kind="stable")
+        if descending:
+            order = order[::-1]
+        return self._new(self.data[order])
+
+    def group_max(self, by: str | tuple[str, ...] = "member") -> ResultsTable:
+        """
+        Return the row of the maximum usage of every group.
+
+        :param by: Name(s) of the column(s) defining the groups, e.g. ('member', 'family').
+        """
+        columns = (by,) if isinstance(by, str) else by
+        data = self.data
+        if not len(data):
+            return self._new(data)
+
+        # Sort by the usage, then by the groups, so the last row of every group governs
+        order = np.argsort(data["max_usage"], kind="stable")
+        order = order[np.lexsort([data[c][order] for c in reversed(columns)])]
+        keys = data[list(columns)][order]
+        last = np.append(keys[1:] != keys[:-1], True)
+        return self._new(data[order[last]])
+
+    def get_members(self) -> list[Member1D]:
+        """Return the members of the rows."""
+        return [self.members[i] for i in self.data["member"]]
+
+    def get_combinations(self) -> list[Any]:
+        """Return the combinations of the rows."""
+        return [self.combinations[i] for i in self.data["combination"]]
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import math
+from functools import cached_property
 from typing import TYPE_CHECKING
 
+import numpy as np
 from framesss.pre.member_1d import Member1D
 
+from desssign.concrete.design_checks.design_check import ShearResistanceWithoutReinforcement
+from desssign.concrete.design_checks.design_check import shear_force_resistance
 from desssign.concrete.design_checks.member_1d_checks import ConcreteMember1DChecks
 
 if TYPE_CHECKING:
-    import numpy as np
     import numpy.typing as npt
     from framesss.enums import BeamConnection
     from framesss.enums import Element1DType
@@ -40,6 +43,10 @@ class ConcreteMember1D(Member1D):
         ConcreteSection  # Explicit type annotation, so that mypy can check the type
     )
 
+    # Attributes the cached resistances along the member depend on
+    RESISTANCE_DEPENDENCIES = frozenset({"section", "sections"})
+    RESISTANCES = ("m_rd_positive", "m_rd_negative", "v_rd", "shear_resistance")
+
     def __init__(
         self,
         label: str,
@@ -68,3 +75,108 @@ class ConcreteMember1D(Member1D):
     ) -> None:
         """Perform the design checks."""
         self.design_checks.perform_uls_checks(load_combinations)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set the attribute and invalidate the cached resistances if they depend on it."""
+        super().__setattr__(name, value)
+        if name in self.RESISTANCE_DEPENDENCIES:
+            self.invalidate_resistances()
+
+    def invalidate_resistances(self) -> None:
+        """
+        Discard the cached resistances along the member.
+
+        Called automatically when the section or the sections of the member are reassigned
+        and when the elements of the member are generated. Call it explicitly after modifying
+        a section in place.
+        """
+        for name in self.RESISTANCES:
+            self.__dict__.pop(name, None)
+
+    def generate_elements(self) -> None:
+        """Generate the elements along the member and discard the resistances of the previous ones."""
+        super().generate_elements()
+        self.invalidate_resistances()
+
+    def get_resistance_along(self, name: str) -> npt.NDArray[np.float64]:
+        """
+        Return a resistance of the element sections, repeated at the sampling points of the member.
+
+        :param name: Name of the resistance attribute of :class:`ConcreteSection`, e.g. 'v_rd'.
+        """
+        return self.repeat_along(
+            [getattr(element.section, name) for element in self.generated_elements]
+        )
+
+    def repeat_along(self, values: list[float | None]) -> npt.NDArray[np.float64]:
+        """
+        Return the values of the generated elements repeated at the sampling points of the member.
+
+        :param values: One value per generated element, None values become NaN.
+        """
+        counts = [element.sampling_points.size for element in self.generated_elements]
+        along = np.repeat(np.asarray(values, dtype=np.float64), counts)
+        along.flags.writeable = False
+        return along
+
+    @cached_property
+    def m_rd_positive(self) -> npt.NDArray[np.float64]:
+        """Positive moment of resistance at the sampling points of the member."""
+        return self.get_resistance_along("m_rd_positive")
+
+    @cached_property
+    def m_rd_negative(self) -> npt.NDArray[np.float64]:
+        """Negative moment of resistance at the sampling points of the member."""
+        return self.get_resistance_along("m_rd_negative")
+
+    @cached_property
+    def v_rd(self) -> npt.NDArray[np.float64]:
+        """Shear force resistance at the sampling points of the member, NaN without shear reinforcement."""
+        return self.get_resistance_along("v_rd")
+
+    @cached_property
+    def shear_resistance(self) -> ShearResistanceWithoutReinforcement | None:
+        """
+        Shear resistance at the sampling points of the member without shear reinforcement.
+
+        None if all sections of the member define their shear force resistance `v_rd`.
+        """
+        if not np.isnan(self.v_rd).any():
+            return None
+
+        sections = [element.section for element in self.generated_elements]
+        missing = [
+            section.label
+            for section in sections
+            if section.v_rd is None and section.rho_l is None
+        ]
+        if missing:
+            raise ValueError(
+                f"Sections {sorted(set(missing))} of member '{self.label}' define neither "
+                f"'v_rd' nor 'd', 'b_w' and 'A_sl'."
+            )
+
+        materials = [section.material for section in sections]
+        return ShearResistanceWithoutReinforcement(
+            f_ck=self.repeat_along([material.f_ck for material in materials]),
+            f_cd=self.repeat_along([material.f_cd for material in materials]),
+            gamma_c=self.repeat_along([material.gamma_c for material in materials]),
+            d=self.get_resistance_along("d"),
+            b_w=self.get_resistance_along("b_w"),
+            rho_l=self.get_resistance_along("rho_l"),
+            area=self.get_resistance_along("area_x"),
+        )
+
+    def get_shear_resistance(
+        self, axial_forces: float | npt.NDArray[np.float64] = 0.0
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the shear force resistance at the sampling points of the member.
+
+        Points without shear reinforcement get the resistance of EN 1992-1-1, 6.2.2(1),
+        which depends on the axial forces.
+
+        :param axial_forces: Axial forces (tension positive), a single combination (n_points,)
+                             or a block of combinations (n_combinations, n_points).
+        """
+        return shear_force_resistance(self.v_rd, self.shear_resistance, axial_forces)
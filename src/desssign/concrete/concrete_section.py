@@ -4,8 +4,21 @@ from typing import TYPE_CHECKING
 
 from framesss.pre.section import PolygonalSection
 
+from desssign.concrete.constants import RHO_L_MAX
+from desssign.concrete.fibre_section import FibreSection
+from desssign.concrete.fibre_section import Rebar
+from desssign.concrete.interaction_diagram import get_interaction_diagram
+from desssign.concrete.interaction_diagram import get_interaction_surface
+from desssign.concrete.moment_curvature import get_moment_curvature
+from desssign.concrete.stress_strain_profile import ConcreteCompressionSSP
+from desssign.concrete.stress_strain_profile import ConcreteTensionSSP
+from desssign.concrete.stress_strain_profile import profile_factory
+
 if TYPE_CHECKING:
     from desssign.concrete.concrete_material import ConcreteMaterial
+    from desssign.concrete.interaction_diagram import InteractionDiagram
+    from desssign.concrete.interaction_diagram import InteractionSurface
+    from desssign.concrete.moment_curvature import MomentCurvature
     from desssign.concrete.rebar_material import RebarMaterial
 
 
@@ -18,9 +31,15 @@ class ConcreteSection(PolygonalSection):
     :param label: Label of the section.
     :param points: Points defining boundary of the section.
     :param material: Material of the section.
-    :param v_rd: Shear force resistance
+    :param v_rd: Shear force resistance, None for sections without shear reinforcement,
+                 whose resistance follows from `d`, `b_w` and `A_sl`.
     :param m_rd_positive: Bending moment resistance.
     :param m_rd_negative: Bending moment resistance.
+    :param d: Effective depth of the section [m].
+    :param b_w: Smallest width of the section in the tensile area [m].
+    :param A_sl: Area of the tensile reinforcement [m2].
+    :param rebars: Reinforcing bars as (y, z, diameter) [m], needed by the fibre model of the section.
+    :param rebar_material: Material of the reinforcing bars.
     """
 
     material: (
@@ -32,12 +51,141 @@ class ConcreteSection(PolygonalSection):
         label: str,
         points: list[list[float]],
         material: ConcreteMaterial,
-        v_rd: float,
+        v_rd: float | None,
         m_rd_positive: float,
         m_rd_negative: float,
+        d: float | None = None,
+        b_w: float | None = None,
+        A_sl: float | None = None,
+        rebars: list[tuple[float, float, float]] | None = None,
+        rebar_material: RebarMaterial | None = None,
     ) -> None:
         super().__init__(label=label, points=points, material=material)
 
+        if rebars and rebar_material is None:
+            raise ValueError(f"Section '{label}' with rebars requires 'rebar_material'.")
+
         self.v_rd = v_rd
         self.m_rd_positive = m_rd_positive
         self.m_rd_negative = m_rd_negative
+        self.d = d
+        self.b_w = b_w
+        self.A_sl = A_sl
+        self.rebars = [] if rebars is None else [tuple(rebar) for rebar in rebars]
+        self.rebar_material = rebar_material
+
+    @property
+    def rho_l(self) -> float | None:
+        """Ratio of the tensile reinforcement, EN 1992-1-1, 6.2.2(1)."""
+        if self.d is None or self.b_w is None or self.A_sl is None:
+            return None
+        return min(self.A_sl / (self.b_w * self.d), RHO_L_MAX)
+
+    def get_fibre_section(
+        self,
+        limit_state: str = "ULS",
+        mesh_size: float = 0.01,
+        tension_softening: bool = False,
+        effective_creep_ratio: float = 0.0,
+    ) -> FibreSection:
+        """
+        Return the fibre model of the section.
+
+        The concrete follows the parabolic-rectangular profile without tension, or the
+        non-linear SLS profile with tension softening, and the reinforcement the
+        elastic-plastic profile of the limit state.
+
+        :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+        :param mesh_size: Size of the concrete fibres [m].
+        :param tension_softening: Whether the concrete follows the non-linear profile with
+                                  tension softening, allowed in SLS only.
+        :param effective_creep_ratio: Effective creep ratio of the concrete.
+        """
+        if tension_softening:
+            concrete_profile = profile_factory.get_concrete_profile(
+                self.material,
+                limit_state,
+                ConcreteCompressionSSP.NONLINEAR,
+                ConcreteTensionSSP.ELASTIC_PLASTIC_WITH_SOFTENING,
+                effective_creep_ratio=effective_creep_ratio,
+            )
+            compression_strain = -self.material.eps_c1
+        else:
+            concrete_profile = profile_factory.get_concrete_profile(
+                self.material,
+                limit_state,
+                ConcreteCompressionSSP.PARABOLIC_RECTANGULAR,
+                ConcreteTensionSSP.NONE,
+                effective_creep_ratio=effective_creep_ratio,
+            )
+            compression_strain = -self.material.eps_c2
+        rebars = []
+        if self.rebars:
+            rebar_profile = profile_factory.get_reinforcement_profile(self.rebar_material, limit_state)
+            rebars = [Rebar(y, z, diameter, rebar_profile) for y, z, diameter in self.rebars]
+
+        return FibreSection(
+            self.points,
+            concrete_profile,
+            rebars,
+            mesh_size=mesh_size,
+            compression_strain=compression_strain * (1 + effective_creep_ratio),
+        )
+
+    def get_interaction_diagram(self, limit_state: str = "ULS", axis: str = "y") -> InteractionDiagram:
+        """
+        Return the interaction diagram of the axial force and the bending moment of the section.
+
+        Diagrams are cached, sections of equal geometry and materials share them.
+
+        :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+        :param axis: Axis of the bending moment, 'y' or 'z'.
+        """
+        return get_interaction_diagram(self, limit_state, axis)
+
+    def get_interaction_surface(self, limit_state: str = "ULS") -> InteractionSurface:
+        """
+        Return the interaction surface of the axial force and the bending moments about both axes.
+
+        Surfaces are cached, sections of equal geometry and materials share them.
+
+        :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+        """
+        return get_interaction_surface(self, limit_state)
+
+    def get_moment_curvature(
+        self,
+        n_ed: float = 0.0,
+        limit_state: str = "SLS",
+        axis: str = "y",
+        effective_creep_ratio: float = 0.0,
+    ) -> MomentCurvature:
+        """
+        Return the moment-curvature relation of the section under the axial force.
+
+        Relations are interpolated between the axial forces of cached tables, sections
+        of equal geometry and materials share them.
+
+        :param n_ed: Axial force [N].
+        :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+        :param axis: Axis of the bending moment, 'y' or 'z'.
+        :param effective_creep_ratio: Effective creep ratio of the concrete.
+        """
+        return get_moment_curvature(self, n_ed, limit_state, axis, effective_creep_ratio)
+
+    def set_moment_curvature(
+        self,
+        n_ed: float = 0.0,
+        limit_state: str = "SLS",
+        effective_creep_ratio: float = 0.0,
+    ) -> None:
+        """
+        Set the moment-curvature relation about the y-axis used by the non-linear analysis of framesss.
+
+        :param n_ed: Axial force [N].
+        :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+        :param effective_creep_ratio: Effective creep ratio of the concrete.
+        """
+        self.moment_curvature = self.get_moment_curvature(
+            n_ed, limit_state, "y", effective_creep_ratio
+        ).to_framesss()
@@ -2,3 +2,22 @@ PARTIAL_FACTOR_CONCRETE = 1.5
 PARTIAL_FACTOR_STEEL = 1.15
 ALPHA_CC = 1.0
 ALPHA_CT = 1.0
+
+# Shear resistance of members not requiring design shear reinforcement, EN 1992-1-1, 6.2.2(1)
+K_1_SHEAR = 0.15
+RHO_L_MAX = 0.02
+K_SHEAR_MAX = 2.0
+SIGMA_CP_MAX_RATIO = 0.2  # Limit of the axial stress as a fraction of f_cd
+
+# Bending moments about the z-axis up to this fraction of the largest moment about the y-axis
+# are round-off, the sections are checked in uniaxial bending
+BIAXIAL_BENDING_TOLERANCE = 1e-3
+
+# Moment-curvature tables of sections kept in memory, see `desssign.concrete.moment_curvature`
+MOMENT_CURVATURE_CACHE_SIZE = 32
+
+# Interaction diagrams and surfaces of sections kept in memory, see `desssign.concrete.interaction_diagram`
+INTERACTION_DIAGRAM_CACHE_SIZE = 64
+
+# Fibre meshes of section geometries kept in memory, see `desssign.concrete.fibre_mesh`
+FIBRE_MESH_CACHE_SIZE = 64
@@ -3,19 +3,45 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-import math
 
 from desssign.common.design_check import Check
+from desssign.concrete.constants import K_1_SHEAR
+from desssign.concrete.constants import K_SHEAR_MAX
+from desssign.concrete.constants import RHO_L_MAX
+from desssign.concrete.constants import SIGMA_CP_MAX_RATIO
 
 if TYPE_CHECKING:
     import numpy.typing as npt
 
 
+def bending_usages(
+    m_ed: npt.NDArray[np.float64],
+    m_rd_positive: float | npt.NDArray[np.float64],
+    m_rd_negative: float | npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the section in bending.
+
+    The moment of resistance is selected by the sign of the bending moment at every point.
+    The resistances are scalars or arrays per point, broadcast against the bending moments,
+    so `m_ed` may be a single combination (n_points,), a block of combinations
+    (n_combinations, n_points) or the min/max rows of an envelope (2, n_points).
+
+    :param m_ed: Bending moments along the member.
+    :param m_rd_positive: Positive moment of resistance (>0).
+    :param m_rd_negative: Negative moment of resistance (<0).
+    """
+    m_ed = np.asarray(m_ed, dtype=np.float64)
+    m_rd = np.where(m_ed >= 0, m_rd_positive, m_rd_negative)
+    return m_ed / m_rd
+
+
 class BendingCheck(Check):
     """
     Class for checking bending.
 
-    :param m_ed: Bending moments along the member.
+    :param m_ed: Bending moments along the member, a single combination, a block of combinations
+                 or the min/max rows of an envelope.
     :param m_rd_positive: Ultimate resistance of reinforced section.
     :param m_rd_negative: Ultimate resistance of reinforced section.
     """
@@ -35,20 +61,7 @@ class BendingCheck(Check):
     @property
     def usages(self) -> npt.NDArray[np.float64]:
         """Usages of the section at every point along the member."""
-        usages = np.zeros(self.m_ed.shape)
-        if isinstance(self.m_rd_positive, float):
-            usages[self.m_ed >= 0] = self.m_ed[self.m_ed >= 0] / self.m_rd_positive
-            usages[self.m_ed < 0] = self.m_ed[self.m_ed < 0] / self.m_rd_negative
-        elif isinstance(self.m_rd_negative, np.ndarray):
-            if self.m_ed.ndim == 1:
-                usages[self.m_ed >= 0] = self.m_ed[self.m_ed >= 0] / self.m_rd_positive[self.m_ed >= 0]
-                usages[self.m_ed < 0] = self.m_ed[self.m_ed < 0] / self.m_rd_negative[self.m_ed < 0]
-            elif self.m_ed.ndim == 2:
-                usages[1][self.m_ed[1] >= 0] = self.m_ed[1][self.m_ed[1] >= 0] / self.m_rd_positive[self.m_ed[1] >= 0]
-                usages[0][self.m_ed[0] < 0] = self.m_ed[0][self.m_ed[0] < 0] / self.m_rd_negative[self.m_ed[0] < 0]
-            else:
-                raise ValueError(f"m_ed should have 1 or 2 dimensions, not {self.m_ed.ndim}")
-        return usages
+        return bending_usages(self.m_ed, self.m_rd_positive, self.m_rd_negative)
 
 
 class ShearCheck(Check):
@@ -62,7 +75,7 @@ class ShearCheck(Check):
     def __init__(
         self,
         v_ed: npt.NDArray[np.float64],
-        v_rd: npt.NDArray[np.float64]
+        v_rd: float | npt.NDArray[np.float64]
     ) -> None:
         super().__init__("EN 1992-1-1", "", "")
         self.v_ed = v_ed
@@ -74,37 +87,145 @@ class ShearCheck(Check):
         return np.abs(self.v_ed / self.v_rd)
 
 
-class ShearCheckWithoutShearReinforcement(Check):
+class AxialBendingCheck(Check):
+    """
+    Class for checking axial force with bending moment by the interaction diagram of the section.
+
+    The usages are evaluated for a block of combinations at once, see
+    :meth:`ConcreteMember1DChecks.get_axial_bending_usages`.
+
+    :param n_ed: Axial forces along the member.
+    :param m_ed: Bending moments along the member.
+    :param usages: Usages of the interaction diagram at every point along the member.
+    """
+
     def __init__(
         self,
-        v_ed: npt.NDArray[np.float64],
-        f_ck: float,
-        d: float,
-        b_w: float,
-        A_sl: float,
-        c_rd_c: float = 0.18 / 1.15,
+        n_ed: npt.NDArray[np.float64],
+        m_ed: npt.NDArray[np.float64],
+        usages: npt.NDArray[np.float64],
     ) -> None:
+        """Init the AxialBendingCheck object."""
+        super().__init__("EN 1992-1-1", "6.1", "")
+        self.n_ed = n_ed
+        self.m_ed = m_ed
+        self._usages = usages
+
+    @property
+    def usages(self) -> npt.NDArray[np.float64]:
+        """Usages of the section at every point along the member."""
+        return self._usages
+
+
+def shear_resistance_without_reinforcement(
+    f_ck: float | npt.NDArray[np.float64],
+    gamma_c: float | npt.NDArray[np.float64],
+    d: float | npt.NDArray[np.float64],
+    b_w: float | npt.NDArray[np.float64],
+    rho_l: float | npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Return the shear resistance of members without shear reinforcement and axial force [N].
+
+    EN 1992-1-1, 6.2.2(1), eq. (6.2.a), (6.2.b). All arguments are scalars or arrays per point.
+
+    :param f_ck: Characteristic compressive cylinder strength of concrete [Pa].
+    :param gamma_c: Partial factor of concrete.
+    :param d: Effective depth of the section [m].
+    :param b_w: Smallest width of the section in the tensile area [m].
+    :param rho_l: Ratio of the tensile reinforcement.
+    """
+    f_ck = np.asarray(f_ck, dtype=np.float64) / 1e6  # [MPa]
+    d = np.asarray(d, dtype=np.float64)
+    k = np.minimum(1.0 + np.sqrt(0.2 / d), K_SHEAR_MAX)
+    rho_l = np.minimum(rho_l, RHO_L_MAX)
+
+    v_rd_c = 0.18 / np.asarray(gamma_c) * k * np.cbrt(100.0 * rho_l * f_ck)
+    v_min = 0.035 * k**1.5 * np.sqrt(f_ck)
+    return np.maximum(v_rd_c, v_min) * 1e6 * b_w * d
+
+
+class ShearResistanceWithoutReinforcement:
+    """
+    Shear resistance of members without shear reinforcement along the member.
+
+    EN 1992-1-1, 6.2.2(1). The resistance without axial force is evaluated once,
+    only the contribution of the axial stress is evaluated per combination.
+
+    :param f_ck: Characteristic compressive cylinder strength of concrete [Pa].
+    :param f_cd: Design compressive strength of concrete [Pa].
+    :param gamma_c: Partial factor of concrete.
+    :param d: Effective depth of the section [m].
+    :param b_w: Smallest width of the section in the tensile area [m].
+    :param rho_l: Ratio of the tensile reinforcement.
+    :param area: Area of the concrete section [m2].
+    """
+
+    def __init__(
+        self,
+        f_ck: float | npt.NDArray[np.float64],
+        f_cd: float | npt.NDArray[np.float64],
+        gamma_c: float | npt.NDArray[np.float64],
+        d: float | npt.NDArray[np.float64],
+        b_w: float | npt.NDArray[np.float64],
+        rho_l: float | npt.NDArray[np.float64],
+        area: float | npt.NDArray[np.float64],
+    ) -> None:
+        """Init the ShearResistanceWithoutReinforcement object."""
+        self.v_rd_c_0 = shear_resistance_without_reinforcement(f_ck, gamma_c, d, b_w, rho_l)
+        self.b_w_d = np.asarray(b_w, dtype=np.float64) * d
+        self.area = np.asarray(area, dtype=np.float64)
+        self.sigma_cp_max = SIGMA_CP_MAX_RATIO * np.asarray(f_cd, dtype=np.float64)
+
+    def __call__(
+        self, axial_forces: float | npt.NDArray[np.float64] = 0.0
+    ) -> npt.NDArray[np.float64]:
         """
-        Init the ShearCheck object.
+        Return the shear resistance for the axial forces [N].
 
-        :param f_ck: Characteristic concrete cylinder strength in MPa.
-        :param d: Rebar diameter in mm.
-        :param b_w: Smallest width of the cross-section in the tensile area.
-        :param A_sl: Area of the tensile reinforcement.
+        :param axial_forces: Axial forces (tension positive), a single combination (n_points,)
+                             or a block of combinations (n_combinations, n_points).
         """
-        super().__init__("EN 1992-1-1", "6.2", "6.2.a, 6.2.b")
-        k = min(1 + math.sqrt(200 / d), 2.0)
-        rho_l = min(A_sl / (b_w * d), 0.02)
+        sigma_cp = np.minimum(-np.asarray(axial_forces) / self.area, self.sigma_cp_max)
+        return np.maximum(self.v_rd_c_0 + K_1_SHEAR * sigma_cp * self.b_w_d, 0.0)
 
-        v_min = 0.035 * k ** (3 / 2) * f_ck ** (1 / 2)
 
-        v_rd_c_a = (c_rd_c * k * (100 * rho_l * f_ck) ** (1 / 3)) * b_w * d
-        v_rd_c_b = v_min * b_w * d
+def shear_force_resistance(
+    v_rd: npt.NDArray[np.float64],
+    shear_resistance: ShearResistanceWithoutReinforcement | None,
+    axial_forces: float | npt.NDArray[np.float64] = 0.0,
+) -> npt.NDArray[np.float64]:
+    """
+    Return the shear force resistance along the member [N].
 
-        self.v_rd_c = min(v_rd_c_a, v_rd_c_b)
-        self.v_ed = v_ed
+    Points without shear reinforcement (NaN `v_rd`) get the resistance of EN 1992-1-1, 6.2.2(1),
+    which depends on the axial forces.
 
-    @property
-    def usages(self) -> npt.NDArray[np.float64]:
-        """Usages of the material at every point along the member."""
-        return np.abs(self.v_ed) / self.v_rd_c
+    :param v_rd: Shear force resistance of the sections along the member, NaN without shear reinforcement.
+    :param shear_resistance: Shear resistance without shear reinforcement along the member,
+                             None if all sections define `v_rd`.
+    :param axial_forces: Axial forces (tension positive), a single combination (n_points,)
+                         or a block of combinations (n_combinations, n_points).
+    """
+    if shear_resistance is None:
+        return v_rd
+    return np.where(np.isnan(v_rd), shear_resistance(axial_forces), v_rd)
+
+
+class ShearCheckWithoutShearReinforcement(ShearCheck):
+    """
+    Class for checking shear force of members without shear reinforcement.
+
+    :param v_ed: Shear force along the member.
+    :param v_rd_c: Shear resistance along the member, see :class:`ShearResistanceWithoutReinforcement`.
+    """
+
+    def __init__(
+        self,
+        v_ed: npt.NDArray[np.float64],
+        v_rd_c: float | npt.NDArray[np.float64],
+    ) -> None:
+        """Init the ShearCheckWithoutShearReinforcement object."""
+        super().__init__(v_ed, v_rd_c)
+        self.paragraph = "6.2.2"
+        self.equation_number = "6.2.a, 6.2.b"
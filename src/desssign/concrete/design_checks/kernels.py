@@ -0,0 +1,81 @@
+"""Batched kernels of the concrete design checks, see :class:`desssign.concrete.design_checks.design_check`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from desssign.common.check_registry import check_registry
+from desssign.concrete.design_checks.design_check import bending_usages
+from desssign.concrete.design_checks.design_check import shear_force_resistance
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from desssign.concrete.design_checks.design_check import (
+        ShearResistanceWithoutReinforcement,
+    )
+
+
+@check_registry.quantity(
+    "concrete.moments_of_resistance", inputs=("checks.get_moments_of_resistance",)
+)
+def moments_of_resistance(
+    get_moments_of_resistance: tuple[float, float]
+    | tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]],
+) -> tuple[float, float] | tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Positive and negative moments of resistance, broadcast along the member."""
+    return get_moments_of_resistance
+
+
+@check_registry.quantity(
+    "concrete.v_rd", inputs=("axial_forces", "member.v_rd", "member.shear_resistance")
+)
+def v_rd(
+    axial_forces: npt.NDArray[np.float64],
+    v_rd: npt.NDArray[np.float64],
+    shear_resistance: ShearResistanceWithoutReinforcement | None,
+) -> npt.NDArray[np.float64]:
+    """Shear force resistance along the member, depending on the axial forces without shear reinforcement."""
+    return shear_force_resistance(v_rd, shear_resistance, axial_forces)
+
+
+@check_registry.check(
+    "concrete.bending_check",
+    family="bending_check",
+    code="EN 1992-1-1",
+    paragraph="",
+    inputs=("bending_moments_y", "concrete.moments_of_resistance"),
+    include_peaks=False,
+)
+def bending_check(
+    bending_moments_y: npt.NDArray[np.float64],
+    moments_of_resistance: tuple[float, float]
+    | tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]],
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the bending check.
+
+    EN 1992-1-1, 6.1
+    """
+    return bending_usages(bending_moments_y, *moments_of_resistance)
+
+
+@check_registry.check(
+    "concrete.shear_check",
+    family="shear_check",
+    code="EN 1992-1-1",
+    paragraph="",
+    inputs=("shear_forces_z", "concrete.v_rd"),
+    include_peaks=False,
+)
+def shear_check(
+    shear_forces_z: npt.NDArray[np.float64], v_rd: float | npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the shear check.
+
+    EN 1992-1-1, 6.2
+    """
+    return np.abs(shear_forces_z / v_rd)
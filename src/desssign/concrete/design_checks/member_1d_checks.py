@@ -1,19 +1,28 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from typing import Any
 
 import numpy as np
 from framesss.pre.cases import EnvelopeCombination
 
+from desssign.common.check_registry import check_registry
 from desssign.common.design_check import Member1DChecks
+from desssign.common.instrumentation import instrument
+from desssign.concrete.constants import BIAXIAL_BENDING_TOLERANCE
+from desssign.concrete.design_checks import kernels  # noqa: F401 (registers the check kernels)
+from desssign.concrete.design_checks.design_check import AxialBendingCheck
 from desssign.concrete.design_checks.design_check import BendingCheck
 from desssign.concrete.design_checks.design_check import ShearCheck
+from desssign.concrete.design_checks.design_check import ShearCheckWithoutShearReinforcement
+from desssign.concrete.design_checks.design_check import shear_force_resistance
 
 if TYPE_CHECKING:
     import numpy.typing as npt
 
     from desssign.loads.load_case_combination import DesignLoadCaseCombination
     from desssign.concrete.concrete_member import ConcreteMember1D
+    from desssign.concrete.concrete_section import ConcreteSection
 
 
 class ConcreteMember1DChecks(Member1DChecks):
@@ -27,6 +36,11 @@ class ConcreteMember1DChecks(Member1DChecks):
         ConcreteMember1D  # Explicit type annotation, so that mypy can check the type
     )
 
+    check_families = ("bending_check", "shear_check", "axial_bending_check")
+    member_attributes = ("section", "m_rd_positive", "m_rd_negative", "v_rd", "shear_resistance")
+    # The axial bending check needs the interaction diagrams and isn't part of the pipeline
+    pipeline = check_registry.pipeline("concrete.bending_check", "concrete.shear_check")
+
     def __init__(self, member: ConcreteMember1D):
         super().__init__(member=member)
 
@@ -34,19 +48,39 @@ class ConcreteMember1DChecks(Member1DChecks):
                              dict[EnvelopeCombination, BendingCheck]) = {}
         self.shear_check: (dict[DesignLoadCaseCombination, ShearCheck] |
                            dict[EnvelopeCombination, ShearCheck]) = {}
+        self.axial_bending_check: (dict[DesignLoadCaseCombination, AxialBendingCheck] |
+                                   dict[EnvelopeCombination, AxialBendingCheck]) = {}
 
     @property
     def max_usage(self) -> float:
         """Maximum usage of the material."""
-        max_usages = [check.max_usage for check in (*self.shear_check.values(),)]
+        max_usages = [
+            check.max_usage
+            for check in (*self.shear_check.values(), *self.axial_bending_check.values())
+        ]
 
         for value in self.bending_check.values():
             if isinstance(value, list):
                 max_usages.extend([check.max_usage for check in value])
             else:
                 max_usages.append(value.max_usage)
+        max_usages.extend(summary.max_usage for summary in self.summaries.values())
         return max(max_usages)
 
+    def get_check_families(self) -> tuple[str, ...]:
+        """Return the check families, the axial bending check needs reinforcing bars in all sections."""
+        if self.has_rebars:
+            return self.check_families
+        return tuple(family for family in self.check_families if family != "axial_bending_check")
+
+    @property
+    def has_rebars(self) -> bool:
+        """Whether all sections of the member define their reinforcing bars."""
+        if self.member.section:
+            return bool(self.member.section.rebars)
+        return all(element.section.rebars for element in self.member.generated_elements)
+
+    @instrument()
     def perform_uls_checks(
         self,
         load_case_combinations: list[DesignLoadCaseCombination] | EnvelopeCombination
@@ -58,85 +92,166 @@ class ConcreteMember1DChecks(Member1DChecks):
         else:
             raise ValueError(f"Wrong 'load_case_combination' type: {type(load_case_combinations)}")
 
+    @instrument()
     def perform_envelope_uls_checks(self, envelope: EnvelopeCombination) -> None:
         self.perform_bending_checks_envelope(envelope)
         self.perform_shear_checks_envelope(envelope)
+        if self.has_rebars:
+            self.perform_axial_bending_checks_envelope(envelope)
 
+    @instrument()
     def perform_combinations_uls_checks(self, combinations: list[DesignLoadCaseCombination]) -> None:
         self.perform_bending_checks_combinations(combinations)
         self.perform_shear_checks_combinations(combinations)
+        if self.has_rebars:
+            self.perform_axial_bending_checks_combinations(combinations)
 
     def get_moments_of_resistance(self) -> tuple[float, float] | tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Positive and negative moments of resistance, per sampling point if the member has more sections."""
         if self.member.section:
-            m_rd_positive = self.member.section.m_rd_positive
-            m_rd_negative = self.member.section.m_rd_negative
-        else:
-            m_rd_positive = []
-            m_rd_negative = []
-            for elem in self.member.generated_elements:
-                m_rd_positive.extend(np.full(
-                    shape=elem.sampling_points.shape,
-                    fill_value=elem.section.m_rd_positive,
-                ).tolist()
-                                     )
-                m_rd_negative.extend(np.full(
-                    shape=elem.sampling_points.shape,
-                    fill_value=elem.section.m_rd_negative,
-                ).tolist()
-                                     )
-            m_rd_positive = np.array(m_rd_positive)
-            m_rd_negative = np.array(m_rd_negative)
-
-        return m_rd_positive, m_rd_negative
-
-    def get_shear_force_resistance(self) -> float | npt.NDArray[np.float64]:
-        if self.member.section:
+            return self.member.section.m_rd_positive, self.member.section.m_rd_negative
+        return self.member.m_rd_positive, self.member.m_rd_negative
+
+    def get_shear_force_resistance(
+        self, axial_forces: float | npt.NDArray[np.float64] = 0.0
+    ) -> float | npt.NDArray[np.float64]:
+        """
+        Shear force resistance, per sampling point if the member has more sections or no shear reinforcement.
+
+        :param axial_forces: Axial forces along the member, the resistance without shear reinforcement
+                             depends on them, see :func:`shear_force_resistance`.
+        """
+        if self.member.section and self.member.section.v_rd is not None:
             return self.member.section.v_rd
-        else:
-            v_rd = []
-            for elem in self.member.generated_elements:
-                v_rd.extend(
-                    np.full(
-                        shape=elem.sampling_points.shape,
-                        fill_value=elem.section.v_rd
-                    ).tolist()
+        return shear_force_resistance(self.member.v_rd, self.member.shear_resistance, axial_forces)
+
+    def get_shear_check(
+        self,
+        v_ed: npt.NDArray[np.float64],
+        axial_forces: float | npt.NDArray[np.float64] = 0.0,
+    ) -> ShearCheck:
+        """
+        Return the shear check of the member.
+
+        :param v_ed: Shear forces along the member.
+        :param axial_forces: Axial forces along the member.
+        """
+        v_rd = self.get_shear_force_resistance(axial_forces)
+        if np.ndim(v_rd) and np.isnan(self.member.v_rd).all():
+            return ShearCheckWithoutShearReinforcement(v_ed=v_ed, v_rd_c=v_rd)
+        return ShearCheck(v_ed=v_ed, v_rd=v_rd)
+
+    def get_axial_bending_usages(
+        self,
+        n_ed: npt.NDArray[np.float64],
+        m_y_ed: npt.NDArray[np.float64],
+        m_z_ed: npt.NDArray[np.float64] | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the usages of the interaction diagrams of the sections along the member.
+
+        Biaxial bending is checked by the interaction surfaces of the sections if any bending
+        moment about the z-axis exceeds :data:`BIAXIAL_BENDING_TOLERANCE` times the largest
+        moment about the y-axis, smaller moments are round-off of the analysis.
+
+        :param n_ed: Axial forces of shape (n_rows, n_points), e.g. of all combinations.
+        :param m_y_ed: Bending moments about the y-axis of shape (n_rows, n_points).
+        :param m_z_ed: Bending moments about the z-axis of shape (n_rows, n_points).
+        """
+        m_y_max = np.max(np.abs(m_y_ed), initial=0.0)
+        biaxial = m_z_ed is not None and bool(
+            np.any(np.abs(m_z_ed) > BIAXIAL_BENDING_TOLERANCE * m_y_max)
+        )
+        n_ed, m_y_ed, m_z_ed = np.broadcast_arrays(n_ed, m_y_ed, 0.0 if m_z_ed is None else m_z_ed)
+
+        def get_usages(section: ConcreteSection, columns: Any) -> npt.NDArray[np.float64]:
+            if biaxial:
+                return section.get_interaction_surface().get_usages(
+                    n_ed[..., columns], m_y_ed[..., columns], m_z_ed[..., columns]
                 )
+            return section.get_interaction_diagram().get_usages(
+                n_ed[..., columns], m_y_ed[..., columns]
+            )
 
-            return np.array(v_rd)
+        if self.member.section:
+            return get_usages(self.member.section, slice(None))
+
+        usages = np.empty(n_ed.shape)
+        sections = [element.section for element in self.member.generated_elements]
+        counts = [element.sampling_points.size for element in self.member.generated_elements]
+        distinct = list(dict.fromkeys(sections))
+        section_ids = np.repeat([distinct.index(section) for section in sections], counts)
+        for index, section in enumerate(distinct):
+            columns = section_ids == index
+            usages[..., columns] = get_usages(section, columns)
+        return usages
+
+    @instrument()
+    def perform_axial_bending_checks_combinations(
+        self, load_case_combinations: list[DesignLoadCaseCombination]
+    ) -> None:
+        forces, owners, _ = self.get_internal_forces_block(load_case_combinations, include_peaks=False)
+        axial, bending_y = forces[0], forces[4]
+        usages = self.get_axial_bending_usages(axial, bending_y, forces[5])
+
+        for index, combination in enumerate(load_case_combinations):
+            rows = owners == index
+            self.axial_bending_check[combination] = AxialBendingCheck(
+                n_ed=axial[rows][0],
+                m_ed=bending_y[rows][0],
+                usages=usages[rows][0],
+            )
 
+    @instrument()
+    def perform_axial_bending_checks_envelope(self, envelope: EnvelopeCombination) -> None:
+        results = self.member.results
+        n_points = self.member.x_local.shape[0]
+        # Every extreme axial force is paired with all extreme bending moments
+        axial = np.broadcast_to(results.axial_forces.get(envelope, np.zeros(n_points)), (2, n_points))
+        bending_y = np.broadcast_to(results.bending_moments_y.get(envelope, np.zeros(n_points)), (2, n_points))
+        bending_z = np.broadcast_to(results.bending_moments_z.get(envelope, np.zeros(n_points)), (2, n_points))
+        usages = self.get_axial_bending_usages(
+            np.repeat(axial, 4, axis=0),
+            np.tile(np.repeat(bending_y, 2, axis=0), (2, 1)),
+            np.tile(bending_z, (4, 1)),
+        )
+
+        self.axial_bending_check[envelope] = AxialBendingCheck(
+            n_ed=axial,
+            m_ed=bending_y,
+            usages=usages.max(axis=0),
+        )
+
+    @instrument()
     def perform_bending_checks_combinations(self, load_case_combinations: list[DesignLoadCaseCombination]) -> None:
+        m_rd_positive, m_rd_negative = self.get_moments_of_resistance()
         for combination in load_case_combinations:
             axial, _, _, _, bending_y, _ = self.get_internal_forces(combination, include_peaks=False)
 
-            m_rd_positive, m_rd_negative = self.get_moments_of_resistance()
-
             self.bending_check[combination] = BendingCheck(
                 m_ed=bending_y,
                 m_rd_positive=m_rd_positive,
                 m_rd_negative=m_rd_negative,
             )
 
+    @instrument()
     def perform_shear_checks_combinations(self, load_case_combinations: list[DesignLoadCaseCombination]) -> None:
         for combination in load_case_combinations:
-            _, _, shear_z, _, _, _ = self.get_internal_forces(combination, include_peaks=False)
+            axial, _, shear_z, _, _, _ = self.get_internal_forces(combination, include_peaks=False)
 
-            v_rd = self.get_shear_force_resistance()
-
-            self.shear_check[combination] = ShearCheck(
-                v_ed=shear_z,
-                v_rd=v_rd
-            )
+            self.shear_check[combination] = self.get_shear_check(shear_z, axial)
 
+    @instrument()
     def perform_shear_checks_envelope(self, envelope: EnvelopeCombination) -> None:
         pos_neg_shear_z = self.member.results.shear_forces_z.get(envelope)
+        # The resistance without shear reinforcement is governed by the largest tension
+        axial = self.member.results.axial_forces.get(envelope, np.zeros((1, 1)))
 
-        v_rd = self.get_shear_force_resistance()
-
-        self.shear_check[envelope] = ShearCheck(
-            v_ed=pos_neg_shear_z,
-            v_rd=v_rd
+        self.shear_check[envelope] = self.get_shear_check(
+            pos_neg_shear_z, np.max(axial, axis=0)
         )
 
+    @instrument()
     def perform_bending_checks_envelope(self, envelope: EnvelopeCombination) -> None:
         pos_neg_bending_y = self.member.results.bending_moments_y.get(envelope)
 
@@ -0,0 +1,195 @@
+"""Meshing of polygonal sections into fibres."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+import numpy as np
+
+from desssign.common.fingerprint import fingerprint
+from desssign.concrete.constants import FIBRE_MESH_CACHE_SIZE
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+
+class FibreMesh(NamedTuple):
+    """
+    Fibres of a polygonal section.
+
+    The arrays are read-only, as meshes are shared by all sections of equal geometry.
+
+    :param y: Coordinates y of the centroids of the fibres [m].
+    :param z: Coordinates z of the centroids of the fibres [m].
+    :param area: Areas of the fibres [m2].
+    """
+
+    y: npt.NDArray[np.float64]
+    z: npt.NDArray[np.float64]
+    area: npt.NDArray[np.float64]
+
+    @property
+    def total_area(self) -> float:
+        """Area of the section [m2]."""
+        return float(self.area.sum())
+
+    @property
+    def centroid(self) -> tuple[float, float]:
+        """Coordinates y and z of the centroid of the section [m]."""
+        return (
+            float(self.y @ self.area) / self.total_area,
+            float(self.z @ self.area) / self.total_area,
+        )
+
+
+def get_signed_area(points: npt.ArrayLike) -> float:
+    """
+    Return the area of the polygon, positive for counter-clockwise vertices.
+
+    :param points: Vertices of the polygon [[y, z], ...], closed or not.
+    """
+    y, z = np.asarray(points, dtype=np.float64).T
+    return float(np.sum(y * np.roll(z, -1) - np.roll(y, -1) * z) / 2)
+
+
+def get_edges(
+    points: Sequence[Sequence[float]], holes: Sequence[Sequence[Sequence[float]]] = ()
+) -> npt.NDArray[np.float64]:
+    """
+    Return the edges of the polygon and its holes, the polygon counter-clockwise and the holes clockwise.
+
+    :param points: Vertices of the polygon [[y, z], ...], closed or not.
+    :param holes: Vertices of the holes inside the polygon.
+    :return: Edges [[y_start, z_start, y_end, z_end], ...].
+    """
+    edges = []
+    for index, boundary in enumerate([points, *holes]):
+        vertices = np.asarray(boundary, dtype=np.float64)
+        if np.array_equal(vertices[0], vertices[-1]):
+            vertices = vertices[:-1]
+        if (get_signed_area(vertices) > 0) == (index > 0):
+            vertices = vertices[::-1]
+        edges.append(np.hstack((vertices, np.roll(vertices, -1, axis=0))))
+    return np.vstack(edges)
+
+
+def mesh_polygon(
+    points: Sequence[Sequence[float]],
+    mesh_size: float,
+    holes: Sequence[Sequence[Sequence[float]]] = (),
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Divide the polygon into the cells of a regular grid, clipped exactly by the polygon and its holes.
+
+    The edges are split at the lines of the grid, so every piece lies in one cell. By Green's
+    theorem, a piece running from y_a to y_b at the heights z(y) adds -∫(min(z, z_top) - z_bottom) dy
+    to the area of every cell of its column below it, integrated exactly as z is linear. The
+    first moments of area follow likewise, so the areas and centroids of the fibres are exact
+    and so are the area and the centroid of the section.
+
+    :param points: Vertices of the polygon [[y, z], ...], closed or not.
+    :param mesh_size: Size of the cells [m].
+    :param holes: Vertices of the holes inside the polygon.
+    :return: Coordinates y and z of the centroids of the fibres [m] and their areas [m2].
+    """
+    edges = get_edges(points, holes)
+    (y_min, z_min), (y_max, z_max) = edges[:, :2].min(axis=0), edges[:, :2].max(axis=0)
+    n_y = max(math.ceil((y_max - y_min) / mesh_size), 1)
+    n_z = max(math.ceil((z_max - z_min) / mesh_size), 1)
+    lines_y = np.linspace(y_min, y_max, n_y + 1)
+    lines_z = np.linspace(z_min, z_max, n_z + 1)
+
+    # Split the edges at the crossings with the lines of the grid
+    pieces = []
+    for y_a, z_a, y_b, z_b in edges:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossings = np.concatenate(
+                ((lines_y - y_a) / (y_b - y_a), (lines_z - z_a) / (z_b - z_a))
+            )
+        crossings = crossings[(crossings > 0.0) & (crossings < 1.0)]
+        t = np.unique(np.concatenate(([0.0, 1.0], crossings)))
+        y, z = y_a + t * (y_b - y_a), z_a + t * (z_b - z_a)
+        pieces.append(np.column_stack((y[:-1], z[:-1], y[1:], z[1:])))
+    y_a, z_a, y_b, z_b = np.vstack(pieces).T
+    y_m, z_m = (y_a + y_b) / 2, (z_a + z_b) / 2
+    dy = y_b - y_a
+
+    columns = np.clip(np.searchsorted(lines_y, y_m) - 1, 0, n_y - 1)
+    rows = np.clip(np.searchsorted(lines_z, z_m) - 1, 0, n_z - 1)
+    bottom = lines_z[rows]
+    cells = columns * n_z + rows
+
+    # Cells of the pieces, integrated with Simpson's rule, exact for the quadratic integrands
+    own = np.zeros((3, n_y * n_z))
+    own[0] = np.bincount(cells, -dy * (z_m - bottom), n_y * n_z)
+    own[1] = np.bincount(
+        cells,
+        -dy / 6 * (y_a * (z_a - bottom) + 4 * y_m * (z_m - bottom) + y_b * (z_b - bottom)),
+        n_y * n_z,
+    )
+    own[2] = np.bincount(
+        cells, -dy / 12 * (z_a**2 + 4 * z_m**2 + z_b**2 - 6 * bottom**2), n_y * n_z
+    )
+
+    # Cells below the pieces get their full height
+    below = np.zeros((2, n_y * n_z))
+    below[0] = np.bincount(cells, -dy, n_y * n_z)
+    below[1] = np.bincount(cells, -(y_b**2 - y_a**2) / 2, n_y * n_z)
+    below = below.reshape(2, n_y, n_z)
+    # Sums over the rows above every cell
+    above = np.cumsum(below[:, :, ::-1], axis=-1)[:, :, ::-1] - below
+
+    heights = np.diff(lines_z)
+    area = own[0].reshape(n_y, n_z) + above[0] * heights
+    moment_y = own[1].reshape(n_y, n_z) + above[1] * heights
+    moment_z = own[2].reshape(n_y, n_z) + above[0] * (lines_z[1:] ** 2 - lines_z[:-1] ** 2) / 2
+
+    fibres = area > 1e-9 * (lines_y[1] - lines_y[0]) * heights
+    area = area[fibres]
+    return moment_y[fibres] / area, moment_z[fibres] / area, area
+
+
+# Meshes shared by all sections of equal geometry, the least recently used are dropped first
+_meshes: OrderedDict[str, FibreMesh] = OrderedDict()
+
+
+def get_fibre_mesh(
+    points: Sequence[Sequence[float]],
+    mesh_size: float,
+    holes: Sequence[Sequence[Sequence[float]]] = (),
+) -> FibreMesh:
+    """
+    Return the fibres of the polygon, meshed once per geometry and mesh size.
+
+    At most :data:`FIBRE_MESH_CACHE_SIZE` meshes are kept.
+
+    :param points: Vertices of the polygon [[y, z], ...], closed or not.
+    :param mesh_size: Size of the fibres [m].
+    :param holes: Vertices of the holes inside the polygon.
+    """
+    key = fingerprint(
+        np.asarray(points, dtype=np.float64),
+        [np.asarray(hole, dtype=np.float64) for hole in holes],
+        mesh_size,
+    )
+    mesh = _meshes.get(key)
+    if mesh is None:
+        mesh = FibreMesh(*mesh_polygon(points, mesh_size, holes))
+        for array in mesh:
+            array.flags.writeable = False
+        _meshes[key] = mesh
+        if len(_meshes) > FIBRE_MESH_CACHE_SIZE:
+            _meshes.popitem(last=False)
+    else:
+        _meshes.move_to_end(key)
+    return mesh
+
+
+def clear_fibre_meshes() -> None:
+    """Remove all cached meshes."""
+    _meshes.clear()
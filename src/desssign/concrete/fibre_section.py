@@ -0,0 +1,317 @@
+"""Fibre model of reinforced concrete sections."""
+
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+from typing import NamedTuple
+
+import numpy as np
+
+from desssign.concrete.fibre_mesh import get_fibre_mesh
+from desssign.concrete.stress_strain_profile import CompiledProfiles
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+    from desssign.concrete.stress_strain_profile import StressStrainProfile
+
+
+class Rebar(NamedTuple):
+    """
+    Reinforcing bar of a fibre section.
+
+    :param y: Coordinate y of the centre of the bar [m].
+    :param z: Coordinate z of the centre of the bar [m].
+    :param diameter: Diameter of the bar [m].
+    :param profile: Stress-strain profile of the reinforcement.
+    """
+
+    y: float
+    z: float
+    diameter: float
+    profile: StressStrainProfile
+
+    @property
+    def area(self) -> float:
+        """Area of the bar [m2]."""
+        return math.pi * self.diameter**2 / 4
+
+
+class FibreSection:
+    """
+    Fibre model of a reinforced concrete section.
+
+    The strains follow a plane ε(y, z) = ε0 + κy·(z - zc) - κz·(y - yc) around the centroid
+    (yc, zc) of the concrete polygon, so positive curvatures give positive bending moments.
+    The resultants are N = ∫sigma dA, My = ∫sigma·(z - zc) dA and Mz = -∫sigma·(y - yc) dA.
+    All methods are vectorised over any number of strain planes.
+
+    Tension is positive, SI units are used.
+
+    :param points: Vertices of the concrete polygon [[y, z], ...] [m].
+    :param concrete_profile: Stress-strain profile of the concrete.
+    :param rebars: Reinforcing bars, their area displaces the concrete.
+    :param mesh_size: Size of the concrete fibres [m], the mesh is shared by equal polygons,
+                      see :func:`get_fibre_mesh`.
+    :param compression_strain: Strain of the concrete in pure compression (e.g. ε_c2), the ultimate
+                               strain planes of neutral axes below the section pivot about it,
+                               see EN 1992-1-1, 6.1(5).
+    :param holes: Vertices of the holes in the concrete polygon [m].
+    """
+
+    def __init__(
+        self,
+        points: Sequence[Sequence[float]],
+        concrete_profile: StressStrainProfile,
+        rebars: Sequence[Rebar] = (),
+        mesh_size: float = 0.01,
+        compression_strain: float | None = None,
+        holes: Sequence[Sequence[Sequence[float]]] = (),
+    ) -> None:
+        """Init the FibreSection object."""
+        self.points = np.asarray(points, dtype=np.float64)
+        self.holes = [np.asarray(hole, dtype=np.float64) for hole in holes]
+        self.concrete_profile = concrete_profile
+        self.rebars = list(rebars)
+        self.mesh_size = mesh_size
+        self.compression_strain = compression_strain
+
+        mesh = get_fibre_mesh(self.points, mesh_size, self.holes)
+        self.gross_area = mesh.total_area
+        self.y_c, self.z_c = mesh.centroid
+        self.area = mesh.area
+        self.dy, self.dz = mesh.y - self.y_c, mesh.z - self.z_c
+
+        self.rebar_dy = np.array([rebar.y for rebar in self.rebars]) - self.y_c
+        self.rebar_dz = np.array([rebar.z for rebar in self.rebars]) - self.z_c
+        self.rebar_area = np.array([rebar.area for rebar in self.rebars])
+        # Distinct profiles of the bars and the index of the profile of every bar
+        self.rebar_profiles: list[StressStrainProfile] = []
+        rebar_ids = []
+        for rebar in self.rebars:
+            if rebar.profile not in self.rebar_profiles:
+                self.rebar_profiles.append(rebar.profile)
+            rebar_ids.append(self.rebar_profiles.index(rebar.profile))
+        self.rebar_ids = np.array(rebar_ids, dtype=int)
+        # The concrete displaced by the bars and the bars, evaluated together
+        self.materials = CompiledProfiles([concrete_profile, *self.rebar_profiles])
+        self.material_ids = np.vstack((np.zeros_like(self.rebar_ids), self.rebar_ids + 1))
+
+    def __repr__(self) -> str:
+        """Return a string representation of FibreSection object."""
+        return f"{self.__class__.__name__}(fibres={self.area.size}, rebars={len(self.rebars)})"
+
+    @staticmethod
+    def get_strains(
+        eps_0: npt.ArrayLike,
+        kappa_y: npt.ArrayLike,
+        kappa_z: npt.ArrayLike,
+        dy: npt.NDArray[np.float64],
+        dz: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the strains of the points of the strain planes.
+
+        :param eps_0: Strains at the centroid, one per strain plane.
+        :param kappa_y: Curvatures about the y-axis [1/m].
+        :param kappa_z: Curvatures about the z-axis [1/m].
+        :param dy: Coordinates y of the points relative to the centroid [m].
+        :param dz: Coordinates z of the points relative to the centroid [m].
+        :return: Strains of shape (*planes, n_points).
+        """
+        return (
+            np.asarray(eps_0, dtype=np.float64)[..., np.newaxis]
+            + np.asarray(kappa_y, dtype=np.float64)[..., np.newaxis] * dz
+            - np.asarray(kappa_z, dtype=np.float64)[..., np.newaxis] * dy
+        )
+
+    def get_forces(
+        self,
+        eps_0: npt.ArrayLike,
+        kappa_y: npt.ArrayLike = 0.0,
+        kappa_z: npt.ArrayLike = 0.0,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Integrate the stresses of the strain planes over the section.
+
+        :param eps_0: Strains at the centroid, one per strain plane.
+        :param kappa_y: Curvatures about the y-axis [1/m].
+        :param kappa_z: Curvatures about the z-axis [1/m].
+        :return: Axial forces N [N] and bending moments My and Mz [Nm] of the planes.
+        """
+        eps_0, kappa_y, kappa_z = np.broadcast_arrays(eps_0, kappa_y, kappa_z)
+
+        strains = self.get_strains(eps_0, kappa_y, kappa_z, self.dy, self.dz)
+        forces = self.concrete_profile.get_stresses(strains) * self.area
+        n = forces.sum(axis=-1)
+        m_y = forces @ self.dz
+        m_z = -(forces @ self.dy)
+
+        if self.rebars:
+            strains = self.get_strains(eps_0, kappa_y, kappa_z, self.rebar_dy, self.rebar_dz)
+            stresses = self.materials.get_stresses(strains[..., np.newaxis, :], self.material_ids)
+            forces = (stresses[..., 1, :] - stresses[..., 0, :]) * self.rebar_area
+            n = n + forces.sum(axis=-1)
+            m_y = m_y + forces @ self.rebar_dz
+            m_z = m_z - forces @ self.rebar_dy
+
+        return n, m_y, m_z
+
+    def get_ultimate_planes(
+        self, depths: npt.ArrayLike, theta: npt.ArrayLike = 0.0
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Return the ultimate strain planes of the neutral axis depths.
+
+        The compressed side of the section faces the direction (cos θ, sin θ). The most compressed
+        concrete fibre reaches the ultimate strain of the concrete profile, unless the most
+        stretched bar reaches the ultimate strain of its profile first. Planes of neutral axes
+        below the section pivot about the :attr:`compression_strain` if it is set.
+
+        :param depths: Depths of the neutral axis below the most compressed fibre [m].
+        :param theta: Angles of the compressed side from the y-axis [rad], broadcast against `depths`.
+        :return: Strains at the centroid and curvatures about the y- and z-axis of the planes.
+        """
+        depths, theta = np.broadcast_arrays(
+            np.asarray(depths, dtype=np.float64), np.asarray(theta, dtype=np.float64)
+        )
+        cos, sin = np.cos(theta), np.sin(theta)
+        s = (
+            (self.points[:, 0] - self.y_c) * cos[..., np.newaxis]
+            + (self.points[:, 1] - self.z_c) * sin[..., np.newaxis]
+        )
+        s_max, height = np.max(s, axis=-1), np.ptp(s, axis=-1)
+
+        eps_cu = abs(self.concrete_profile.min_strain)
+        kappa = eps_cu / depths
+        if self.compression_strain is not None:
+            eps_c = abs(self.compression_strain)
+            # Depth of the pivot below the most compressed fibre
+            pivot = height * (1 - eps_c / eps_cu)
+            with np.errstate(divide="ignore"):
+                kappa = np.where(depths > height, eps_c / (depths - pivot), kappa)
+        if self.rebars:
+            # Depths of the bars below the most compressed fibre and their ultimate strains
+            rebar_depths = s_max[..., np.newaxis] - (
+                self.rebar_dy * cos[..., np.newaxis] + self.rebar_dz * sin[..., np.newaxis]
+            )
+            eps_su = np.array([profile.max_strain for profile in self.rebar_profiles])[self.rebar_ids]
+            with np.errstate(divide="ignore"):
+                limits = np.where(
+                    rebar_depths > depths[..., np.newaxis],
+                    eps_su / (rebar_depths - depths[..., np.newaxis]),
+                    np.inf,
+                )
+            kappa = np.minimum(kappa, limits.min(axis=-1))
+
+        return kappa * (s_max - depths), -kappa * sin, kappa * cos
+
+    def get_ultimate_depths(
+        self,
+        n_ed: npt.ArrayLike = 0.0,
+        theta: float = 0.0,
+        iterations: int = 60,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the depths of the neutral axis of the ultimate strain planes of the axial forces.
+
+        The depth of every axial force is found by a bisection evaluated for all axial forces
+        at once. Axial forces outside the range of the ultimate strain planes give NaN.
+
+        :param n_ed: Design axial forces [N].
+        :param theta: Angle of the compressed side from the y-axis [rad], see :meth:`get_ultimate_planes`.
+        :param iterations: Number of bisection steps.
+        :return: Depths of the neutral axis below the most compressed fibre [m].
+        """
+        n_ed = np.asarray(n_ed, dtype=np.float64)
+        height = float(np.ptp(self.points @ [math.cos(theta), math.sin(theta)]))
+
+        # N decreases (more compression) with the depth, the bisection runs on a log scale
+        low = np.full(n_ed.shape, 1e-6 * height)
+        high = np.full(n_ed.shape, 1e3 * height)
+        n_low = self.get_forces(*self.get_ultimate_planes(low, theta))[0]
+        n_high = self.get_forces(*self.get_ultimate_planes(high, theta))[0]
+        valid = (n_high <= n_ed) & (n_ed <= n_low)
+
+        for _ in range(iterations):
+            middle = np.sqrt(low * high)
+            n_middle = self.get_forces(*self.get_ultimate_planes(middle, theta))[0]
+            deeper = n_middle > n_ed
+            low = np.where(deeper, middle, low)
+            high = np.where(deeper, high, middle)
+
+        return np.where(valid, np.sqrt(low * high), np.nan)
+
+    def get_moment_resistance(
+        self,
+        n_ed: npt.ArrayLike = 0.0,
+        theta: float = 0.0,
+        iterations: int = 60,
+    ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """
+        Return the moment resistance for the axial forces.
+
+        Axial forces outside the range of the ultimate strain planes give NaN,
+        see :meth:`get_ultimate_depths`.
+
+        :param n_ed: Design axial forces [N].
+        :param theta: Angle of the compressed side from the y-axis [rad], see :meth:`get_ultimate_planes`.
+        :param iterations: Number of bisection steps.
+        :return: Bending moments My and Mz of resistance [Nm].
+        """
+        depths = self.get_ultimate_depths(n_ed, theta, iterations)
+        valid = np.isfinite(depths)
+        _, m_y, m_z = self.get_forces(
+            *self.get_ultimate_planes(np.where(valid, depths, 1.0), theta)
+        )
+        return np.where(valid, m_y, np.nan), np.where(valid, m_z, np.nan)
+
+    def get_axial_strains(
+        self,
+        n_ed: float,
+        kappa_y: npt.ArrayLike = 0.0,
+        kappa_z: npt.ArrayLike = 0.0,
+        iterations: int = 60,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the strains at the centroid in equilibrium with the axial force for the curvatures.
+
+        The strain of every pair of curvatures is found by a bisection evaluated for all
+        curvatures at once, between the planes reaching the minimum and the maximum strain
+        of the profiles. Curvatures without equilibrium in this range give NaN.
+
+        :param n_ed: Design axial force [N].
+        :param kappa_y: Curvatures about the y-axis [1/m].
+        :param kappa_z: Curvatures about the z-axis [1/m].
+        :param iterations: Number of bisection steps.
+        """
+        kappa_y, kappa_z = np.broadcast_arrays(
+            np.asarray(kappa_y, dtype=np.float64), np.asarray(kappa_z, dtype=np.float64)
+        )
+        # Strains of the vertices and bars relative to the strain at the centroid
+        dy = np.concatenate((self.points[:, 0] - self.y_c, self.rebar_dy))
+        dz = np.concatenate((self.points[:, 1] - self.z_c, self.rebar_dz))
+        offsets = self.get_strains(0.0, kappa_y, kappa_z, dy, dz)
+        max_strain = max(
+            [self.concrete_profile.max_strain]
+            + [profile.max_strain for profile in self.rebar_profiles]
+        )
+
+        # N increases with the strain at the centroid
+        low = self.concrete_profile.min_strain - offsets.min(axis=-1)
+        high = max_strain - offsets.max(axis=-1)
+        n_low = self.get_forces(low, kappa_y, kappa_z)[0]
+        n_high = self.get_forces(high, kappa_y, kappa_z)[0]
+        valid = (low <= high) & (n_low <= n_ed) & (n_ed <= n_high)
+
+        for _ in range(iterations):
+            middle = (low + high) / 2
+            n_middle = self.get_forces(middle, kappa_y, kappa_z)[0]
+            above = n_middle > n_ed
+            low = np.where(above, low, middle)
+            high = np.where(above, middle, high)
+
+        return np.where(valid, (low + high) / 2, np.nan)
@@ -0,0 +1,303 @@
+"""Axial force - bending moment interaction diagrams and surfaces of concrete sections."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+from scipy.spatial import ConvexHull
+
+from desssign.common.fingerprint import fingerprint
+from desssign.concrete.constants import INTERACTION_DIAGRAM_CACHE_SIZE
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from desssign.concrete.concrete_section import ConcreteSection
+    from desssign.concrete.fibre_section import FibreSection
+
+# Angles of the compressed side of the section giving positive and negative moments
+AXIS_ANGLES = {"y": (-math.pi / 2, math.pi / 2), "z": (0.0, math.pi)}
+
+
+class InteractionDiagram:
+    """
+    Interaction diagram of the axial force and a bending moment of a section.
+
+    The diagram is a closed polygon of resistances (N, M). The usage of (N_Ed, M_Ed) is
+    the ratio of its distance from the origin to the distance of the boundary along the
+    same ray, i.e. the load factor of proportional loading.
+
+    :param n: Axial forces of the vertices of the diagram [N].
+    :param m: Bending moments of the vertices of the diagram [Nm].
+    """
+
+    def __init__(self, n: npt.ArrayLike, m: npt.ArrayLike) -> None:
+        """Init the InteractionDiagram object."""
+        self.n = np.asarray(n, dtype=np.float64)
+        self.m = np.asarray(m, dtype=np.float64)
+
+    def __repr__(self) -> str:
+        """Return a string representation of InteractionDiagram object."""
+        return f"{self.__class__.__name__}(vertices={self.n.size})"
+
+    @classmethod
+    def from_fibre_section(
+        cls,
+        fibre_section: FibreSection,
+        axis: str = "y",
+        n_depths: int = 100,
+    ) -> InteractionDiagram:
+        """
+        Sweep the ultimate strain planes of the section for both signs of the bending moment.
+
+        :param fibre_section: The fibre model of the section.
+        :param axis: Axis of the bending moment, 'y' or 'z'.
+        :param n_depths: Number of neutral axis depths per sign of the bending moment.
+        """
+        index = "yz".index(axis) + 1
+        height = float(np.ptp(fibre_section.points[:, 2 - index]))
+        # From nearly pure tension to pure compression
+        depths = np.geomspace(1e-4 * height, 1e3 * height, n_depths)
+
+        branches = []
+        for theta in AXIS_ANGLES[axis]:
+            forces = fibre_section.get_forces(*fibre_section.get_ultimate_planes(depths, theta))
+            branches.append((forces[0], forces[index]))
+
+        (n_positive, m_positive), (n_negative, m_negative) = branches
+        return cls(
+            np.concatenate((n_positive, n_negative[::-1])),
+            np.concatenate((m_positive, m_negative[::-1])),
+        )
+
+    def get_usages(
+        self,
+        n_ed: npt.ArrayLike,
+        m_ed: npt.ArrayLike,
+        chunk_size: int = 4096,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the usages of the internal forces, e.g. of all combinations and points of a member.
+
+        Forces whose ray from the origin crosses no edge, e.g. outside a diagram not containing
+        the origin, get infinite usages.
+
+        :param n_ed: Design axial forces [N].
+        :param m_ed: Design bending moments [Nm], broadcast against `n_ed`.
+        :param chunk_size: Number of points intersected with all edges at once.
+        """
+        n_ed, m_ed = np.broadcast_arrays(
+            np.asarray(n_ed, dtype=np.float64), np.asarray(m_ed, dtype=np.float64)
+        )
+        points_n, points_m = n_ed.ravel(), m_ed.ravel()
+
+        # Edges A -> A + D of the closed polygon
+        a_n, a_m = self.n, self.m
+        d_n, d_m = np.roll(a_n, -1) - a_n, np.roll(a_m, -1) - a_m
+        a_cross_d = a_n * d_m - a_m * d_n
+
+        usages = np.empty(points_n.shape)
+        for start in range(0, points_n.size, chunk_size):
+            p_n = points_n[start : start + chunk_size, np.newaxis]
+            p_m = points_m[start : start + chunk_size, np.newaxis]
+            # The ray t·P crosses the edge at A + s·D,
+            # t = cross(A, D) / cross(P, D) and s = cross(A, P) / cross(P, D)
+            p_cross_d = p_n * d_m - p_m * d_n
+            with np.errstate(divide="ignore", invalid="ignore"):
+                t = a_cross_d / p_cross_d
+                s = (a_n * p_m - a_m * p_n) / p_cross_d
+            t = np.where((s >= 0.0) & (s <= 1.0) & (t > 0.0), t, np.inf).min(axis=1)
+            # Rays crossing no edge never reach the resistance
+            with np.errstate(divide="ignore"):
+                usages[start : start + chunk_size] = np.where(np.isinf(t), np.inf, 1.0 / t)
+
+        usages[(points_n == 0.0) & (points_m == 0.0)] = 0.0
+        return usages.reshape(n_ed.shape)
+
+
+class InteractionSurface:
+    """
+    Interaction surface of the axial force and the bending moments about both axes of a section.
+
+    The surface is the convex hull of resistances (N, My, Mz), stored as the planes
+    n·x + c = 0 of its facets, with the outward normals n and c < 0 as the origin is inside.
+    The usage of (N_Ed, My_Ed, Mz_Ed) is the load factor of proportional loading,
+    i.e. the maximum of n·p / -c over all facets. The forces are scaled by :attr:`scale`
+    to condition the hull.
+
+    :param points: Resistances (N, My, Mz) on the surface, shape (n_points, 3) [N, Nm, Nm].
+    """
+
+    def __init__(self, points: npt.ArrayLike) -> None:
+        """Init the InteractionSurface object."""
+        self.points = np.asarray(points, dtype=np.float64)
+        self.scale = np.max(np.abs(self.points), axis=0)
+        hull = ConvexHull(self.points / self.scale)
+        # Facets of the hull as n·x + c <= 0 inside
+        self.normals = hull.equations[:, :3]
+        self.offsets = hull.equations[:, 3]
+
+    def __repr__(self) -> str:
+        """Return a string representation of InteractionSurface object."""
+        return f"{self.__class__.__name__}(facets={self.offsets.size})"
+
+    @classmethod
+    def from_fibre_section(
+        cls,
+        fibre_section: FibreSection,
+        n_angles: int = 36,
+        n_depths: int = 50,
+    ) -> InteractionSurface:
+        """
+        Sweep the ultimate strain planes of the section over angles and depths of the neutral axis.
+
+        All strain planes are integrated in a single vectorised call.
+
+        :param fibre_section: The fibre model of the section.
+        :param n_angles: Number of angles of the neutral axis.
+        :param n_depths: Number of neutral axis depths per angle.
+        """
+        theta = np.linspace(0.0, 2 * math.pi, n_angles, endpoint=False)[:, np.newaxis]
+        heights = np.ptp(
+            fibre_section.points[:, 0] * np.cos(theta) + fibre_section.points[:, 1] * np.sin(theta),
+            axis=-1,
+            keepdims=True,
+        )
+        # From nearly pure tension to pure compression
+        depths = heights * np.geomspace(1e-4, 1e3, n_depths)
+
+        n, m_y, m_z = fibre_section.get_forces(*fibre_section.get_ultimate_planes(depths, theta))
+        return cls(np.column_stack((n.ravel(), m_y.ravel(), m_z.ravel())))
+
+    def get_usages(
+        self,
+        n_ed: npt.ArrayLike,
+        m_y_ed: npt.ArrayLike,
+        m_z_ed: npt.ArrayLike,
+        chunk_size: int = 4096,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the usages of the internal forces, e.g. of all combinations and points of a member.
+
+        :param n_ed: Design axial forces [N].
+        :param m_y_ed: Design bending moments about the y-axis [Nm].
+        :param m_z_ed: Design bending moments about the z-axis [Nm].
+        :param chunk_size: Number of points evaluated against all facets at once.
+        """
+        n_ed, m_y_ed, m_z_ed = np.broadcast_arrays(
+            np.asarray(n_ed, dtype=np.float64),
+            np.asarray(m_y_ed, dtype=np.float64),
+            np.asarray(m_z_ed, dtype=np.float64),
+        )
+        points = np.column_stack((n_ed.ravel(), m_y_ed.ravel(), m_z_ed.ravel())) / self.scale
+        # Every facet gives n·p / -c, the ray leaves the hull through the facet of the maximum
+        directions = self.normals.T / -self.offsets
+
+        usages = np.empty(points.shape[0])
+        for start in range(0, points.shape[0], chunk_size):
+            chunk = points[start : start + chunk_size]
+            usages[start : start + chunk_size] = np.max(chunk @ directions, axis=1)
+        return np.maximum(usages, 0.0).reshape(n_ed.shape)
+
+
+# Interaction diagrams and surfaces shared by all sections of equal geometry and materials,
+# the least recently used are dropped first
+_diagrams: OrderedDict[str, InteractionDiagram | InteractionSurface] = OrderedDict()
+
+
+def _get_cached(key: str) -> InteractionDiagram | InteractionSurface | None:
+    """Return the cached diagram or surface of the key, marked as the most recently used."""
+    diagram = _diagrams.get(key)
+    if diagram is not None:
+        _diagrams.move_to_end(key)
+    return diagram
+
+
+def _cache(key: str, diagram: InteractionDiagram | InteractionSurface) -> None:
+    """Cache the diagram or surface, dropping the least recently used one above the size of the cache."""
+    _diagrams[key] = diagram
+    if len(_diagrams) > INTERACTION_DIAGRAM_CACHE_SIZE:
+        _diagrams.popitem(last=False)
+
+
+def get_interaction_diagram(
+    section: ConcreteSection,
+    limit_state: str = "ULS",
+    axis: str = "y",
+    mesh_size: float = 0.01,
+    n_depths: int = 100,
+) -> InteractionDiagram:
+    """
+    Return the interaction diagram of the section, computed once per geometry, materials and limit state.
+
+    At most :data:`INTERACTION_DIAGRAM_CACHE_SIZE` diagrams and surfaces are kept.
+
+    :param section: The concrete section with reinforcement.
+    :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+    :param axis: Axis of the bending moment, 'y' or 'z'.
+    :param mesh_size: Size of the concrete fibres [m].
+    :param n_depths: Number of neutral axis depths per sign of the bending moment.
+    """
+    key = fingerprint(
+        section.points,
+        section.rebars,
+        section.material,
+        section.rebar_material,
+        limit_state.upper(),
+        axis,
+        mesh_size,
+        n_depths,
+    )
+    diagram = _get_cached(key)
+    if diagram is None:
+        diagram = InteractionDiagram.from_fibre_section(
+            section.get_fibre_section(limit_state, mesh_size), axis, n_depths
+        )
+        _cache(key, diagram)
+    return diagram  # type: ignore[return-value]
+
+
+def get_interaction_surface(
+    section: ConcreteSection,
+    limit_state: str = "ULS",
+    mesh_size: float = 0.01,
+    n_angles: int = 36,
+    n_depths: int = 50,
+) -> InteractionSurface:
+    """
+    Return the interaction surface of the section, computed once per geometry, materials and limit state.
+
+    At most :data:`INTERACTION_DIAGRAM_CACHE_SIZE` diagrams and surfaces are kept.
+
+    :param section: The concrete section with reinforcement.
+    :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+    :param mesh_size: Size of the concrete fibres [m].
+    :param n_angles: Number of angles of the neutral axis.
+    :param n_depths: Number of neutral axis depths per angle.
+    """
+    key = fingerprint(
+        section.points,
+        section.rebars,
+        section.material,
+        section.rebar_material,
+        limit_state.upper(),
+        "biaxial",
+        mesh_size,
+        n_angles,
+        n_depths,
+    )
+    surface = _get_cached(key)
+    if surface is None:
+        surface = InteractionSurface.from_fibre_section(
+            section.get_fibre_section(limit_state, mesh_size), n_angles, n_depths
+        )
+        _cache(key, surface)
+    return surface  # type: ignore[return-value]
+
+
+def clear_interaction_diagrams() -> None:
+    """Remove all cached interaction diagrams and surfaces."""
+    _diagrams.clear()
@@ -0,0 +1,331 @@
+"""Moment-curvature relations of concrete sections."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from desssign.common.fingerprint import fingerprint
+from desssign.concrete.constants import MOMENT_CURVATURE_CACHE_SIZE
+from desssign.concrete.interaction_diagram import AXIS_ANGLES
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from desssign.concrete.concrete_section import ConcreteSection
+    from desssign.concrete.fibre_section import FibreSection
+
+
+class MomentCurvature:
+    """
+    Moment-curvature relation of a section under a constant axial force.
+
+    The relation is a piecewise linear table of strictly increasing curvatures, its
+    interpolation preserves the monotonicity of every segment. Moments of curvatures
+    outside the table are the moments of its ends.
+
+    :param curvatures: Curvatures of the table [1/m].
+    :param moments: Bending moments of the curvatures [Nm].
+    :param n_ed: Axial force of the relation [N].
+    """
+
+    def __init__(
+        self,
+        curvatures: npt.ArrayLike,
+        moments: npt.ArrayLike,
+        n_ed: float = 0.0,
+    ) -> None:
+        """Init the MomentCurvature object."""
+        self.curvatures = np.array(curvatures, dtype=np.float64)
+        self.moments = np.array(moments, dtype=np.float64)
+        self.n_ed = n_ed
+
+        if self.curvatures.shape != self.moments.shape or self.curvatures.size < 2:
+            raise ValueError("Moment-curvature table requires at least two pairs of values.")
+        if not np.all(np.diff(self.curvatures) > 0):
+            raise ValueError("Curvatures of the moment-curvature table must be increasing.")
+
+        # Slopes of the segments, the tangent stiffness outside the table is zero
+        self.slopes = np.concatenate(
+            ([0.0], np.diff(self.moments) / np.diff(self.curvatures), [0.0])
+        )
+        for array in (self.curvatures, self.moments, self.slopes):
+            array.flags.writeable = False
+
+    def __repr__(self) -> str:
+        """Return a string representation of MomentCurvature object."""
+        return f"{self.__class__.__name__}(n_ed={self.n_ed:.3e}, points={self.curvatures.size})"
+
+    @classmethod
+    def from_fibre_section(
+        cls,
+        fibre_section: FibreSection,
+        n_ed: float = 0.0,
+        axis: str = "y",
+        n_points: int = 50,
+        iterations: int = 60,
+    ) -> MomentCurvature:
+        """
+        Sweep the curvatures of both signs up to the ultimate curvatures of the axial force.
+
+        The curvatures grow geometrically from 1/1000 of the ultimate curvature, so cracking is
+        resolved as well as yielding. The strains at the centroid of all curvatures are found
+        by a single vectorised bisection, see :meth:`FibreSection.get_axial_strains`, the table
+        ends with the ultimate strain planes of the axial force.
+
+        :param fibre_section: The fibre model of the section.
+        :param n_ed: Axial force [N].
+        :param axis: Axis of the bending moment, 'y' or 'z'.
+        :param n_points: Number of curvatures per sign.
+        :param iterations: Number of bisection steps.
+        """
+        index = "yz".index(axis) + 1
+
+        # Ultimate strain planes of the positive and negative moments
+        planes = []
+        for theta in AXIS_ANGLES[axis]:
+            depth = fibre_section.get_ultimate_depths(n_ed, theta, iterations)
+            if np.isnan(depth):
+                raise ValueError(f"Axial force {n_ed:.3e} N is outside the resistance of the section.")
+            planes.append(fibre_section.get_ultimate_planes(depth, theta))
+        ultimate = [float(plane[index]) for plane in planes]
+        ultimate_moments = [float(fibre_section.get_forces(*plane)[index]) for plane in planes]
+
+        # Curvatures below the ultimate ones, whose moments follow from the equilibrium of N
+        steps = np.geomspace(1e-3, 1.0, n_points)[:-1]
+        curvatures = np.concatenate((ultimate[1] * steps[::-1], [0.0], ultimate[0] * steps))
+        kappa_y, kappa_z = (curvatures, 0.0) if axis == "y" else (0.0, curvatures)
+        eps_0 = fibre_section.get_axial_strains(n_ed, kappa_y, kappa_z, iterations)
+        moments = fibre_section.get_forces(eps_0, kappa_y, kappa_z)[index]
+
+        curvatures = np.concatenate(([ultimate[1]], curvatures, [ultimate[0]]))
+        moments = np.concatenate(([ultimate_moments[1]], moments, [ultimate_moments[0]]))
+        valid = np.isfinite(moments)
+        return cls(curvatures[valid], moments[valid], n_ed)
+
+    def get_moments(self, curvatures: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Return the bending moments of the curvatures.
+
+        :param curvatures: Curvatures [1/m].
+        """
+        return np.interp(curvatures, self.curvatures, self.moments)
+
+    def get_tangent_stiffness(self, curvatures: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Return the tangent bending stiffness dM/dκ of the curvatures, zero outside the table.
+
+        :param curvatures: Curvatures [1/m].
+        """
+        return self.slopes[np.searchsorted(self.curvatures, curvatures, side="right")]
+
+    def get_secant_stiffness(self, curvatures: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Return the secant bending stiffness M/κ of the curvatures, the tangent one at zero curvature.
+
+        :param curvatures: Curvatures [1/m].
+        """
+        curvatures = np.asarray(curvatures, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            secant = self.get_moments(curvatures) / curvatures
+        return np.where(curvatures == 0.0, self.get_tangent_stiffness(curvatures), secant)
+
+    def to_framesss(self) -> npt.NDArray[np.float64]:
+        """
+        Return the table in the format of :attr:`framesss.pre.section.Section.moment_curvature`.
+
+        The rows are the bending moments and the curvatures, the moments have the opposite sign
+        as framesss takes the stiffness as -dM/dκ.
+        """
+        return np.vstack((-self.moments, self.curvatures))
+
+
+class MomentCurvatureTables:
+    """
+    Moment-curvature relations of a section on a fixed grid of axial forces.
+
+    The relations of the grid are computed lazily, a relation of any axial force
+    is interpolated linearly between the two neighbouring ones. Curvatures are
+    interpolated relative to the ultimate curvatures of every sign, so the relations
+    of all axial forces end at their ultimate strain planes.
+
+    :param fibre_section: The fibre model of the section.
+    :param axis: Axis of the bending moment, 'y' or 'z'.
+    :param n_levels: Number of axial forces of the grid of each sign, up to the resistances
+                     in pure compression and in pure tension.
+    :param n_points: Number of curvatures per sign.
+    """
+
+    def __init__(
+        self,
+        fibre_section: FibreSection,
+        axis: str = "y",
+        n_levels: int = 40,
+        n_points: int = 50,
+    ) -> None:
+        """Init the MomentCurvatureTables object."""
+        self.fibre_section = fibre_section
+        self.axis = axis
+        self.n_points = n_points
+
+        # Resistances in pure compression and tension of both signs of the bending moment
+        n_compression, n_tension = [], []
+        for theta in AXIS_ANGLES[axis]:
+            height = float(np.ptp(fibre_section.points @ [np.cos(theta), np.sin(theta)]))
+            planes = fibre_section.get_ultimate_planes([1e3 * height, 1e-6 * height], theta)
+            n_compression_theta, n_tension_theta = fibre_section.get_forces(*planes)[0]
+            n_compression.append(n_compression_theta)
+            n_tension.append(n_tension_theta)
+        # Inside the resistances, where the ultimate depths are found reliably. The levels are
+        # graded towards pure bending, where the cracking changes the relations the most
+        grading = np.linspace(0.0, 0.999, n_levels + 1)[1:] ** 2
+        self.axial_forces = np.concatenate(
+            (max(n_compression) * grading[::-1], [0.0], min(n_tension) * grading)
+        )
+
+        steps = np.geomspace(1e-3, 1.0, n_points)
+        # Curvatures relative to the ultimate curvature of their sign
+        self.relative_curvatures = np.concatenate((-steps[::-1], [0.0], steps))
+        self.levels: dict[int, MomentCurvature] = {}
+
+    def __repr__(self) -> str:
+        """Return a string representation of MomentCurvatureTables object."""
+        return (
+            f"{self.__class__.__name__}(levels={self.axial_forces.size}, "
+            f"computed={len(self.levels)})"
+        )
+
+    def get_level(self, index: int) -> tuple[float, float, npt.NDArray[np.float64]]:
+        """
+        Return the relation of an axial force of the grid, computed on first use.
+
+        :param index: Index of the axial force in :attr:`axial_forces`.
+        :return: The ultimate negative and positive curvatures [1/m] and the moments [Nm]
+                 of :attr:`relative_curvatures`.
+        """
+        relation = self.levels.get(index)
+        if relation is None:
+            relation = MomentCurvature.from_fibre_section(
+                self.fibre_section, float(self.axial_forces[index]), self.axis, self.n_points
+            )
+            self.levels[index] = relation
+
+        curvatures = relation.curvatures
+        kappa_negative, kappa_positive = float(curvatures[0]), float(curvatures[-1])
+        relative = np.where(
+            curvatures < 0.0, -curvatures / kappa_negative, curvatures / kappa_positive
+        )
+        moments = np.interp(self.relative_curvatures, relative, relation.moments)
+        return kappa_negative, kappa_positive, moments
+
+    def get_relation(self, n_ed: float = 0.0) -> MomentCurvature:
+        """
+        Return the relation of the axial force, interpolated between the axial forces of the grid.
+
+        :param n_ed: Axial force [N].
+        """
+        if not self.axial_forces[0] <= n_ed <= self.axial_forces[-1]:
+            raise ValueError(f"Axial force {n_ed:.3e} N is outside the resistance of the section.")
+
+        index = min(
+            int(np.searchsorted(self.axial_forces, n_ed, side="right")) - 1,
+            self.axial_forces.size - 2,
+        )
+        n_lower, n_upper = self.axial_forces[index], self.axial_forces[index + 1]
+        weight = float((n_ed - n_lower) / (n_upper - n_lower))
+        if weight == 0.0:
+            levels = [(self.get_level(index), 1.0)]
+        elif weight == 1.0:
+            levels = [(self.get_level(index + 1), 1.0)]
+        else:
+            levels = [(self.get_level(index), 1.0 - weight), (self.get_level(index + 1), weight)]
+
+        kappa_negative = sum(level[0] * factor for level, factor in levels)
+        kappa_positive = sum(level[1] * factor for level, factor in levels)
+        moments = sum(level[2] * factor for level, factor in levels)
+        curvatures = self.relative_curvatures * np.where(
+            self.relative_curvatures < 0.0, -kappa_negative, kappa_positive
+        )
+        return MomentCurvature(curvatures, moments, n_ed)
+
+
+# Moment-curvature tables of the recently used sections, the least recently used are dropped
+_tables: OrderedDict[str, MomentCurvatureTables] = OrderedDict()
+
+
+def get_moment_curvature_tables(
+    section: ConcreteSection,
+    limit_state: str = "SLS",
+    axis: str = "y",
+    effective_creep_ratio: float = 0.0,
+    mesh_size: float = 0.01,
+) -> MomentCurvatureTables:
+    """
+    Return the moment-curvature tables of the section, shared by sections of equal geometry and materials.
+
+    In SLS the concrete follows the non-linear profile with tension softening, in ULS
+    the parabolic-rectangular profile without tension. At most
+    :data:`MOMENT_CURVATURE_CACHE_SIZE` tables are kept.
+
+    :param section: The concrete section.
+    :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+    :param axis: Axis of the bending moment, 'y' or 'z'.
+    :param effective_creep_ratio: Effective creep ratio of the concrete.
+    :param mesh_size: Size of the concrete fibres [m].
+    """
+    key = fingerprint(
+        section.points,
+        section.rebars,
+        section.material,
+        section.rebar_material,
+        limit_state.upper(),
+        axis,
+        float(effective_creep_ratio),
+        mesh_size,
+    )
+    tables = _tables.get(key)
+    if tables is None:
+        fibre_section = section.get_fibre_section(
+            limit_state,
+            mesh_size,
+            tension_softening=limit_state.upper() == "SLS",
+            effective_creep_ratio=effective_creep_ratio,
+        )
+        tables = MomentCurvatureTables(fibre_section, axis)
+        _tables[key] = tables
+        if len(_tables) > MOMENT_CURVATURE_CACHE_SIZE:
+            _tables.popitem(last=False)
+    else:
+        _tables.move_to_end(key)
+    return tables
+
+
+def get_moment_curvature(
+    section: ConcreteSection,
+    n_ed: float = 0.0,
+    limit_state: str = "SLS",
+    axis: str = "y",
+    effective_creep_ratio: float = 0.0,
+) -> MomentCurvature:
+    """
+    Return the moment-curvature relation of the section under the axial force.
+
+    The relation is interpolated from the cached tables of the section, see
+    :func:`get_moment_curvature_tables`, so axial forces changing in every iteration
+    of a non-linear analysis reuse the same tables.
+
+    :param section: The concrete section.
+    :param n_ed: Axial force [N].
+    :param limit_state: Limit state of the stress-strain profiles, 'ULS' or 'SLS'.
+    :param axis: Axis of the bending moment, 'y' or 'z'.
+    :param effective_creep_ratio: Effective creep ratio of the concrete.
+    """
+    tables = get_moment_curvature_tables(section, limit_state, axis, effective_creep_ratio)
+    return tables.get_relation(n_ed)
+
+
+def clear_moment_curvatures() -> None:
+    """Remove all cached moment-curvature tables."""
+    _tables.clear()
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import NamedTuple
 
 from enum import StrEnum
 
 import numpy as np
 import matplotlib.pyplot as plt
 
+from desssign.common.fingerprint import fingerprint
 from desssign.common.utils import plotting_context
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     import numpy.typing as npt
     from desssign.concrete.concrete_material import ConcreteMaterial
     from desssign.concrete.rebar_material import RebarMaterial
@@ -70,6 +75,10 @@ class StressStrainProfile:
     :param stresses: Stresses in the material (MPa).
     :param strains: Strains in the material (1).
     """
+
+    # The compiled profile is derived from the strains and stresses, see `fingerprint`
+    fingerprint_excluded = ("compiled",)
+
     def __init__(
         self,
         strains: list[float] | npt.NDArray[np.float64],
@@ -108,6 +117,11 @@ class StressStrainProfile:
         """Return the maximum (maximum tension) strain in the material."""
         return float(np.max(self.strains))
 
+    @functools.cached_property
+    def compiled(self) -> CompiledProfiles:
+        """The profile compiled for the evaluation of stresses and tangent moduli."""
+        return CompiledProfiles([self])
+
     def get_stresses(
         self,
         strains: npt.NDArray[np.float64],
@@ -128,6 +142,21 @@ class StressStrainProfile:
             right=0.0
         )
 
+    def get_tangents(
+        self,
+        strains: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the tangent moduli of the material for given strains.
+
+        The modulus of a strain is the slope of the segment of the profile ending at it,
+        it is zero outside the range of the interval.
+
+        :param strains: Strains in the material.
+        :return: Tangent moduli of the material.
+        """
+        return self.compiled.get_tangents(strains)
+
     def plot_profile(
         self,
         title: str = "Stress-Strain Profile",
@@ -155,6 +184,99 @@ class StressStrainProfile:
         return ax
 
 
+class CompiledProfiles:
+    """
+    Piecewise linear stress-strain profiles compiled into segments sigma = slope·ε + intercept.
+
+    The breakpoints of every profile are scaled to the interval [0, 1] and shifted by twice
+    the index of the profile, so the segments of all profiles are sorted in one array and the
+    segment of any strain of any profile is found by a single :func:`numpy.searchsorted`.
+    Every profile is preceded and followed by segments of zero stress, as in
+    :meth:`StressStrainProfile.get_stresses`.
+
+    :param profiles: The stress-strain profiles, indexed by the material ids of the strains.
+    """
+    def __init__(self, profiles: Sequence[StressStrainProfile]) -> None:
+        self.profiles = list(profiles)
+
+        breakpoints, slopes, intercepts = [], [0.0], [0.0]
+        self.offsets = np.empty(len(self.profiles))
+        self.scales = np.empty(len(self.profiles))
+        self.first_strains = np.empty(len(self.profiles))
+        for index, profile in enumerate(self.profiles):
+            strains = np.asarray(profile.strains, dtype=np.float64)
+            stresses = np.asarray(profile.stresses, dtype=np.float64)
+            d_strains = np.diff(strains)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                slope = np.where(d_strains > 0.0, np.diff(stresses) / d_strains, 0.0)
+            intercept = np.where(d_strains > 0.0, stresses[:-1] - slope * strains[:-1], 0.0)
+
+            # Scaled breakpoints of the profile lie in [2 * index, 2 * index + 1]
+            self.scales[index] = 1.0 / max(strains[-1] - strains[0], np.finfo(float).tiny)
+            self.offsets[index] = 2 * index - strains[0] * self.scales[index]
+            breakpoints.append(strains * self.scales[index] + self.offsets[index])
+            slopes.extend([*slope, 0.0])
+            intercepts.extend([*intercept, 0.0])
+            self.first_strains[index] = strains[0]
+
+        self.breakpoints = np.concatenate(breakpoints)
+        self.slopes = np.array(slopes)
+        self.intercepts = np.array(intercepts)
+
+    def __repr__(self) -> str:
+        """Return a string representation of CompiledProfiles object."""
+        return f"{self.__class__.__name__}(profiles={len(self.profiles)}, segments={self.slopes.size})"
+
+    def get_segments(
+        self,
+        strains: npt.ArrayLike,
+        ids: npt.ArrayLike = 0,
+    ) -> npt.NDArray[np.intp]:
+        """
+        Return the indices of the segments of the strains.
+
+        A strain on a breakpoint falls in the segment ending at it, a strain on the first
+        breakpoint of its profile in the following one.
+
+        :param strains: Strains in the materials.
+        :param ids: Indices of the profiles of the strains, broadcast against `strains`.
+        """
+        strains = np.asarray(strains, dtype=np.float64)
+        ids = np.asarray(ids)
+        # Strains outside the range of their profile stay within the gaps around it
+        scaled = np.clip(strains * self.scales[ids] + self.offsets[ids], 2 * ids - 0.5, 2 * ids + 1.5)
+        segments = np.searchsorted(self.breakpoints, scaled, side="left")
+        return segments + (strains == self.first_strains[ids])
+
+    def get_stresses(
+        self,
+        strains: npt.ArrayLike,
+        ids: npt.ArrayLike = 0,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the stresses of the strains, zero outside the range of their profiles.
+
+        :param strains: Strains in the materials, e.g. of all fibres of a section stacked.
+        :param ids: Indices of the profiles of the strains, broadcast against `strains`.
+        """
+        strains = np.asarray(strains, dtype=np.float64)
+        segments = self.get_segments(strains, ids)
+        return self.slopes[segments] * strains + self.intercepts[segments]
+
+    def get_tangents(
+        self,
+        strains: npt.ArrayLike,
+        ids: npt.ArrayLike = 0,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return the tangent moduli of the strains, zero outside the range of their profiles.
+
+        :param strains: Strains in the materials, e.g. of all fibres of a section stacked.
+        :param ids: Indices of the profiles of the strains, broadcast against `strains`.
+        """
+        return self.slopes[self.get_segments(strains, ids)]
+
+
 class ConcreteStressStrainProfile(StressStrainProfile):
     """
     Base class for a concrete stress-strain profile.
@@ -413,6 +535,110 @@ class ReinforcementStressStrainProfile(StressStrainProfile):
                 raise ValueError(f"Invalid reinforcement stress-strain profile: '{self.profile}'")
 
 
+class ProfileCacheStats(NamedTuple):
+    """
+    Statistics of a :class:`ProfileFactory`.
+
+    :param hits: Number of profiles found in the cache.
+    :param misses: Number of profiles constructed.
+    :param entries: Number of profiles in the cache.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+
+
+class ProfileFactory:
+    """
+    Factory of stress-strain profiles, returning one shared instance per set of parameters.
+
+    The strains and stresses of the shared profiles are read-only.
+    """
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._profiles: dict[str, StressStrainProfile] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached profiles."""
+        return len(self._profiles)
+
+    def __repr__(self) -> str:
+        """Return a string representation of ProfileFactory object."""
+        return f"{self.__class__.__name__}(entries={len(self)})"
+
+    @property
+    def stats(self) -> ProfileCacheStats:
+        """Statistics of the cache."""
+        return ProfileCacheStats(hits=self.hits, misses=self.misses, entries=len(self._profiles))
+
+    def get_concrete_profile(
+        self,
+        concrete: ConcreteMaterial,
+        limit_state: str,
+        compression_profile: ConcreteCompressionSSP = ConcreteCompressionSSP.NONLINEAR,
+        tension_profile: ConcreteTensionSSP = ConcreteTensionSSP.ELASTIC_PLASTIC_WITH_SOFTENING,
+        tension_softening_stiffness: float = 10.0e9,
+        n_points_1: int = 10,
+        n_points_2: int = 5,
+        effective_creep_ratio: float = 0.0,
+    ) -> ConcreteStressStrainProfile:
+        """
+        Return the shared concrete stress-strain profile, see :class:`ConcreteStressStrainProfile`.
+
+        The limit state is case-insensitive, "sls" and "SLS" share one profile.
+        """
+        arguments = (
+            concrete,
+            limit_state.upper(),
+            ConcreteCompressionSSP(compression_profile),
+            ConcreteTensionSSP(tension_profile),
+            float(tension_softening_stiffness),
+            n_points_1,
+            n_points_2,
+            float(effective_creep_ratio),
+        )
+        return self._get(ConcreteStressStrainProfile, arguments)  # type: ignore[return-value]
+
+    def get_reinforcement_profile(
+        self,
+        steel: RebarMaterial,
+        limit_state: str,
+        profile: ReinforcementSSP = ReinforcementSSP.ELASTIC_PLASTIC,
+    ) -> ReinforcementStressStrainProfile:
+        """
+        Return the shared reinforcement stress-strain profile, see :class:`ReinforcementStressStrainProfile`.
+
+        The limit state is case-insensitive, "uls" and "ULS" share one profile.
+        """
+        arguments = (steel, limit_state.upper(), ReinforcementSSP(profile))
+        return self._get(ReinforcementStressStrainProfile, arguments)  # type: ignore[return-value]
+
+    def _get(self, cls: type[StressStrainProfile], arguments: tuple[Any, ...]) -> StressStrainProfile:
+        """Return the cached profile of the class and arguments, constructed on a miss."""
+        key = fingerprint(cls.__qualname__, arguments)
+        profile = self._profiles.get(key)
+        if profile is not None:
+            self.hits += 1
+            return profile
+
+        self.misses += 1
+        profile = cls(*arguments)
+        profile.strains.flags.writeable = False
+        profile.stresses.flags.writeable = False
+        self._profiles[key] = profile
+        return profile
+
+    def clear(self) -> None:
+        """Remove all cached profiles, the statistics are kept."""
+        self._profiles.clear()
+
+
+# Profiles shared by the whole package
+profile_factory = ProfileFactory()
+
+
 def main() -> None:
     from desssign.concrete.concrete_material import ConcreteMaterial
     from desssign.concrete.rebar_material import RebarMaterial
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import cast
 
+from framesss.pre.cases import EnvelopeCombination
 from framesss.pre.cases import LoadCase
 from framesss.pre.cases import LoadCaseCombination
 from framesss.pre.cases import NonlinearLoadCaseCombination
@@ -96,6 +97,18 @@ class DesignLoadCaseCombination(LoadCaseCombination):
             alternative_combination=self.alternative_combination,
         )
 
+    @property
+    def load_duration_code(self) -> int:
+        """
+        Return the integer code of the load duration class of the combination.
+
+        The code follows :data:`LOAD_DURATION_MAPPING`, i.e. the shortest duration has the lowest code.
+        """
+        return min(
+            LOAD_DURATION_MAPPING[cast(DesignLoadCase, case).load_duration_class]
+            for case in self.load_cases
+        )
+
     @property
     def load_duration_class(self) -> LoadDurationClass:
         """
@@ -108,12 +121,7 @@ class DesignLoadCaseCombination(LoadCaseCombination):
             load should be used.
         """
         # Get the minimum value of all duration classes
-        min_duration_value = min(
-            [
-                LOAD_DURATION_MAPPING[cast(DesignLoadCase, case).load_duration_class]
-                for case in self.load_cases
-            ]
-        )
+        min_duration_value = self.load_duration_code
 
         # Find the LoadDurationClass corresponding to the minimum value
         for duration_class, value in LOAD_DURATION_MAPPING.items():
@@ -204,6 +212,18 @@ class DesignNonlinearLoadCaseCombination(NonlinearLoadCaseCombination):
             alternative_combination=self.alternative_combination,
         )
 
+    @property
+    def load_duration_code(self) -> int:
+        """
+        Return the integer code of the load duration class of the combination.
+
+        The code follows :data:`LOAD_DURATION_MAPPING`, i.e. the shortest duration has the lowest code.
+        """
+        return min(
+            LOAD_DURATION_MAPPING[cast(DesignLoadCase, case).load_duration_class]
+            for case in self.load_cases
+        )
+
     @property
     def load_duration_class(self) -> LoadDurationClass:
         """
@@ -216,12 +236,7 @@ class DesignNonlinearLoadCaseCombination(NonlinearLoadCaseCombination):
             load should be used.
         """
         # Get the minimum value of all duration classes
-        min_duration_value = min(
-            [
-                LOAD_DURATION_MAPPING[cast(DesignLoadCase, case).load_duration_class]
-                for case in self.load_cases
-            ]
-        )
+        min_duration_value = self.load_duration_code
 
         # Find the LoadDurationClass corresponding to the minimum value
         for duration_class, value in LOAD_DURATION_MAPPING.items():
@@ -232,3 +247,61 @@ class DesignNonlinearLoadCaseCombination(NonlinearLoadCaseCombination):
         raise ValueError(
             f"Can't find the load duration class with value: '̈́{min_duration_value}'."
         )
+
+
+class DesignEnvelopeCombination(EnvelopeCombination):
+    """
+    Represent an envelope of design load case combinations.
+
+    :param label: A unique identifier for the envelope combination.
+    :param cases: A list of :class:`DesignLoadCaseCombination` and :class:`DesignNonlinearLoadCaseCombination`.
+    """
+
+    cases: list[DesignLoadCaseCombination | DesignNonlinearLoadCaseCombination]
+
+    def __init__(
+        self,
+        label: str,
+        cases: list[DesignLoadCaseCombination | DesignNonlinearLoadCaseCombination],
+    ) -> None:
+        """Init the DesignEnvelopeCombination class."""
+        super().__init__(label, cast(list[LoadCase | LoadCaseCombination], cases))
+
+    @property
+    def load_duration_code(self) -> int:
+        """Return the integer code of the shortest load duration class of the enveloped combinations."""
+        return min(case.load_duration_code for case in self.cases)
+
+    @property
+    def load_duration_class(self) -> LoadDurationClass:
+        """Return the shortest load duration class of the enveloped combinations."""
+        min_duration_value = self.load_duration_code
+        for duration_class, value in LOAD_DURATION_MAPPING.items():
+            if value == min_duration_value:
+                return LoadDurationClass(duration_class)
+
+        raise ValueError(
+            f"Can't find the load duration class with value: '{min_duration_value}'."
+        )
+
+
+def group_by_load_duration_class(
+    combinations: list[DesignLoadCaseCombination | DesignNonlinearLoadCaseCombination],
+) -> list[DesignEnvelopeCombination]:
+    """
+    Envelope the combinations of each load duration class.
+
+    :param combinations: The load case combinations to group.
+    :return: One envelope per load duration class present in the combinations,
+             from the shortest to the longest duration.
+    """
+    groups: dict[int, list[DesignLoadCaseCombination | DesignNonlinearLoadCaseCombination]] = {}
+    for combination in combinations:
+        groups.setdefault(combination.load_duration_code, []).append(combination)
+
+    envelopes = []
+    for code in sorted(groups):
+        envelope = DesignEnvelopeCombination(label="", cases=groups[code])
+        envelope.label = f"ENV-{envelope.load_duration_class.value}"
+        envelopes.append(envelope)
+    return envelopes
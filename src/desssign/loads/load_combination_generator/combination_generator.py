@@ -3,6 +3,8 @@ from __future__ import annotations
 from itertools import product
 from typing import TYPE_CHECKING
 
+from desssign.common.instrumentation import instrument
+from desssign.common.instrumentation import instrumentation
 from desssign.loads.enums import LimitState
 from desssign.loads.enums import LoadType
 from desssign.loads.enums import SLSCombination
@@ -53,6 +55,7 @@ class CombinationsGenerator:
                 f"Can't set combination type: '{combination_type}' to limit state: '{limit_state}'."
             )
 
+    @instrument("CombinationsGenerator.generate_combinations")
     def generate_combinations(
         self,
         *args: list[DesignLoadCaseGroup,],
@@ -194,4 +197,5 @@ class CombinationsGenerator:
                     )
                 c += 1
 
+        instrumentation.count("generated_combinations", len(generated_combinations))
         return generated_combinations
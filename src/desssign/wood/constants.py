@@ -102,6 +102,17 @@ def get_modification_factor(
     return MODIFICATION_FACTORS[wood_type][service_class][load_duration_class]
 
 
+# Design strengths tabulated by `WoodMaterial` and their characteristic counterparts
+DESIGN_STRENGTHS = {
+    "f_md": "f_mk",
+    "f_t0d": "f_t0k",
+    "f_t90d": "f_t90k",
+    "f_c0d": "f_c0k",
+    "f_c90d": "f_c90k",
+    "f_vd": "f_vk",
+}
+
+
 DEFORMATION_FACTORS = {
     WoodType.SOLID_TIMBER: {
         ServiceClass.SC1: 0.6,
@@ -10,6 +10,135 @@ if TYPE_CHECKING:
     import numpy.typing as npt
 
 
+# The functions below are shared by the check classes and the batched kernels, see
+# `desssign.wood.design_checks.kernels`. Their inputs are arrays of a single combination
+# (n_points,) or of a block of combinations (n_combinations, n_points), the strengths are
+# scalars or arrays broadcast against them.
+
+
+def compressive_stresses(
+    axial_forces: npt.NDArray[np.float64], area_x: float
+) -> npt.NDArray[np.float64]:
+    """
+    Return the design compressive stresses parallel to the grain, zero in tension.
+
+    :param axial_forces: Axial forces along the member.
+    :param area_x: Area of the section.
+    """
+    sigma_0d = axial_forces / area_x
+    return np.where(sigma_0d >= 0, 0.0, sigma_0d)
+
+
+def tensile_stresses(
+    axial_forces: npt.NDArray[np.float64], area_x: float
+) -> npt.NDArray[np.float64]:
+    """
+    Return the design tensile stresses parallel to the grain, zero in compression.
+
+    :param axial_forces: Axial forces along the member.
+    :param area_x: Area of the section.
+    """
+    sigma_0d = axial_forces / area_x
+    return np.where(sigma_0d < 0, 0.0, sigma_0d)
+
+
+def shear_stresses(
+    shear_forces: npt.NDArray[np.float64], k_cr: float, area: float
+) -> npt.NDArray[np.float64]:
+    """
+    Return the design shear stresses of a rectangular section, EN 1995-1-1, 6.1.7.
+
+    :param shear_forces: Shear forces along the member.
+    :param k_cr: Crack factor of the shear resistance.
+    :param area: Shear area of the section.
+    """
+    return 3 * np.abs(shear_forces) / (2 * k_cr * area)
+
+
+def stress_ratios(
+    stresses: npt.NDArray[np.float64], strengths: float | npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Return the ratios of the absolute stresses to the strengths.
+
+    :param stresses: Design stresses along the member.
+    :param strengths: Design strengths.
+    """
+    return np.abs(stresses) / strengths
+
+
+def interaction_usages(
+    axial_ratios: float | npt.NDArray[np.float64],
+    bending_ratios_y: npt.NDArray[np.float64],
+    bending_ratios_z: npt.NDArray[np.float64],
+    k_m: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Return the usages of the interaction of the axial force and the bending about both axes.
+
+    EN 1995-1-1, eq. 6.11, 6.12 (without axial force), 6.17, 6.18 (tension) and 6.19, 6.20
+    (compression, with squared axial ratios).
+
+    :param axial_ratios: Ratios of the axial stresses to the axial strength.
+    :param bending_ratios_y: Ratios of the bending stresses about the y-axis to the bending strength.
+    :param bending_ratios_z: Ratios of the bending stresses about the z-axis to the bending strength.
+    :param k_m: Factor considering re-distribution of bending stresses in cross-section.
+    :return: The usages with the y-axis and with the z-axis dominant.
+    """
+    return (
+        axial_ratios + bending_ratios_y + k_m * bending_ratios_z,
+        axial_ratios + k_m * bending_ratios_y + bending_ratios_z,
+    )
+
+
+def column_stability_usages(
+    compression_ratios: npt.NDArray[np.float64],
+    bending_ratios_y: npt.NDArray[np.float64],
+    bending_ratios_z: npt.NDArray[np.float64],
+    k_cy: float,
+    k_cz: float,
+    k_m: float,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Return the usages of the column stability, EN 1995-1-1, eq. 6.23, 6.24.
+
+    :param compression_ratios: Squared ratios of the compressive stresses to the compressive strength.
+    :param bending_ratios_y: Ratios of the bending stresses about the y-axis to the bending strength.
+    :param bending_ratios_z: Ratios of the bending stresses about the z-axis to the bending strength.
+    :param k_cy: Instability factor for the y-axis.
+    :param k_cz: Instability factor for the z-axis.
+    :param k_m: Factor considering re-distribution of bending stresses in cross-section.
+    """
+    return (
+        compression_ratios / k_cy + bending_ratios_y + k_m * bending_ratios_z,
+        compression_ratios / k_cz + k_m * bending_ratios_y + bending_ratios_z,
+    )
+
+
+def beam_stability_usages(
+    sigma_c0d: npt.NDArray[np.float64],
+    sigma_myd: npt.NDArray[np.float64],
+    f_c0d: float | npt.NDArray[np.float64],
+    f_myd: float | npt.NDArray[np.float64],
+    k_crit: float,
+    k_cz: float,
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the beam stability, EN 1995-1-1, eq. 6.35.
+
+    :param sigma_c0d: Design compressive stresses parallel to the grain.
+    :param sigma_myd: Design bending stresses about the principal y-axis.
+    :param f_c0d: Design compressive strength parallel to the grain.
+    :param f_myd: Design bending strength about the principal y-axis.
+    :param k_crit: Factor which takes into account the reduced bending strength due to lateral buckling.
+    :param k_cz: Instability factor for the z-axis.
+    """
+    return (
+        np.abs(sigma_c0d) / (k_cz * f_c0d)
+        + (np.abs(sigma_myd) / (k_crit * f_myd)) ** 2
+    )
+
+
 class TensionParallelToTheGrainCheck(Check):
     """
     Class for checking tension parallel to the grain.
@@ -33,7 +162,7 @@ class TensionParallelToTheGrainCheck(Check):
     @property
     def usages(self) -> npt.NDArray[np.float64]:
         """Usages of the material at every point along the member."""
-        return np.abs(self.sigma_t0d) / self.f_t0d
+        return stress_ratios(self.sigma_t0d, self.f_t0d)
 
 
 class CompressionParallelToTheGrainCheck(Check):
@@ -59,7 +188,7 @@ class CompressionParallelToTheGrainCheck(Check):
     @property
     def usages(self) -> npt.NDArray[np.float64]:
         """Usages of the material at every point along the member."""
-        return np.abs(self.sigma_c0d) / self.f_c0d
+        return stress_ratios(self.sigma_c0d, self.f_c0d)
 
 
 class BendingCheck(Check):
@@ -92,13 +221,11 @@ class BendingCheck(Check):
         self.f_mzd = f_mzd
         self.k_m = k_m
 
-        self.eq_6_11 = (
-            np.abs(self.sigma_myd) / self.f_myd
-            + self.k_m * np.abs(self.sigma_mzd) / self.f_mzd
-        )
-        self.eq_6_12 = (
-            self.k_m * np.abs(self.sigma_myd) / self.f_myd
-            + np.abs(self.sigma_mzd) / self.f_mzd
+        self.eq_6_11, self.eq_6_12 = interaction_usages(
+            0.0,
+            stress_ratios(self.sigma_myd, self.f_myd),
+            stress_ratios(self.sigma_mzd, self.f_mzd),
+            self.k_m,
         )
 
     @property
@@ -130,7 +257,7 @@ class ShearCheck(Check):
     @property
     def usages(self) -> npt.NDArray[np.float64]:
         """Usages of the material at every point along the member."""
-        return np.abs(self.tau_d) / self.f_vd
+        return stress_ratios(self.tau_d, self.f_vd)
 
 
 class TorsionCheck(Check):
@@ -197,15 +324,11 @@ class CombinedBendingAndAxialTensionCheck(Check):
         self.f_mzd = f_mzd
         self.k_m = k_m
 
-        tension = np.abs(self.sigma_t0d) / self.f_t0d
-        bending_y = np.abs(self.sigma_myd) / self.f_myd
-        bending_z = np.abs(self.sigma_mzd) / self.f_mzd
-
-        self.eq_6_17: npt.NDArray[np.float64] = (
-            tension + bending_y + self.k_m * bending_z
-        )
-        self.eq_6_18: npt.NDArray[np.float64] = (
-            tension + self.k_m * bending_y + bending_z
+        self.eq_6_17, self.eq_6_18 = interaction_usages(
+            stress_ratios(self.sigma_t0d, self.f_t0d),
+            stress_ratios(self.sigma_myd, self.f_myd),
+            stress_ratios(self.sigma_mzd, self.f_mzd),
+            self.k_m,
         )
 
     @property
@@ -249,15 +372,11 @@ class CombinedBendingAndAxialCompressionCheck(Check):
         self.f_mzd = f_mzd
         self.k_m = k_m
 
-        compression = (np.abs(self.sigma_c0d) / self.f_c0d) ** 2
-        bending_y = np.abs(self.sigma_myd) / self.f_myd
-        bending_z = np.abs(self.sigma_mzd) / self.f_mzd
-
-        self.eq_6_19: npt.NDArray[np.float64] = (
-            compression + bending_y + self.k_m * bending_z
-        )
-        self.eq_6_20: npt.NDArray[np.float64] = (
-            compression + self.k_m * bending_y + bending_z
+        self.eq_6_19, self.eq_6_20 = interaction_usages(
+            stress_ratios(self.sigma_c0d, self.f_c0d) ** 2,
+            stress_ratios(self.sigma_myd, self.f_myd),
+            stress_ratios(self.sigma_mzd, self.f_mzd),
+            self.k_m,
         )
 
     @property
@@ -307,15 +426,13 @@ class ColumnStabilityCheck(Check):
         self.k_cz = k_cz
         self.k_m = k_m
 
-        compression = (np.abs(self.sigma_c0d) / self.f_c0d) ** 2
-        bending_y = np.abs(self.sigma_myd) / self.f_myd
-        bending_z = np.abs(self.sigma_mzd) / self.f_mzd
-
-        self.eq_6_23: npt.NDArray[np.float64] = (
-            compression / k_cy + bending_y + self.k_m * bending_z
-        )
-        self.eq_6_24: npt.NDArray[np.float64] = (
-            compression / k_cz + self.k_m * bending_y + bending_z
+        self.eq_6_23, self.eq_6_24 = column_stability_usages(
+            stress_ratios(self.sigma_c0d, self.f_c0d) ** 2,
+            stress_ratios(self.sigma_myd, self.f_myd),
+            stress_ratios(self.sigma_mzd, self.f_mzd),
+            self.k_cy,
+            self.k_cz,
+            self.k_m,
         )
 
     @property
@@ -356,10 +473,9 @@ class BeamStabilityCheck(Check):
         self.k_crit = k_crit
         self.k_cz = k_cz
 
-        compression = np.abs(self.sigma_c0d) / (self.k_cz * self.f_c0d)
-        bending = (np.abs(self.sigma_myd) / (self.k_crit * self.f_myd)) ** 2
-
-        self.eq_6_35: npt.NDArray[np.float64] = compression + bending
+        self.eq_6_35 = beam_stability_usages(
+            self.sigma_c0d, self.sigma_myd, self.f_c0d, self.f_myd, self.k_crit, self.k_cz
+        )
 
     @property
     def usages(self) -> npt.NDArray[np.float64]:
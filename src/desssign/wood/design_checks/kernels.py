@@ -0,0 +1,233 @@
+"""Batched kernels of the wood design checks, sharing the formulas of :mod:`desssign.wood.design_checks.design_check`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from desssign.common.check_registry import check_registry
+from desssign.wood.design_checks.design_check import beam_stability_usages
+from desssign.wood.design_checks.design_check import column_stability_usages
+from desssign.wood.design_checks.design_check import compressive_stresses
+from desssign.wood.design_checks.design_check import interaction_usages
+from desssign.wood.design_checks.design_check import shear_stresses
+from desssign.wood.design_checks.design_check import stress_ratios
+from desssign.wood.design_checks.design_check import tensile_stresses
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+@check_registry.quantity("wood.sigma_c0d", inputs=("axial_forces", "section.area_x"))
+def sigma_c0d(
+    axial_forces: npt.NDArray[np.float64], area_x: float
+) -> npt.NDArray[np.float64]:
+    """Design compressive stresses parallel to the grain."""
+    return compressive_stresses(axial_forces, area_x)
+
+
+@check_registry.quantity("wood.sigma_t0d", inputs=("axial_forces", "section.area_x"))
+def sigma_t0d(
+    axial_forces: npt.NDArray[np.float64], area_x: float
+) -> npt.NDArray[np.float64]:
+    """Design tensile stresses parallel to the grain."""
+    return tensile_stresses(axial_forces, area_x)
+
+
+@check_registry.quantity("wood.sigma_myd", inputs=("bending_moments_y", "section.W_y"))
+def sigma_myd(
+    bending_moments_y: npt.NDArray[np.float64], W_y: float
+) -> npt.NDArray[np.float64]:
+    """Design bending stresses about the principal y-axis."""
+    return bending_moments_y / W_y
+
+
+@check_registry.quantity("wood.sigma_mzd", inputs=("bending_moments_z", "section.W_z"))
+def sigma_mzd(
+    bending_moments_z: npt.NDArray[np.float64], W_z: float
+) -> npt.NDArray[np.float64]:
+    """Design bending stresses about the principal z-axis."""
+    return bending_moments_z / W_z
+
+
+@check_registry.quantity(
+    "wood.tau_d", inputs=("shear_forces_z", "section.k_cr", "section.area_z")
+)
+def tau_d(
+    shear_forces_z: npt.NDArray[np.float64], k_cr: float, area_z: float
+) -> npt.NDArray[np.float64]:
+    """Design shear stresses."""
+    return shear_stresses(shear_forces_z, k_cr, area_z)
+
+
+@check_registry.quantity(
+    "wood.compression_ratio", inputs=("wood.sigma_c0d", "strength.f_c0d")
+)
+def compression_ratio(
+    sigma_c0d: npt.NDArray[np.float64], f_c0d: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Squared ratio of the compressive stresses to the compressive strength."""
+    return stress_ratios(sigma_c0d, f_c0d) ** 2
+
+
+@check_registry.quantity(
+    "wood.bending_ratio_y", inputs=("wood.sigma_myd", "strength.f_md")
+)
+def bending_ratio_y(
+    sigma_myd: npt.NDArray[np.float64], f_md: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Ratio of the bending stresses about the y-axis to the bending strength."""
+    return stress_ratios(sigma_myd, f_md)
+
+
+@check_registry.quantity(
+    "wood.bending_ratio_z", inputs=("wood.sigma_mzd", "strength.f_md")
+)
+def bending_ratio_z(
+    sigma_mzd: npt.NDArray[np.float64], f_md: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """Ratio of the bending stresses about the z-axis to the bending strength."""
+    return stress_ratios(sigma_mzd, f_md)
+
+
+@check_registry.check(
+    "wood.column_stability",
+    family="column_stability",
+    code="EN 1995-1-1",
+    paragraph="6.3",
+    inputs=(
+        "wood.compression_ratio",
+        "wood.bending_ratio_y",
+        "wood.bending_ratio_z",
+        "member.k_cy",
+        "member.k_cz",
+        "section.k_m",
+    ),
+)
+def column_stability(
+    compression_ratio: npt.NDArray[np.float64],
+    bending_ratio_y: npt.NDArray[np.float64],
+    bending_ratio_z: npt.NDArray[np.float64],
+    k_cy: float,
+    k_cz: float,
+    k_m: float,
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the column stability check.
+
+    EN 1995-1-1, 6.3.2(3), eq. (6.23), (6.24)
+    """
+    return np.maximum(
+        *column_stability_usages(
+            compression_ratio, bending_ratio_y, bending_ratio_z, k_cy, k_cz, k_m
+        )
+    )
+
+
+@check_registry.check(
+    "wood.beam_stability",
+    family="beam_stability",
+    code="EN 1995-1-1",
+    paragraph="6.3",
+    inputs=(
+        "wood.sigma_c0d",
+        "wood.sigma_myd",
+        "strength.f_c0d",
+        "strength.f_md",
+        "member.k_crit",
+        "member.k_cz",
+    ),
+)
+def beam_stability(
+    sigma_c0d: npt.NDArray[np.float64],
+    sigma_myd: npt.NDArray[np.float64],
+    f_c0d: npt.NDArray[np.float64],
+    f_md: npt.NDArray[np.float64],
+    k_crit: float,
+    k_cz: float,
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the beam stability check.
+
+    EN 1995-1-1, 6.3.3(6), eq. (6.35)
+    """
+    return beam_stability_usages(sigma_c0d, sigma_myd, f_c0d, f_md, k_crit, k_cz)
+
+
+@check_registry.check(
+    "wood.shear_check",
+    family="shear_check",
+    code="EN 1995-1-1",
+    paragraph="6.1.7",
+    inputs=("wood.tau_d", "strength.f_vd"),
+)
+def shear_check(
+    tau_d: npt.NDArray[np.float64], f_vd: npt.NDArray[np.float64]
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the shear check.
+
+    EN 1995-1-1, 6.1.7(1), eq. (6.13)
+    """
+    return stress_ratios(tau_d, f_vd)
+
+
+@check_registry.check(
+    "wood.tension_with_bending_check",
+    family="tension_with_bending_check",
+    code="EN 1995-1-1",
+    paragraph="6.2.3",
+    inputs=(
+        "wood.sigma_t0d",
+        "strength.f_t0d",
+        "wood.bending_ratio_y",
+        "wood.bending_ratio_z",
+        "section.k_m",
+    ),
+)
+def tension_with_bending_check(
+    sigma_t0d: npt.NDArray[np.float64],
+    f_t0d: npt.NDArray[np.float64],
+    bending_ratio_y: npt.NDArray[np.float64],
+    bending_ratio_z: npt.NDArray[np.float64],
+    k_m: float,
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the combined bending and axial tension check.
+
+    EN 1995-1-1, 6.2.3(1), eq. (6.17), (6.18)
+    """
+    return np.maximum(
+        *interaction_usages(
+            stress_ratios(sigma_t0d, f_t0d), bending_ratio_y, bending_ratio_z, k_m
+        )
+    )
+
+
+@check_registry.check(
+    "wood.compression_with_bending_check",
+    family="compression_with_bending_check",
+    code="EN 1995-1-1",
+    paragraph="6.2.4",
+    inputs=(
+        "wood.compression_ratio",
+        "wood.bending_ratio_y",
+        "wood.bending_ratio_z",
+        "section.k_m",
+    ),
+)
+def compression_with_bending_check(
+    compression_ratio: npt.NDArray[np.float64],
+    bending_ratio_y: npt.NDArray[np.float64],
+    bending_ratio_z: npt.NDArray[np.float64],
+    k_m: float,
+) -> npt.NDArray[np.float64]:
+    """
+    Return the usages of the combined bending and axial compression check.
+
+    EN 1995-1-1, 6.2.4(1), eq. (6.19), (6.20)
+    """
+    return np.maximum(
+        *interaction_usages(compression_ratio, bending_ratio_y, bending_ratio_z, k_m)
+    )
@@ -4,7 +4,10 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from desssign.common.check_registry import check_registry
 from desssign.common.design_check import Member1DChecks
+from desssign.common.instrumentation import instrument
+from desssign.wood.design_checks import kernels  # noqa: F401 (registers the check kernels)
 from desssign.wood.design_checks.design_check import BeamStabilityCheck
 from desssign.wood.design_checks.design_check import ColumnStabilityCheck
 from desssign.wood.design_checks.design_check import (
@@ -12,8 +15,14 @@ from desssign.wood.design_checks.design_check import (
 )
 from desssign.wood.design_checks.design_check import CombinedBendingAndAxialTensionCheck
 from desssign.wood.design_checks.design_check import ShearCheck
+from desssign.wood.design_checks.design_check import compressive_stresses
+from desssign.wood.design_checks.design_check import shear_stresses
+from desssign.wood.design_checks.design_check import tensile_stresses
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from desssign.loads.load_case_combination import DesignEnvelopeCombination
     from desssign.loads.load_case_combination import DesignLoadCaseCombination
     from desssign.wood.wood_member import WoodMember1D
 
@@ -27,6 +36,22 @@ class WoodMember1DChecks(Member1DChecks):
 
     member: WoodMember1D  # Explicit type annotation, so that mypy can check the type
 
+    check_families = (
+        "column_stability",
+        "beam_stability",
+        "shear_check",
+        "tension_with_bending_check",
+        "compression_with_bending_check",
+    )
+    member_attributes = ("section", "k_cy", "k_cz", "k_crit")
+    pipeline = check_registry.pipeline(
+        "wood.column_stability",
+        "wood.beam_stability",
+        "wood.shear_check",
+        "wood.tension_with_bending_check",
+        "wood.compression_with_bending_check",
+    )
+
     def __init__(self, member: WoodMember1D) -> None:
         """Init the WoodMember1DChecks object."""
         super().__init__(member=member)
@@ -57,8 +82,10 @@ class WoodMember1DChecks(Member1DChecks):
                 *self.compression_with_bending_check.values(),
             )
         ]
+        max_usages.extend(summary.max_usage for summary in self.summaries.values())
         return max(max_usages)
 
+    @instrument()
     def perform_uls_checks(
         self, load_case_combinations: list[DesignLoadCaseCombination]
     ) -> None:
@@ -73,29 +100,59 @@ class WoodMember1DChecks(Member1DChecks):
         self.perform_tension_with_bending_checks(load_case_combinations)
         self.perform_compression_with_bending_checks(load_case_combinations)
 
+    def evaluate_usages(
+        self,
+        forces: npt.NDArray[np.float64],
+        load_duration_codes: npt.NDArray[np.int_],
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """
+        Evaluate the usages of all check families for a block of internal forces.
+
+        The stresses and the design strengths shared by the kernels of the :attr:`pipeline`
+        are computed once. The usages are identical to the ones of the per-family check methods.
+
+        :param forces: Internal forces of shape (6, n_rows, n_points), see :meth:`get_internal_forces_block`.
+        :param load_duration_codes: Load duration code of every row.
+        :return: Usages of shape (n_rows, n_points) of every check family.
+        """
+        return self.pipeline.evaluate(self, forces, load_duration_codes)
+
+    @instrument()
+    def perform_envelope_uls_checks(
+        self, envelopes: list[DesignEnvelopeCombination]
+    ) -> None:
+        """
+        Perform all design checks on the member for envelopes of load case combinations.
+
+        The internal forces of every envelope are bounded by :meth:`save_envelope_bounds`,
+        so that each envelope is checked once instead of every enveloped combination.
+        The strengths of an envelope belong to the shortest load duration class of its cases,
+        see :func:`group_by_load_duration_class` for envelopes sharing a single class.
+
+        :param envelopes: The list of envelopes to check.
+        """
+        for envelope in envelopes:
+            self.save_envelope_bounds(envelope)
+        self.perform_uls_checks(envelopes)  # type: ignore[arg-type]
+
+    @instrument()
     def perform_column_stability_checks(
         self,
         load_case_combinations: list[DesignLoadCaseCombination],
     ) -> None:
         """Perform the column stability checks for the given load case combinations."""
+        material = self.member.section.material
         for combination in load_case_combinations:
+            load_duration_code = combination.load_duration_code
             axial, _, _, _, bending_y, bending_z = self.get_internal_forces(combination)
 
-            sigma_c0d = axial / self.member.section.area_x
-            sigma_c0d[sigma_c0d >= 0] = 0
+            sigma_c0d = compressive_stresses(axial, self.member.section.area_x)
 
             sigma_myd = bending_y / self.member.section.W_y
             sigma_mzd = bending_z / self.member.section.W_z
 
-            f_c0d = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_c0k,
-                load_duration_class=combination.load_duration_class,
-            )
-
-            f_md = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_mk,
-                load_duration_class=combination.load_duration_class,
-            )
+            f_c0d = material.get_design_strength("f_c0d", load_duration_code)
+            f_md = material.get_design_strength("f_md", load_duration_code)
 
             self.column_stability[combination] = ColumnStabilityCheck(
                 sigma_c0d=sigma_c0d,
@@ -109,28 +166,23 @@ class WoodMember1DChecks(Member1DChecks):
                 k_m=self.member.section.k_m,
             )
 
+    @instrument()
     def perform_beam_stability_checks(
         self,
         load_case_combinations: list[DesignLoadCaseCombination],
     ) -> None:
         """Perform the beam stability checks for the given load case combinations."""
+        material = self.member.section.material
         for combination in load_case_combinations:
+            load_duration_code = combination.load_duration_code
             axial, _, _, _, bending_y, bending_z = self.get_internal_forces(combination)
 
-            sigma_c0d = axial / self.member.section.area_x
-            sigma_c0d[sigma_c0d >= 0] = 0
+            sigma_c0d = compressive_stresses(axial, self.member.section.area_x)
 
             sigma_myd = bending_y / self.member.section.W_y
 
-            f_c0d = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_c0k,
-                load_duration_class=combination.load_duration_class,
-            )
-
-            f_md = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_mk,
-                load_duration_class=combination.load_duration_class,
-            )
+            f_c0d = material.get_design_strength("f_c0d", load_duration_code)
+            f_md = material.get_design_strength("f_md", load_duration_code)
 
             self.beam_stability[combination] = BeamStabilityCheck(
                 sigma_c0d=sigma_c0d,
@@ -141,84 +193,77 @@ class WoodMember1DChecks(Member1DChecks):
                 k_cz=self.member.k_cz,
             )
 
+    @instrument()
     def perform_shear_checks(
         self,
         load_case_combinations: list[DesignLoadCaseCombination],
     ) -> None:
         """Perform the shear checks for the given load case combinations."""
+        material = self.member.section.material
         for combination in load_case_combinations:
+            load_duration_code = combination.load_duration_code
             _, shear_y, shear_z, _, _, _ = self.get_internal_forces(combination)
 
-            k_cr = self.member.section.k_cr
-            tau_d = 3 * np.abs(shear_z) / (2 * k_cr * self.member.section.area_z)
-
-            f_vd = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_vk,
-                load_duration_class=combination.load_duration_class,
+            tau_d = shear_stresses(
+                shear_z, self.member.section.k_cr, self.member.section.area_z
             )
 
+            f_vd = material.get_design_strength("f_vd", load_duration_code)
+
             self.shear_check[combination] = ShearCheck(
                 tau_d=tau_d,
                 f_vd=f_vd,
             )
 
+    @instrument()
     def perform_tension_with_bending_checks(
         self,
         load_case_combinations: list[DesignLoadCaseCombination],
     ) -> None:
         """Perform the tension with bending checks for the given load case combinations."""
+        material = self.member.section.material
         for combination in load_case_combinations:
+            load_duration_code = combination.load_duration_code
             axial, _, _, _, bending_y, bending_z = self.get_internal_forces(combination)
 
-            sigma_t0d = axial / self.member.section.area_x
-            sigma_t0d[sigma_t0d < 0] = 0
+            sigma_t0d = tensile_stresses(axial, self.member.section.area_x)
 
             sigma_myd = bending_y / self.member.section.W_y
             sigma_mzd = bending_z / self.member.section.W_z
 
-            f_cd = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_c0k,
-                load_duration_class=combination.load_duration_class,
-            )
-            f_md = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_mk,
-                load_duration_class=combination.load_duration_class,
-            )
+            f_t0d = material.get_design_strength("f_t0d", load_duration_code)
+            f_md = material.get_design_strength("f_md", load_duration_code)
 
             self.tension_with_bending_check[combination] = (
                 CombinedBendingAndAxialTensionCheck(
                     sigma_t0d=sigma_t0d,
                     sigma_myd=sigma_myd,
                     sigma_mzd=sigma_mzd,
-                    f_t0d=f_cd,
+                    f_t0d=f_t0d,
                     f_myd=f_md,
                     f_mzd=f_md,
                     k_m=self.member.section.k_m,
                 )
             )
 
+    @instrument()
     def perform_compression_with_bending_checks(
         self,
         load_case_combinations: list[DesignLoadCaseCombination],
     ) -> None:
         """Perform the compression with bending checks for the given load case combinations."""
+        material = self.member.section.material
         for combination in load_case_combinations:
+            load_duration_code = combination.load_duration_code
             axial, _, _, _, bending_y, bending_z = self.get_internal_forces(combination)
 
-            sigma_c0d = axial / self.member.section.area_x
-            sigma_c0d[sigma_c0d >= 0] = 0
+            sigma_c0d = compressive_stresses(axial, self.member.section.area_x)
 
             sigma_myd = bending_y / self.member.section.W_y
             sigma_mzd = bending_z / self.member.section.W_z
 
-            f_c0d = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_c0k,
-                load_duration_class=combination.load_duration_class,
-            )
-            f_md = self.member.section.material.get_design_value(
-                characteristic_value=self.member.section.material.f_mk,
-                load_duration_class=combination.load_duration_class,
-            )
+            f_c0d = material.get_design_strength("f_c0d", load_duration_code)
+            f_md = material.get_design_strength("f_md", load_duration_code)
 
             self.compression_with_bending_check[combination] = (
                 CombinedBendingAndAxialCompressionCheck(
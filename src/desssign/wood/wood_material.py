@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import numpy as np
 from framesss.pre.material import Material
 
+from desssign.loads.enums import LOAD_DURATION_MAPPING
 from desssign.loads.enums import LoadDurationClass
+from desssign.wood.constants import DESIGN_STRENGTHS
 from desssign.wood.constants import get_modification_factor
 from desssign.wood.constants import get_partial_factor
 from desssign.wood.enums import ServiceClass
 from desssign.wood.enums import WoodType
 from desssign.wood.strength_classes import WOOD_STRENGTH_CLASSES
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 
 class WoodMaterial(Material):
     """
@@ -18,6 +26,10 @@ class WoodMaterial(Material):
 
     :param strength_class: Strength class of the wood material.
     :param service_class: Service class of the wood material.
+    :ivar k_mod: Modification factors indexed by the load duration code minus one
+                 (see :data:`LOAD_DURATION_MAPPING`).
+    :ivar design_strengths: Design strengths (rows ordered as :data:`DESIGN_STRENGTHS`)
+                            for every load duration class (columns ordered as `k_mod`).
     """
 
     def __init__(
@@ -61,6 +73,26 @@ class WoodMaterial(Material):
             density=self.rho_mean,
         )
 
+        self.k_mod = np.array(
+            [
+                get_modification_factor(
+                    self.wood_type, self.service_class, load_duration_class
+                )
+                for load_duration_class in sorted(
+                    LOAD_DURATION_MAPPING, key=LOAD_DURATION_MAPPING.__getitem__
+                )
+            ]
+        )
+        characteristic_strengths = np.array(
+            [getattr(self, name) for name in DESIGN_STRENGTHS.values()]
+        )
+        self.design_strengths = np.outer(
+            characteristic_strengths, self.k_mod / self.gamma_m
+        )
+        self._design_strength_rows = {
+            name: row for row, name in enumerate(DESIGN_STRENGTHS)
+        }
+
     def __repr__(self) -> str:
         """Return the string representation of the WoodMaterial object."""
         return f"WoodMaterial({self.strength_class})"
@@ -84,12 +116,43 @@ class WoodMaterial(Material):
         :param load_duration_class: Load duration class.
         :return: Design value.
         """
-        load_duration_class = LoadDurationClass(load_duration_class)
+        load_duration_code = LOAD_DURATION_MAPPING[
+            LoadDurationClass(load_duration_class)
+        ]
+        return float(
+            self.k_mod[load_duration_code - 1] * characteristic_value / self.gamma_m
+        )
 
-        k_mod = get_modification_factor(
-            self.wood_type, self.service_class, load_duration_class
+    def get_design_strength(self, strength: str, load_duration_code: int) -> float:
+        """
+        Return a tabulated design strength for a load duration class.
+
+        :param strength: Name of the design strength, e.g. 'f_md' or 'f_c0d'.
+        :param load_duration_code: Integer code of the load duration class
+                                   (see :data:`LOAD_DURATION_MAPPING`).
+        :return: Design strength.
+        """
+        return float(
+            self.design_strengths[
+                self._design_strength_rows[strength], load_duration_code - 1
+            ]
         )
-        return k_mod * characteristic_value / self.gamma_m
+
+    def get_design_strengths(
+        self,
+        strength: str,
+        load_duration_codes: npt.ArrayLike,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Return a tabulated design strength for a batch of load duration classes.
+
+        :param strength: Name of the design strength, e.g. 'f_md' or 'f_c0d'.
+        :param load_duration_codes: Integer codes of the load duration classes,
+                                    typically one per load case combination.
+        :return: Design strengths with the shape of `load_duration_codes`.
+        """
+        codes = np.asarray(load_duration_codes, dtype=np.int64)
+        return self.design_strengths[self._design_strength_rows[strength], codes - 1]
 
     @property
     def beta_c(self) -> float:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from framesss.pre.member_1d import Member1D
@@ -15,6 +16,7 @@ if TYPE_CHECKING:
     from framesss.fea.analysis.analysis import Analysis
     from framesss.fea.node import Node
 
+    from desssign.loads.load_case_combination import DesignEnvelopeCombination
     from desssign.loads.load_case_combination import DesignLoadCaseCombination
     from desssign.wood.wood_section import WoodRectangularSection
 
@@ -34,10 +36,25 @@ class WoodMember1D(Member1D):
     :param auxiliary_vector_xy_plane: An auxiliary vector in local xy-plane that defines the local
                                       coordinate system of the member.
     :param analysis: The :class:`Analysis` object.
+    :ivar buckling_length_y: User-defined buckling length in y-axis, the member length is used if not set.
+    :ivar buckling_length_z: User-defined buckling length in z-axis, the member length is used if not set.
     """
 
     section: WoodRectangularSection  # Explicit type annotation, so that mypy can check the type
 
+    # Attributes the cached stability factors depend on
+    STABILITY_DEPENDENCIES = frozenset(
+        {
+            "section",
+            "length",
+            "buckling_length_y",
+            "buckling_length_z",
+            "is_prevented_lateral_displacement_at_compressive_edge",
+            "is_prevented_torsional_rotation_at_supports",
+        }
+    )
+    STABILITY_FACTORS = ("k_cy", "k_cz", "k_crit")
+
     def __init__(
         self,
         label: str,
@@ -64,16 +81,39 @@ class WoodMember1D(Member1D):
         self.is_prevented_lateral_displacement_at_compressive_edge = False
         self.is_prevented_torsional_rotation_at_supports = False
 
+        self.buckling_length_y: float | None = None
+        self.buckling_length_z: float | None = None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Set the attribute and invalidate the cached stability factors if they depend on it."""
+        super().__setattr__(name, value)
+        if name in self.STABILITY_DEPENDENCIES:
+            self.invalidate_stability_factors()
+
+    def invalidate_stability_factors(self) -> None:
+        """
+        Discard the cached stability factors.
+
+        Called automatically when the section, length, buckling lengths or lateral restraints
+        of the member are reassigned. Call it explicitly after modifying the section in place.
+        """
+        for name in self.STABILITY_FACTORS:
+            self.__dict__.pop(name, None)
+
     @property
     def L_cr_y(self) -> float:
         """Critical length for buckling in y-axis."""
         # TODO: Implement the critical length for buckling in y-axis
+        if self.buckling_length_y is not None:
+            return float(self.buckling_length_y)
         return float(self.length)
 
     @property
     def L_cr_z(self) -> float:
         """Critical length for buckling in z-axis."""
         # TODO: Implement the critical length for buckling in z-axis
+        if self.buckling_length_z is not None:
+            return float(self.buckling_length_z)
         return float(self.length)
 
     @property
@@ -134,23 +174,27 @@ class WoodMember1D(Member1D):
         lambda_rel_z = self.lambda_rel_z
         return 0.5 * (1 + beta_c * (lambda_rel_z - 0.3) + lambda_rel_z**2)
 
-    @property
+    @cached_property
     def k_cy(self) -> float:
         """
         Instability factor.
 
         EN 1995-1-1, 6.3.2(3), eq. (6.25)
         """
-        return 1.0 / (self.k_y + math.sqrt(self.k_y**2 - self.lambda_rel_y**2))
+        k_y = self.k_y
+        lambda_rel_y = self.lambda_rel_y
+        return 1.0 / (k_y + math.sqrt(k_y**2 - lambda_rel_y**2))
 
-    @property
+    @cached_property
     def k_cz(self) -> float:
         """
         Instability factor.
 
         EN 1995-1-1, 6.3.2(3), eq. (6.26)
         """
-        return 1.0 / (self.k_z + math.sqrt(self.k_z**2 - self.lambda_rel_z**2))
+        k_z = self.k_z
+        lambda_rel_z = self.lambda_rel_z
+        return 1.0 / (k_z + math.sqrt(k_z**2 - lambda_rel_z**2))
 
     @property
     def l_ef(self) -> float:
@@ -184,7 +228,7 @@ class WoodMember1D(Member1D):
         """
         return math.sqrt(self.section.material.f_mk / self.sigma_m_crit)
 
-    @property
+    @cached_property
     def k_crit(self) -> float:
         """
         Factor used for lateral buckling.
@@ -198,15 +242,22 @@ class WoodMember1D(Member1D):
         ):
             return 1.0
 
-        if self.lambda_rel_m <= 0.75:
+        lambda_rel_m = self.lambda_rel_m
+        if lambda_rel_m <= 0.75:
             return 1.0
-        elif 0.75 < self.lambda_rel_m <= 1.4:
-            return 1.56 - 0.75 * self.lambda_rel_m
+        elif 0.75 < lambda_rel_m <= 1.4:
+            return 1.56 - 0.75 * lambda_rel_m
         else:
-            return 1 / self.lambda_rel_m**2
+            return 1 / lambda_rel_m**2
 
     def perform_uls_checks(
         self, load_combinations: list[DesignLoadCaseCombination]
     ) -> None:
         """Perform the design checks."""
         self.design_checks.perform_uls_checks(load_combinations)
+
+    def perform_envelope_uls_checks(
+        self, envelopes: list[DesignEnvelopeCombination]
+    ) -> None:
+        """Perform the design checks for envelopes of load case combinations."""
+        self.design_checks.perform_envelope_uls_checks(envelopes)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from functools import cached_property
+from pathlib import Path
+from typing import Callable
+
+from desssign.common.check_cache import CheckCache
+from desssign.common.fingerprint import fingerprint
+from desssign.common.model import DesignModelFrameXZ
+
+
+def test_identical_models_hit_the_cache(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    cache = CheckCache(tmp_path)
+    first = solved_wood_model()
+    first.perform_uls_checks(cache=cache)
+
+    # 3 members and 2 combinations, one entry holds the 5 check families
+    assert cache.stats.misses == 6
+    assert cache.stats.entries == 6
+    assert cache.stats.size == sum(path.stat().st_size for path in tmp_path.glob("*.json"))
+
+    second = solved_wood_model()
+    second.perform_uls_checks(cache=CheckCache(tmp_path))
+    usages = {member.label: member.design_checks.max_usage for member in first.members}
+    for member in second.members:
+        assert member.design_checks.shear_check == {}
+        assert member.design_checks.max_usage == usages[member.label]
+
+
+def test_cache_depends_on_forces_and_code_version(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    solved_wood_model().perform_uls_checks(cache=CheckCache(tmp_path))
+
+    cache = CheckCache(tmp_path)
+    solved_wood_model(load_factor=2.0).perform_uls_checks(cache=cache)
+    assert cache.stats.hits == 0
+
+    cache = CheckCache(tmp_path, code_version="next")
+    solved_wood_model().perform_uls_checks(cache=cache)
+    assert cache.stats.hits == 0
+
+
+def test_least_recently_used_entries_are_evicted(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    cache = CheckCache(tmp_path, max_size=4000)
+    solved_wood_model().perform_uls_checks(cache=cache)
+
+    stats = cache.stats
+    assert stats.size <= 4000
+    assert stats.evictions == 6 - stats.entries > 0
+    assert len(list(tmp_path.glob("*.json"))) == stats.entries
+
+    reopened = CheckCache(tmp_path, max_size=4000)
+    assert reopened.stats.entries == stats.entries
+    assert reopened.stats.size == stats.size
+
+
+class Profile:
+    fingerprint_excluded = ("derived",)
+
+    def __init__(self, scale: float) -> None:
+        self._scale = scale
+
+    @cached_property
+    def derived(self) -> float:
+        return 2 * self._scale
+
+
+def test_fingerprint_covers_private_attributes() -> None:
+    profile = Profile(1.0)
+    key = fingerprint(profile)
+
+    assert fingerprint(Profile(2.0)) != key
+    assert profile.derived == 2.0
+    assert fingerprint(profile) == key
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from desssign.common.check_registry import CheckRegistry
+from desssign.common.model import DesignModelFrameXZ
+
+
+@pytest.fixture
+def registry() -> CheckRegistry:
+    registry = CheckRegistry()
+    calls = registry.calls = []  # type: ignore[attr-defined]
+
+    @registry.quantity("sigma_0d", inputs=("axial_forces", "section.area_x"))
+    def sigma_0d(axial_forces: np.ndarray, area_x: float) -> np.ndarray:
+        calls.append("sigma_0d")
+        return axial_forces / area_x
+
+    @registry.check(
+        "tension",
+        family="tension",
+        code="EN 1995-1-1",
+        paragraph="6.1.2",
+        inputs=("sigma_0d", "strength.f_t0d"),
+    )
+    def tension(sigma_0d: np.ndarray, f_t0d: np.ndarray) -> np.ndarray:
+        return np.maximum(sigma_0d, 0.0) / f_t0d
+
+    @registry.check(
+        "compression",
+        family="compression",
+        code="EN 1995-1-1",
+        paragraph="6.1.4",
+        inputs=("sigma_0d", "strength.f_c0d"),
+    )
+    def compression(sigma_0d: np.ndarray, f_c0d: np.ndarray) -> np.ndarray:
+        return np.maximum(-sigma_0d, 0.0) / f_c0d
+
+    return registry
+
+
+def test_pipeline_of_custom_checks(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], registry: CheckRegistry
+) -> None:
+    model = solved_wood_model()
+    combinations = list(model.load_combinations)
+    pipeline = registry.pipeline("tension", "compression")
+
+    for member in model.members:
+        checks = member.design_checks
+        pipeline.run(checks, combinations)
+
+        material = member.section.material
+        for combination in combinations:
+            axial = checks.get_internal_forces(combination)[0]
+            code = combination.load_duration_code
+            assert checks.summaries[("compression", combination)].max_usage == (
+                pytest.approx(
+                    np.max(-axial / member.section.area_x)
+                    / material.get_design_strength("f_c0d", code)
+                )
+            )
+            assert checks.summaries[("tension", combination)].paragraph == "6.1.2"
+
+    # The shared stresses are evaluated once per member
+    assert registry.calls == ["sigma_0d"] * len(model.members)  # type: ignore[attr-defined]
+
+
+def test_registry_rejects_duplicates_and_unknown_checks(
+    registry: CheckRegistry,
+) -> None:
+    with pytest.raises(ValueError):
+        registry.check("tension", "tension", "", "", inputs=())(lambda: None)
+    with pytest.raises(KeyError):
+        registry.pipeline("tension", "bending")
+
+
+@pytest.mark.parametrize("sections", [False, True])
+def test_concrete_pipeline_matches_per_family_checks(
+    solved_concrete_model: Callable[..., DesignModelFrameXZ], sections: bool
+) -> None:
+    model = solved_concrete_model(sections=sections)
+    combinations = sorted(model.load_combinations, key=lambda comb: comb.label)
+    (envelope,) = model.envelopes
+    (member,) = model.members
+    checks = member.design_checks
+
+    checks.perform_uls_checks(combinations)
+    checks.perform_uls_checks(envelope)
+    expected = {
+        (summary.family, summary.combination): summary
+        for summary in checks.summarize()
+    }
+
+    checks.perform_fused_uls_checks(combinations)
+    checks.perform_fused_uls_checks([envelope])
+
+    assert checks.summaries == expected
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from desssign.common.model import DesignModelFrameXZ
+from desssign.loads.enums import LoadDurationClass
+from desssign.loads.load_case_combination import DesignEnvelopeCombination
+from desssign.loads.load_case_combination import group_by_load_duration_class
+from desssign.wood.wood_section import WoodRectangularSection
+
+
+def family_usages(member, family: str) -> dict:
+    return {
+        combination: check.max_usage
+        for combination, check in getattr(member.design_checks, family).items()
+    }
+
+
+def test_group_by_load_duration_class(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+
+    envelopes = group_by_load_duration_class(list(model.load_combinations))
+
+    assert [envelope.load_duration_class for envelope in envelopes] == [
+        LoadDurationClass.MEDIUM_TERM,
+        LoadDurationClass.PERMANENT,
+    ]
+    assert [[case.label for case in envelope.cases] for envelope in envelopes] == [
+        ["CO1"],
+        ["CO2"],
+    ]
+
+
+def test_envelope_checks_are_conservative(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    combinations = sorted(model.load_combinations, key=lambda comb: comb.label)
+    envelope = DesignEnvelopeCombination("ENV", combinations)
+
+    assert envelope.load_duration_class == LoadDurationClass.MEDIUM_TERM
+
+    for member in model.members:
+        member.perform_uls_checks(combinations)
+        member.perform_envelope_uls_checks([envelope])
+
+        for family in member.design_checks.check_families:
+            usages = family_usages(member, family)
+            enveloped = usages.pop(envelope)
+            assert enveloped >= max(usages.values()) - 1e-12
+
+
+def test_envelope_mode_matches_full_mode_for_single_combination_envelopes(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    full = solved_wood_model()
+    full.perform_uls_checks()
+    enveloped = solved_wood_model()
+    enveloped.perform_uls_checks(mode="envelope")
+
+    full_members = {member.label: member for member in full.members}
+    for member in enveloped.members:
+        full_member = full_members[member.label]
+        assert member.design_checks.max_usage >= full_member.design_checks.max_usage
+        assert member.design_checks.max_usage == pytest.approx(
+            full_member.design_checks.max_usage
+        )
+
+
+def test_envelope_mode_discards_the_envelopes_of_the_previous_run(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    model.perform_uls_checks(mode="envelope")
+    for member in model.members:
+        member.section = WoodRectangularSection(
+            "200/400", 0.2, 0.4, member.section.material
+        )
+    model.perform_uls_checks(mode="envelope")
+
+    fresh = solved_wood_model()
+    for member in fresh.members:
+        member.section = WoodRectangularSection(
+            "200/400", 0.2, 0.4, member.section.material
+        )
+    fresh.perform_uls_checks(mode="envelope")
+    usages = {member.label: member.design_checks.max_usage for member in fresh.members}
+
+    for member in model.members:
+        checks = member.design_checks
+        for family in checks.check_families:
+            assert set(getattr(checks, family)) == set(model.load_duration_envelopes)
+        assert set(checks.envelope_bounds) <= set(model.load_duration_envelopes)
+        assert checks.max_usage == pytest.approx(usages[member.label])
+
+
+def test_envelope_mode_is_serial(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    with pytest.raises(ValueError):
+        solved_wood_model().perform_uls_checks(mode="envelope", workers=2)
+
+
+def test_envelope_bounds_leave_the_results_untouched(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    combinations = sorted(model.load_combinations, key=lambda comb: comb.label)
+    envelope = DesignEnvelopeCombination("ENV", combinations)
+    member = min(model.members, key=lambda member: member.label)
+
+    member.perform_envelope_uls_checks([envelope])
+
+    assert envelope not in member.results.axial_forces
+    assert envelope not in member.results.peak_x_local
+    axial = [member.design_checks.get_internal_forces(case, False)[0] for case in combinations]
+    bounds = member.design_checks.get_internal_forces(envelope, include_peaks=False)
+    np.testing.assert_array_equal(bounds[0][0], np.min(axial, axis=0))
+    np.testing.assert_array_equal(bounds[0][1], np.max(axial, axis=0))
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import json
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from desssign.common.design_check import CheckSummary
+from desssign.common.export import ResultsWriter
+from desssign.common.model import DesignModelFrameXZ
+
+
+def test_stream_all_rows_to_csv(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    model = solved_wood_model()
+    path = tmp_path / "results.csv"
+
+    with ResultsWriter(path, buffer_size=4) as writer:
+        model.perform_uls_checks(writer=writer)
+        assert writer.rows_written == 30
+
+    with open(path, newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 30
+    assert max(float(row["max_usage"]) for row in rows) == pytest.approx(
+        max(member.design_checks.max_usage for member in model.members)
+    )
+
+
+def test_stream_governing_rows_to_gzipped_jsonl(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    model = solved_wood_model()
+    path = tmp_path / "results.jsonl.gz"
+
+    with ResultsWriter(path, governing_only=True) as writer:
+        assert writer.compress
+        model.perform_uls_checks(workers=2, backend="thread", writer=writer)
+
+    with gzip.open(path, "rt") as file:
+        rows = [json.loads(line) for line in file]
+    # 3 members and 5 check families
+    assert len(rows) == 15
+    assert {row["member"] for row in rows} == {member.label for member in model.members}
+
+
+def test_infinite_usages_are_strict_json(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    model = solved_wood_model()
+    member = next(iter(model.members))
+    combination = next(iter(model.load_combinations))
+    path = tmp_path / "results.jsonl"
+
+    with ResultsWriter(path) as writer:
+        writer.write_member(
+            member,
+            [CheckSummary("bending", combination, float("inf"), float("nan"), "", "")],
+        )
+
+    with open(path) as file:
+        (row,) = [json.loads(line, parse_constant=pytest.fail) for line in file]
+    assert row["max_usage"] == "inf"
+    assert row["position"] is None
+
+
+def test_unknown_format_is_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        ResultsWriter(tmp_path / "results.txt")
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from desssign.common.model import DesignModelFrameXZ
+from desssign.loads.load_case_combination import DesignEnvelopeCombination
+
+
+@pytest.mark.parametrize("load_factor", [1.0, 20.0])
+def test_fused_checks_match_per_family_checks(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], load_factor: float
+) -> None:
+    model = solved_wood_model(load_factor=load_factor)
+    combinations = sorted(model.load_combinations, key=lambda comb: comb.label)
+
+    for member in model.members:
+        checks = member.design_checks
+        member.perform_uls_checks(combinations)
+        expected = {
+            (summary.family, summary.combination): summary
+            for summary in checks.summarize()
+        }
+
+        checks.perform_fused_uls_checks(combinations)
+
+        assert checks.summaries == expected
+
+
+def test_fused_checks_of_envelopes(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    envelope = DesignEnvelopeCombination("ENV", list(model.load_combinations))
+
+    for member in model.members:
+        checks = member.design_checks
+        member.perform_envelope_uls_checks([envelope])
+        expected = {
+            (summary.family, summary.combination): summary
+            for summary in checks.summarize()
+        }
+
+        checks.perform_fused_uls_checks([envelope])
+
+        assert checks.summaries == expected
+
+
+def test_fused_checks_fall_back_without_pipeline(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    combinations = sorted(model.load_combinations, key=lambda comb: comb.label)
+    member = min(model.members, key=lambda member: member.label)
+    checks = member.design_checks
+    member.perform_uls_checks(combinations)
+    expected = {
+        (summary.family, summary.combination): summary for summary in checks.summarize()
+    }
+
+    checks.pipeline = None
+    checks.perform_fused_uls_checks(combinations)
+
+    assert checks.summaries == expected
+    assert all(not getattr(checks, family) for family in checks.check_families)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from desssign.common.design_check import CheckSummary
+from desssign.common.governing import GoverningIndex
+
+
+def summary(family: str, combination: str, max_usage: float) -> CheckSummary:
+    return CheckSummary(family, combination, max_usage, 0.0, "EN 1995-1-1", "6.3")
+
+
+def test_index_keeps_top_k_per_member_and_family() -> None:
+    index = GoverningIndex(top_k=2)
+    for i, usage in enumerate([0.3, 0.9, 0.1, 0.7]):
+        index.push("M1", summary("shear_check", f"CO{i}", usage))
+    index.push("M1", summary("beam_stability", "CO0", 0.2))
+
+    entries = index.get_member_entries("M1", family="shear_check")
+
+    assert [entry.max_usage for entry in entries] == [0.9, 0.7]
+    assert [entry.combination for entry in entries] == ["CO1", "CO3"]
+    assert len(index) == 3
+
+
+def test_governing_is_sorted_and_limited() -> None:
+    index = GoverningIndex(top_k=3)
+    for member, usages in {"M1": [0.5, 1.2], "M2": [0.8, 0.1]}.items():
+        for i, usage in enumerate(usages):
+            index.push(member, summary("shear_check", f"CO{i}", usage))
+
+    governing = index.governing(limit=2)
+
+    assert [(entry.member, entry.max_usage) for entry in governing] == [
+        ("M1", 1.2),
+        ("M2", 0.8),
+    ]
+
+
+def test_discard_member() -> None:
+    index = GoverningIndex()
+    index.push("M1", summary("shear_check", "CO1", 0.5))
+    index.push("M2", summary("shear_check", "CO1", 0.6))
+
+    index.discard_member("M1")
+
+    assert [entry.member for entry in index.governing()] == ["M2"]
+    assert index.get_member_entries("M1") == []
+    index.discard_member("M1")
+    assert len(index) == 1
+
+
+def test_top_k_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        GoverningIndex(top_k=0)
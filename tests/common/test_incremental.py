@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from desssign.common.model import DesignModelFrameXZ
+from desssign.wood.wood_section import WoodRectangularSection
+
+
+def test_incremental_checks_skip_unchanged_members(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    model.perform_uls_checks(incremental=True)
+    combinations = model.get_uls_combinations()
+
+    assert model.get_stale_combinations(combinations) == {}
+
+    member = min(model.members, key=lambda member: member.label)
+    usage = member.design_checks.max_usage
+    member.section = WoodRectangularSection(
+        "100/300", 0.1, 0.3, member.section.material
+    )
+
+    stale = model.get_stale_combinations(combinations)
+    assert list(stale) == [member]
+    assert set(stale[member][1]) == set(combinations)
+
+    model.perform_uls_checks(incremental=True)
+    assert member.design_checks.max_usage < usage
+    assert model.get_stale_combinations(combinations) == {}
+
+
+def test_incremental_checks_match_full_checks(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    model.perform_uls_checks(incremental=True)
+    for member in model.members:
+        member.buckling_length_y = 0.5 * member.length
+    model.perform_uls_checks(incremental=True)
+
+    full = solved_wood_model()
+    for member in full.members:
+        member.buckling_length_y = 0.5 * member.length
+    full.perform_uls_checks()
+
+    usages = {member.label: member.design_checks.max_usage for member in full.members}
+    for member in model.members:
+        assert member.design_checks.max_usage == usages[member.label]
+
+
+def test_mark_dirty(solved_wood_model: Callable[..., DesignModelFrameXZ]) -> None:
+    model = solved_wood_model()
+    model.perform_uls_checks(incremental=True)
+    member = next(iter(model.members))
+
+    model.mark_dirty(member)
+
+    assert list(model.get_stale_combinations(model.get_uls_combinations())) == [member]
+    with pytest.raises(ValueError):
+        model.perform_uls_checks(incremental=True, workers=2)
+
+
+def test_unchanged_results_are_not_hashed_again(
+    solved_wood_model: Callable[..., DesignModelFrameXZ],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    model = solved_wood_model()
+    model.perform_uls_checks(incremental=True)
+    member = min(model.members, key=lambda member: member.label)
+    combination = min(model.get_uls_combinations(), key=lambda combination: combination.label)
+
+    hashed = []
+    monkeypatch.setattr(
+        "desssign.common.model.combination_fingerprint",
+        lambda member, combination: hashed.append(combination) or "",
+    )
+    assert model.get_stale_combinations(model.get_uls_combinations()) == {}
+    assert hashed == []
+
+    # Replaced result arrays are hashed again
+    moments = member.results.bending_moments_y
+    moments[combination] = 2 * moments[combination]
+    assert set(model.get_stale_combinations(model.get_uls_combinations())[member][1]) == {
+        combination
+    }
+    assert hashed == [combination]
+
+
+def test_checks_of_removed_combinations_are_dropped(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    model.perform_uls_checks(incremental=True)
+    removed = max(model.get_uls_combinations(), key=lambda combination: combination.label)
+
+    model.load_combinations.discard(removed)
+    model.perform_uls_checks(incremental=True)
+
+    for member in model.members:
+        assert removed not in member.design_checks.shear_check
+        assert removed not in model.check_fingerprints[member][1]
+    assert all(entry.combination is not removed for entry in model.governing(limit=None))
+    assert removed not in model.results_table.get_combinations()
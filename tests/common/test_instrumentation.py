@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+from desssign.common.instrumentation import CallbackSink
+from desssign.common.instrumentation import Instrumentation
+from desssign.common.instrumentation import JsonSink
+from desssign.common.instrumentation import MemorySink
+from desssign.common.instrumentation import instrumentation
+from desssign.common.model import DesignModelFrameXZ
+
+
+def test_session_records_checks(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    model = solved_wood_model()
+    memory = MemorySink()
+    reports: list[dict[str, Any]] = []
+
+    with instrumentation.session(
+        memory, JsonSink(tmp_path / "report.json"), CallbackSink(reports.append)
+    ):
+        model.perform_uls_checks()
+
+    report = memory.report
+    assert report is not None
+    assert report["counters"] == {"checked_members": 3}
+    timers = report["timers"]
+    assert timers["DesignModel.perform_uls_checks"]["calls"] == 1
+    assert timers["WoodMember1DChecks.perform_shear_checks"]["calls"] == 3
+    # Every family fetches the internal forces of 2 combinations on 3 members
+    assert timers["Member1DChecks.get_internal_forces"]["calls"] >= 5 * 2 * 3
+    assert timers["DesignModel.perform_uls_checks"]["wall"] >= max(
+        timer["wall"] for name, timer in timers.items() if name.startswith("Wood")
+    )
+
+    assert reports == [report]
+    with open(tmp_path / "report.json") as file:
+        assert json.load(file) == report
+    assert not instrumentation.enabled
+
+
+def test_disabled_instrumentation_records_nothing(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    instrumentation.reset()
+
+    solved_wood_model().perform_uls_checks()
+
+    assert instrumentation.get_report() == {"counters": {}, "timers": {}}
+
+
+def test_calls_in_threads_are_all_recorded() -> None:
+    recorder = Instrumentation()
+    recorder.enable()
+
+    @recorder.instrument("work")
+    def work() -> None:
+        recorder.count("calls")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(8):
+            executor.submit(lambda: [work() for _ in range(2000)])
+
+    report = recorder.get_report()
+    assert report["counters"] == {"calls": 16000}
+    assert report["timers"]["work"]["calls"] == 16000
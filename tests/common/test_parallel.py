@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from desssign.common.model import DesignModelFrameXZ
+
+
+def max_usages(model: DesignModelFrameXZ) -> dict[tuple[str, str, str], float]:
+    return {
+        (member.label, summary.family, summary.combination.label): summary.max_usage
+        for member in model.members
+        for summary in member.design_checks.summarize()
+    }
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+@pytest.mark.parametrize("model_factory", ["solved_wood_model", "solved_concrete_model"])
+def test_parallel_checks_match_serial_checks(
+    backend: str, model_factory: str, request: pytest.FixtureRequest
+) -> None:
+    # Members of the concrete model have sections with different resistances
+    factory: Callable[..., DesignModelFrameXZ] = request.getfixturevalue(model_factory)
+    kwargs = {"sections": True} if model_factory == "solved_concrete_model" else {}
+
+    serial = factory(**kwargs)
+    serial.perform_uls_checks()
+
+    parallel = factory(**kwargs)
+    parallel.perform_uls_checks(workers=2, backend=backend)
+
+    expected = max_usages(serial)
+    result = max_usages(parallel)
+
+    assert result.keys() == expected.keys()
+    for key, usage in expected.items():
+        assert result[key] == pytest.approx(usage)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from desssign.common.model import DesignModelFrameXZ
+from desssign.common.result_store import MemmapResultMapping
+
+
+def test_checks_read_offloaded_results(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    expected_model = solved_wood_model()
+    expected_model.perform_uls_checks()
+    expected = {
+        member.label: member.design_checks.max_usage
+        for member in expected_model.members
+    }
+
+    model = solved_wood_model()
+    store = model.offload_results(tmp_path)
+
+    assert len(list(tmp_path.glob("*.npy"))) == 3
+    for member in model.members:
+        assert isinstance(member.results.bending_moments_y, MemmapResultMapping)
+        assert isinstance(
+            next(iter(member.results.bending_moments_y.values())), np.memmap
+        )
+
+    model.perform_uls_checks()
+    for member in model.members:
+        assert member.design_checks.max_usage == expected[member.label]
+
+    member = next(iter(model.members))
+    moments = dict(member.results.bending_moments_y)
+    store.load(member)
+    assert isinstance(member.results.bending_moments_y, dict)
+    for case, array in moments.items():
+        assert_array_equal(member.results.bending_moments_y[case], array)
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+
+
+def test_check_arrays_are_offloaded(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    model = solved_wood_model()
+    store = model.offload_results(tmp_path)
+    model.perform_uls_checks()
+    expected = {member.label: member.design_checks.max_usage for member in model.members}
+
+    store.offload_members(model.members)
+
+    assert len(list(tmp_path.glob("*.npy"))) == 3
+    member = next(iter(model.members))
+    check_arrays = store.get_check_arrays(member)
+    assert check_arrays
+    assert all(isinstance(values, np.memmap) for _, _, values in check_arrays)
+    for member in model.members:
+        assert member.design_checks.max_usage == expected[member.label]
+
+    store.load(member)
+    assert not any(
+        isinstance(values, np.memmap) for _, _, values in store.get_check_arrays(member)
+    )
+    assert member.design_checks.max_usage == expected[member.label]
+
+
+def test_new_results_stay_in_memory(
+    solved_wood_model: Callable[..., DesignModelFrameXZ], tmp_path: Path
+) -> None:
+    model = solved_wood_model()
+    model.offload_results(tmp_path)
+    member = next(iter(model.members))
+    results = member.results.axial_forces
+    n_cases = len(results)
+
+    results["new"] = np.ones(3)
+
+    assert len(results) == n_cases + 1
+    assert_array_equal(results.get("new"), np.ones(3))
+    assert results.get("missing") is None
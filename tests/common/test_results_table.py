@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+from desssign.common.design_check import CheckSummary
+from desssign.common.model import DesignModelFrameXZ
+from desssign.common.results_table import ResultsTable
+
+
+def test_results_table_is_filled_by_checks(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    model.perform_uls_checks()
+    table = model.results_table
+
+    # 3 members, 5 check families and 2 combinations
+    assert len(table) == 30
+    assert set(table["limit_state"]) == {"uls"}
+    for member in model.members:
+        rows = table.filter(members=[member])
+        assert rows["max_usage"].max() == member.design_checks.max_usage
+
+    # Re-checking a member replaces its rows
+    model.perform_uls_checks()
+    assert len(model.results_table) == 30
+
+
+def test_results_table_queries(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+    model.perform_uls_checks()
+    table = model.results_table
+
+    shear = table.filter(family="shear_check", limit_state="ULS", min_usage=0.1)
+    assert set(shear["family"]) == {"shear_check"}
+    assert np.all(shear["max_usage"] >= 0.1)
+
+    ordered = table.sort()
+    assert np.all(np.diff(ordered["max_usage"]) <= 0)
+    assert ordered["max_usage"][0] == max(
+        member.design_checks.max_usage for member in model.members
+    )
+
+    governing = table.group_max("member")
+    assert len(governing) == 3
+    for member, usage in zip(governing.get_members(), governing["max_usage"]):
+        assert usage == member.design_checks.max_usage
+
+    per_family = table.group_max(("member", "family"))
+    assert len(per_family) == 15
+    assert {comb.label for comb in per_family.get_combinations()} <= {"CO1", "CO2"}
+
+
+def test_discards_are_merged_once() -> None:
+    table = ResultsTable()
+    for member in ("M1", "M2", "M3"):
+        table.add_member(member, [CheckSummary("shear_check", "CO1", 0.5, 0.0, "EN", "6.1")])
+    assert len(table) == 3
+
+    table.add_member("M1", [CheckSummary("shear_check", "CO1", 0.7, 0.0, "EN", "6.1")])
+    table.discard_member("M2")
+    table.discard_member("M3")
+    table.add_member("M3", [])
+
+    assert len(table) == 1
+    assert list(table["max_usage"]) == [0.7]
+    assert table.get_members() == ["M1"]
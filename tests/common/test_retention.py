@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from desssign.common.design_check import Check
+from desssign.common.design_check import CheckSummary
+from desssign.common.design_check import TopKChecks
+from desssign.common.design_check import TopKSummaries
+from desssign.common.model import DesignModelFrameXZ
+
+
+class FixedCheck(Check):
+    def __init__(self, usage: float) -> None:
+        super().__init__("", "", "")
+        self.usage = usage
+
+    @property
+    def max_usage(self) -> float:
+        return self.usage
+
+
+def test_top_k_checks_keep_highest_usages() -> None:
+    checks = TopKChecks(2)
+    for combination, usage in (("a", 0.5), ("b", 0.2), ("c", 0.9), ("d", 0.1)):
+        checks[combination] = FixedCheck(usage)
+
+    assert sorted(checks) == ["a", "c"]
+
+    checks["c"] = FixedCheck(0.3)
+    checks["e"] = FixedCheck(0.4)
+    assert sorted(checks) == ["a", "e"]
+
+    with pytest.raises(ValueError):
+        TopKChecks(0)
+
+
+def test_top_k_summaries_keep_highest_usages_per_family() -> None:
+    summaries = TopKSummaries(1)
+    for family, combination, usage in (
+        ("tension", "a", 0.5),
+        ("tension", "b", 0.7),
+        ("bending", "a", 0.9),
+        ("bending", "b", 0.3),
+    ):
+        summaries[(family, combination)] = CheckSummary(family, combination, usage, 0.0, "", "")
+
+    assert sorted(summaries) == [("bending", "a"), ("tension", "b")]
+    del summaries[("tension", "b")]
+    assert len(summaries) == 1
+    with pytest.raises(KeyError):
+        summaries[("shear", "a")]
+
+
+def test_model_retention_keeps_governing_checks(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    full = solved_wood_model()
+    full.perform_uls_checks()
+    usages = {member.label: member.design_checks.max_usage for member in full.members}
+
+    model = solved_wood_model()
+    model.set_check_retention(1)
+    model.perform_uls_checks()
+
+    for member in model.members:
+        checks = member.design_checks
+        for family in checks.check_families:
+            assert len(getattr(checks, family)) == 1
+        assert checks.max_usage == usages[member.label]
+    assert len(model.results_table) == 15
+
+
+def test_model_retention_bounds_fused_summaries(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    full = solved_wood_model()
+    model = solved_wood_model()
+    model.set_check_retention(1)
+
+    usages = {}
+    for member in full.members:
+        member.design_checks.perform_fused_uls_checks(list(full.load_combinations))
+        usages[member.label] = member.design_checks.max_usage
+
+    for member in model.members:
+        member.design_checks.perform_fused_uls_checks(list(model.load_combinations))
+
+        summaries = member.design_checks.summaries
+        assert len(summaries) == len({family for family, _ in summaries})
+        assert member.design_checks.max_usage == usages[member.label]
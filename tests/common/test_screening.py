@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import pytest
+
+from desssign.common.enums import CheckResult
+from desssign.common.model import DesignModelFrameXZ
+
+
+def test_screening_passes_all_members(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model()
+
+    results = model.perform_uls_checks(mode="screen")
+
+    assert results is not None
+    assert set(results.values()) == {CheckResult.PASS}
+    for member in model.members:
+        assert len(member.design_checks.shear_check) == 2
+
+
+def test_screening_stops_at_first_failing_combination(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model(load_factor=20.0)
+
+    results = model.perform_uls_checks(mode="screen")
+
+    assert results is not None
+    assert set(results.values()) == {CheckResult.FAIL}
+    for member in model.members:
+        # The combination with the leading imposed load is the most severe one
+        (combination,) = member.design_checks.shear_check
+        assert combination.label == "CO1"
+
+
+def test_screening_stops_at_first_failing_member(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_wood_model(load_factor=20.0)
+
+    results = model.perform_uls_checks(mode="screen", stop_at_first_failure=True)
+
+    assert results is not None
+    assert list(results.values()) == [CheckResult.FAIL]
+
+
+def test_screening_is_serial(
+    solved_wood_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    with pytest.raises(ValueError):
+        solved_wood_model().perform_uls_checks(mode="screen", workers=2)
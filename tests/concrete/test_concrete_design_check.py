@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from desssign.concrete.design_checks.design_check import BendingCheck
+from desssign.concrete.design_checks.design_check import bending_usages
+
+M_ED = np.array([[-30.0, -10.0, 0.0, 20.0], [-5.0, 10.0, 15.0, 60.0]])
+
+
+@pytest.mark.parametrize(
+    ("m_rd_positive", "m_rd_negative"),
+    [
+        (30.0, -40.0),
+        (30, -40),
+        (np.array([30.0, 30.0, 60.0, 60.0]), np.array([-40.0, -40.0, -80.0, -80.0])),
+    ],
+)
+def test_bending_usages_of_a_block_match_single_combinations(
+    m_rd_positive: float | np.ndarray, m_rd_negative: float | np.ndarray
+) -> None:
+    usages = bending_usages(M_ED, m_rd_positive, m_rd_negative)
+
+    assert usages.shape == M_ED.shape
+    for m_ed, row in zip(M_ED, usages):
+        np.testing.assert_allclose(bending_usages(m_ed, m_rd_positive, m_rd_negative), row)
+    assert np.all(usages >= 0)
+
+
+def test_bending_check_of_an_envelope() -> None:
+    check = BendingCheck(M_ED, 30.0, -40.0)
+
+    np.testing.assert_allclose(check.usages.max(axis=0), [0.75, 10 / 30, 0.5, 2.0])
+    assert check.max_usage == pytest.approx(2.0)
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from typing import Callable
+
+    from desssign.common.model import DesignModelFrameXZ
+
+
+def test_resistances_are_cached_along_the_member(
+    solved_concrete_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_concrete_model(sections=True)
+    member = next(iter(model.members))
+
+    expected = np.concatenate(
+        [
+            np.full(element.sampling_points.shape, element.section.v_rd)
+            for element in member.generated_elements
+        ]
+    )
+    v_rd = member.design_checks.get_shear_force_resistance()
+
+    np.testing.assert_array_equal(v_rd, expected)
+    assert v_rd.dtype == np.float64 and v_rd.flags.c_contiguous
+    assert member.design_checks.get_shear_force_resistance() is v_rd
+    assert v_rd.size == member.x_local.size
+
+    m_rd_positive, m_rd_negative = member.design_checks.get_moments_of_resistance()
+    assert set(m_rd_positive) == {30e3, 60e3}
+    assert set(m_rd_negative) == {-40e3, -80e3}
+
+    model.perform_uls_checks()
+    check = next(iter(member.design_checks.shear_check.values()))
+    assert check.usages.shape == expected.shape
+
+
+def test_resistances_are_invalidated_when_sections_change(
+    solved_concrete_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_concrete_model(sections=True)
+    member = next(iter(model.members))
+    v_rd = member.v_rd
+
+    member.sections = dict(member.sections)
+
+    assert "v_rd" not in member.__dict__
+    assert member.v_rd is not v_rd
+    np.testing.assert_array_equal(member.v_rd, v_rd)
+
+
+def test_resistances_are_invalidated_when_elements_are_generated(
+    solved_concrete_model: Callable[..., DesignModelFrameXZ]
+) -> None:
+    model = solved_concrete_model(sections=True)
+    member = next(iter(model.members))
+    v_rd = member.v_rd
+
+    member.generate_elements()
+
+    assert "v_rd" not in member.__dict__
+    assert member.v_rd.size == 2 * v_rd.size
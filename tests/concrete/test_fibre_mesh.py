@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from desssign.concrete.fibre_mesh import clear_fibre_meshes
+from desssign.concrete.fibre_mesh import get_fibre_mesh
+from desssign.concrete.fibre_mesh import mesh_polygon
+
+
+def test_mesh_of_a_triangle_is_exact() -> None:
+    y, z, area = mesh_polygon([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]], 0.03)
+
+    assert area.sum() == pytest.approx(0.5, rel=1e-12)
+    assert np.average(y, weights=area) == pytest.approx(1 / 3, rel=1e-12)
+    assert np.average(z, weights=area) == pytest.approx(1 / 3, rel=1e-12)
+    # Cells cut by the hypotenuse are clipped
+    assert area.min() < 0.03**2 / 2
+
+
+def test_mesh_of_a_hollow_section() -> None:
+    # Clockwise outline and counter-clockwise hole, the orientations are normalised
+    outline = [[0.0, 0.0], [0.0, 1.0], [1.0, 1.0], [1.0, 0.0], [0.0, 0.0]]
+    hole = [[0.2, 0.2], [0.7, 0.2], [0.7, 0.7], [0.2, 0.7]]
+
+    y, z, area = mesh_polygon(outline, 0.013, holes=[hole])
+
+    assert area.sum() == pytest.approx(0.75)
+    assert np.average(y, weights=area) == pytest.approx((0.5 - 0.25 * 0.45) / 0.75)
+    assert not np.any((0.21 < y) & (y < 0.69) & (0.21 < z) & (z < 0.69))
+
+
+def test_second_moment_of_a_circle() -> None:
+    angles = np.linspace(0.0, 2 * math.pi, 360, endpoint=False)
+    circle = np.column_stack((0.3 * np.cos(angles), 0.3 * np.sin(angles)))
+
+    mesh = get_fibre_mesh(circle, 0.005)
+
+    assert mesh.total_area == pytest.approx(math.pi * 0.3**2, rel=1e-4)
+    assert mesh.z**2 @ mesh.area == pytest.approx(math.pi * 0.3**4 / 4, rel=1e-3)
+
+
+def test_meshes_are_shared_by_equal_geometries(monkeypatch: pytest.MonkeyPatch) -> None:
+    mesh = get_fibre_mesh([[0.0, 0.0], [0.3, 0.0], [0.3, 0.5], [0.0, 0.5]], 0.01)
+
+    assert get_fibre_mesh([[0.0, 0.0], [0.3, 0.0], [0.3, 0.5], [0.0, 0.5]], 0.01) is mesh
+    assert get_fibre_mesh([[0.0, 0.0], [0.3, 0.0], [0.3, 0.5], [0.0, 0.5]], 0.02) is not mesh
+    assert not mesh.area.flags.writeable
+
+    # The least recently used mesh is dropped first
+    monkeypatch.setattr("desssign.concrete.fibre_mesh.FIBRE_MESH_CACHE_SIZE", 2)
+    clear_fibre_meshes()
+    square = [[0.0, 0.0], [0.3, 0.0], [0.3, 0.3], [0.0, 0.3]]
+    fine, coarse = get_fibre_mesh(square, 0.01), get_fibre_mesh(square, 0.02)
+    assert get_fibre_mesh(square, 0.01) is fine
+    get_fibre_mesh(square, 0.05)
+    assert get_fibre_mesh(square, 0.01) is fine
+    assert get_fibre_mesh(square, 0.02) is not coarse
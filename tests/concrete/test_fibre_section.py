@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from desssign.concrete.concrete_material import ConcreteMaterial
+from desssign.concrete.fibre_section import FibreSection
+from desssign.concrete.fibre_section import Rebar
+from desssign.concrete.rebar_material import RebarMaterial
+from desssign.concrete.stress_strain_profile import ConcreteCompressionSSP
+from desssign.concrete.stress_strain_profile import ConcreteStressStrainProfile
+from desssign.concrete.stress_strain_profile import ConcreteTensionSSP
+from desssign.concrete.stress_strain_profile import ReinforcementStressStrainProfile
+from desssign.concrete.stress_strain_profile import StressStrainProfile
+
+B, H = 0.3, 0.5
+RECTANGLE = [[0.0, 0.0], [B, 0.0], [B, H], [0.0, H]]
+
+
+def test_elastic_section() -> None:
+    elastic = StressStrainProfile([-1.0, 1.0], [-30e9, 30e9])
+    section = FibreSection(RECTANGLE, elastic, mesh_size=0.01)
+    eps_0 = np.array([0.0, -1e-4, 0.0])
+    kappa_y = np.array([1e-3, 0.0, 0.0])
+    kappa_z = np.array([0.0, 0.0, 2e-3])
+
+    n, m_y, m_z = section.get_forces(eps_0, kappa_y, kappa_z)
+
+    np.testing.assert_allclose(n, [0.0, -1e-4 * 30e9 * B * H, 0.0], atol=1e-3)
+    np.testing.assert_allclose(m_y, [30e9 * B * H**3 / 12 * 1e-3, 0.0, 0.0], rtol=2e-3, atol=1e-3)
+    np.testing.assert_allclose(m_z, [0.0, 0.0, 30e9 * H * B**3 / 12 * 2e-3], rtol=2e-3, atol=1e-3)
+
+
+def test_moment_resistance_of_a_beam() -> None:
+    concrete = ConcreteMaterial("C30/37")
+    steel = RebarMaterial("B500B")
+    concrete_profile = ConcreteStressStrainProfile(
+        concrete,
+        "ULS",
+        ConcreteCompressionSSP.PARABOLIC_RECTANGULAR,
+        ConcreteTensionSSP.NONE,
+        n_points_1=50,
+    )
+    steel_profile = ReinforcementStressStrainProfile(steel, "ULS")
+    rebars = [Rebar(y, 0.05, 0.02, steel_profile) for y in (0.06, 0.15, 0.24)]
+    section = FibreSection(RECTANGLE, concrete_profile, rebars, mesh_size=0.005)
+
+    # Compression at the top (+z) gives negative bending moments My
+    m_y, m_z = section.get_moment_resistance(0.0, theta=math.pi / 2)
+
+    a_s = 3 * math.pi * 0.02**2 / 4
+    x = a_s * steel.f_yd / (0.8095 * B * concrete.f_cd)
+    assert m_y == pytest.approx(-a_s * steel.f_yd * (0.45 - 0.416 * x), rel=0.01)
+    assert m_z == pytest.approx(0.0, abs=1.0)
+
+
+def test_moment_resistance_is_vectorised_over_axial_forces() -> None:
+    concrete_profile = ConcreteStressStrainProfile(
+        ConcreteMaterial("C30/37"), "ULS", ConcreteCompressionSSP.BILINEAR, ConcreteTensionSSP.NONE
+    )
+    steel_profile = ReinforcementStressStrainProfile(RebarMaterial("B500B"), "ULS")
+    rebars = [Rebar(0.05, z, 0.016, steel_profile) for z in (0.05, 0.45)]
+    section = FibreSection(RECTANGLE, concrete_profile, rebars, mesh_size=0.01)
+    n_ed = np.array([0.0, -500e3, -1500e3, -1e9])
+
+    m_y, _ = section.get_moment_resistance(n_ed, theta=-math.pi / 2)
+
+    for n, m in zip(n_ed[:3], m_y[:3]):
+        assert m == pytest.approx(section.get_moment_resistance(n, theta=-math.pi / 2)[0])
+    assert np.all(m_y[:3] > 0)
+    assert m_y[0] < m_y[1]
+    assert np.isnan(m_y[3])
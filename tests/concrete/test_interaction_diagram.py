@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from framesss.solvers.linear_static import LinearStaticSolver
+
+from desssign.common.model import DesignModelFrameXZ
+from desssign.concrete.concrete_material import ConcreteMaterial
+from desssign.concrete.concrete_section import ConcreteSection
+from desssign.concrete.design_checks.design_check import AxialBendingCheck
+from desssign.concrete.interaction_diagram import InteractionDiagram
+from desssign.concrete.interaction_diagram import clear_interaction_diagrams
+from desssign.concrete.rebar_material import RebarMaterial
+
+CONCRETE = ConcreteMaterial("C30/37")
+STEEL = RebarMaterial("B500B")
+REBARS = [(0.05, 0.05, 0.02), (0.25, 0.05, 0.02), (0.05, 0.45, 0.02), (0.25, 0.45, 0.02)]
+
+
+def get_section(label: str = "C") -> ConcreteSection:
+    return ConcreteSection(
+        label=label,
+        points=[[0.0, 0.0], [0.3, 0.0], [0.3, 0.5], [0.0, 0.5]],
+        material=CONCRETE,
+        v_rd=100e3,
+        m_rd_positive=100e3,
+        m_rd_negative=-100e3,
+        rebars=REBARS,
+        rebar_material=STEEL,
+    )
+
+
+def test_interaction_diagram_of_a_column() -> None:
+    diagram = get_section().get_interaction_diagram()
+
+    a_s = 4 * math.pi * 0.01**2
+    assert diagram.n.max() == pytest.approx(a_s * STEEL.f_yd, rel=1e-3)
+    # Pure compression at eps_c2 = 2 per mille
+    n_rd = (0.15 - a_s) * CONCRETE.f_cd + a_s * min(0.002 * STEEL.e, STEEL.f_yd)
+    assert diagram.n.min() == pytest.approx(-n_rd, rel=0.01)
+    assert diagram.m.max() == pytest.approx(-diagram.m.min())
+
+
+def test_usages_of_a_square_diagram() -> None:
+    diagram = InteractionDiagram([-2.0, 1.0, 1.0, -2.0], [-1.0, -1.0, 1.0, 1.0])
+
+    usages = diagram.get_usages(
+        [[0.5, -4.0, 0.0], [0.0, 0.5, 1.0]], [[0.0, 0.0, 0.5], [0.0, 0.5, 1.0]]
+    )
+
+    np.testing.assert_allclose(usages, [[0.5, 2.0, 0.5], [0.0, 0.5, 1.0]])
+
+    # Rays missing a diagram without the origin are unsafe
+    shifted = InteractionDiagram([1.0, 3.0, 3.0, 1.0], [-1.0, -1.0, 1.0, 1.0])
+    assert shifted.get_usages(-1.0, 0.0) == np.inf
+    assert shifted.get_usages(0.0, 1.0) == np.inf
+
+
+def test_diagrams_are_shared_by_equal_sections(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_section("A").get_interaction_diagram() is get_section("B").get_interaction_diagram()
+
+    # The least recently used diagram is dropped first
+    monkeypatch.setattr("desssign.concrete.interaction_diagram.INTERACTION_DIAGRAM_CACHE_SIZE", 2)
+    clear_interaction_diagrams()
+    diagram_y = get_section().get_interaction_diagram("ULS", "y")
+    diagram_z = get_section().get_interaction_diagram("ULS", "z")
+    assert get_section().get_interaction_diagram("ULS", "y") is diagram_y
+    get_section().get_interaction_diagram("SLS", "y")
+    assert get_section().get_interaction_diagram("ULS", "y") is diagram_y
+    assert get_section().get_interaction_diagram("ULS", "z") is not diagram_z
+
+
+def test_axial_bending_checks_of_a_member() -> None:
+    model = DesignModelFrameXZ()
+    fixed = ["fixed", "free", "fixed", "free", "fixed", "free"]
+    node_1 = model.add_node("1", [0, 0, 0], fixity=fixed)
+    node_2 = model.add_node("2", [0, 0, 4], fixity=["free", "free", "free", "free", "free", "free"])
+    member = model.add_concrete_member("1-2", "navier", [node_1, node_2], get_section())
+    g = model.add_design_load_case("G", load_type="permanent")
+    q = model.add_design_load_case("Q", load_type="variable", category="a")
+    member.add_point_load([0, 0, -800e3, 0, 0, 0], g, x=1.0)
+    member.add_distributed_load(np.array([5, 0, 0, 5, 0, 0]) * 1e3, q)
+    co1 = model.add_design_load_case_combination("CO1", "ULS", "basic", [g], q, [])
+    co2 = model.add_design_load_case_combination("CO2", "ULS", "basic", [g], None, [])
+    LinearStaticSolver(model).solve()
+
+    model.perform_uls_checks()
+
+    checks = member.design_checks
+    assert "axial_bending_check" in checks.get_check_families()
+    diagram = member.section.get_interaction_diagram()
+    for combination in (co1, co2):
+        check = checks.axial_bending_check[combination]
+        assert isinstance(check, AxialBendingCheck)
+        axial, _, _, _, bending_y, _ = checks.get_internal_forces(combination, include_peaks=False)
+        np.testing.assert_allclose(check.usages, diagram.get_usages(axial, bending_y))
+        assert np.all(axial < 0)
+    assert checks.axial_bending_check[co1].max_usage > checks.axial_bending_check[co2].max_usage
+
+    # Round-off moments about the z-axis keep the uniaxial diagram
+    axial, _, _, _, bending_y, _ = checks.get_internal_forces(co1, include_peaks=False)
+    uniaxial = checks.get_axial_bending_usages(axial, bending_y)
+    np.testing.assert_array_equal(
+        checks.get_axial_bending_usages(axial, bending_y, 1e-9 * bending_y), uniaxial
+    )
+    biaxial = checks.get_axial_bending_usages(axial, bending_y, 0.2 * bending_y)
+    assert biaxial.max() > uniaxial.max()
+
+
+def test_interaction_surface_matches_the_diagrams() -> None:
+    section = get_section()
+    surface = section.get_interaction_surface()
+    n_ed = np.linspace(-3e6, 4e5, 9)
+
+    np.testing.assert_allclose(
+        surface.get_usages(n_ed, 1e5, 0.0),
+        section.get_interaction_diagram().get_usages(n_ed, 1e5),
+        rtol=0.03,
+    )
+    np.testing.assert_allclose(
+        surface.get_usages(n_ed, 0.0, 5e4),
+        section.get_interaction_diagram(axis="z").get_usages(n_ed, 5e4),
+        rtol=0.03,
+    )
+    assert surface.get_usages(0.0, 0.0, 0.0) == 0.0
+    assert section.get_interaction_surface() is surface
+
+
+def test_biaxial_usages_exceed_uniaxial_usages() -> None:
+    surface = get_section().get_interaction_surface()
+
+    usages = surface.get_usages(-1e6, [[1e5, 1e5], [0.0, 0.0]], [[0.0, 5e4], [5e4, 0.0]])
+
+    assert usages.shape == (2, 2)
+    assert usages[0, 1] > max(usages[0, 0], usages[1, 0])
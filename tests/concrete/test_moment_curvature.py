@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from desssign.concrete.concrete_material import ConcreteMaterial
+from desssign.concrete.concrete_section import ConcreteSection
+from desssign.concrete.moment_curvature import MomentCurvature
+from desssign.concrete.moment_curvature import get_moment_curvature_tables
+from desssign.concrete.rebar_material import RebarMaterial
+
+CONCRETE = ConcreteMaterial("C30/37")
+STEEL = RebarMaterial("B500B")
+REBARS = [(0.05, 0.05, 0.02), (0.25, 0.05, 0.02), (0.05, 0.45, 0.02), (0.25, 0.45, 0.02)]
+
+
+def get_section(label: str = "C") -> ConcreteSection:
+    return ConcreteSection(
+        label=label,
+        points=[[0.0, 0.0], [0.3, 0.0], [0.3, 0.5], [0.0, 0.5]],
+        material=CONCRETE,
+        v_rd=100e3,
+        m_rd_positive=100e3,
+        m_rd_negative=-100e3,
+        rebars=REBARS,
+        rebar_material=STEEL,
+    )
+
+
+def test_uncracked_stiffness_and_symmetry() -> None:
+    relation = get_section().get_moment_curvature()
+
+    # Initial modulus of the non-linear profile is 1.05 E_cm, EN 1992-1-1, 3.1.5(1),
+    # its first sampled segment in compression is a slightly softer chord
+    e_c = 1.05 * CONCRETE.e_cm
+    a_s = 4 * math.pi * 0.01**2
+    inertia = 0.3 * 0.5**3 / 12 + (STEEL.e / e_c - 1) * a_s * 0.2**2
+    assert relation.get_tangent_stiffness(0.0) == pytest.approx(e_c * inertia, rel=0.05)
+    assert relation.get_secant_stiffness(0.0) == relation.get_tangent_stiffness(0.0)
+
+    curvatures = np.linspace(0.0, relation.curvatures[-1], 20)
+    np.testing.assert_allclose(
+        relation.get_moments(-curvatures), -relation.get_moments(curvatures), atol=1e-6
+    )
+
+
+def test_cracking_softens_the_section() -> None:
+    relation = get_section().get_moment_curvature()
+
+    uncracked = relation.get_secant_stiffness(1e-5)
+    cracked = relation.get_secant_stiffness(5e-3)
+    assert cracked < 0.5 * uncracked
+
+
+def test_ultimate_moment_matches_the_moment_resistance() -> None:
+    section = get_section()
+    relation = section.get_moment_curvature(n_ed=-500e3)
+
+    fibre_section = section.get_fibre_section("SLS", tension_softening=True)
+    m_rd = fibre_section.get_moment_resistance(-500e3, -math.pi / 2)[0]
+    # Interpolated between the ultimate moments of the neighbouring axial forces
+    assert relation.moments[-1] == pytest.approx(float(m_rd), rel=0.01)
+
+
+def test_interpolated_relation_matches_the_exact_one() -> None:
+    section = get_section()
+    tables = get_moment_curvature_tables(section)
+    relation = section.get_moment_curvature(n_ed=-300e3)
+
+    exact = MomentCurvature.from_fibre_section(tables.fibre_section, -300e3)
+    curvatures = np.linspace(exact.curvatures[0], exact.curvatures[-1], 50)
+    np.testing.assert_allclose(
+        relation.get_moments(curvatures),
+        exact.get_moments(curvatures),
+        atol=0.02 * np.abs(exact.moments).max(),
+    )
+
+    levels = tables.axial_forces
+    grid = section.get_moment_curvature(n_ed=float(levels[3]))
+    np.testing.assert_allclose(grid.moments, tables.get_relation(levels[3]).moments)
+
+
+def test_relation_in_the_format_of_framesss() -> None:
+    section = get_section()
+    section.set_moment_curvature()
+    relation = section.get_moment_curvature()
+
+    for curvature in (-2e-3, 1e-5, 2e-3):
+        assert section.EIy_moment_curvature(curvature, "tangent") == pytest.approx(
+            relation.get_tangent_stiffness(curvature)
+        )
+        assert section.EIy_moment_curvature(curvature, "secant") == pytest.approx(
+            relation.get_secant_stiffness(curvature)
+        )
+
+
+def test_tables_are_shared_by_equal_sections() -> None:
+    tables = get_moment_curvature_tables(get_section("A"))
+    assert get_moment_curvature_tables(get_section("B")) is tables
+    assert get_moment_curvature_tables(get_section(), "ULS") is not tables
+
+    # Axial forces of a non-linear analysis compute only the neighbouring levels of the grid
+    computed = len(tables.levels)
+    for n_ed in np.linspace(-101e3, -99e3, 20):
+        get_section().get_moment_curvature(n_ed)
+    assert len(tables.levels) - computed <= 2
+
+    with pytest.raises(ValueError, match="outside"):
+        get_section().get_moment_curvature(-1e9)
+
+
+def test_curvatures_must_increase() -> None:
+    with pytest.raises(ValueError, match="increasing"):
+        MomentCurvature([0.0, 2.0, 1.0], [0.0, 1.0, 2.0])
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+from framesss.solvers.linear_static import LinearStaticSolver
+
+from desssign.common.model import DesignModelFrameXZ
+from desssign.concrete.concrete_material import ConcreteMaterial
+from desssign.concrete.concrete_section import ConcreteSection
+from desssign.concrete.design_checks.design_check import ShearCheckWithoutShearReinforcement
+from desssign.concrete.design_checks.design_check import ShearResistanceWithoutReinforcement
+from desssign.concrete.design_checks.design_check import shear_resistance_without_reinforcement
+
+
+def v_rd_c_in_mm(f_ck: float, d: float, b_w: float, a_sl: float, sigma_cp: float = 0.0) -> float:
+    """EN 1992-1-1, eq. (6.2.a), (6.2.b) in N, mm and MPa."""
+    k = min(1 + math.sqrt(200 / d), 2.0)
+    rho_l = min(a_sl / (b_w * d), 0.02)
+    v_rd_c = 0.18 / 1.5 * k * (100 * rho_l * f_ck) ** (1 / 3) + 0.15 * sigma_cp
+    v_min = 0.035 * k ** (3 / 2) * f_ck ** (1 / 2) + 0.15 * sigma_cp
+    return max(v_rd_c, v_min) * b_w * d
+
+
+@pytest.mark.parametrize(("d", "a_sl"), [(0.45, 4.02e-4), (0.15, 1e-5), (0.9, 5e-3)])
+def test_shear_resistance_matches_eurocode(d: float, a_sl: float) -> None:
+    v_rd_c = shear_resistance_without_reinforcement(20e6, 1.5, d, 0.3, a_sl / (0.3 * d))
+
+    assert v_rd_c == pytest.approx(v_rd_c_in_mm(20, d * 1e3, 300, a_sl * 1e6))
+
+
+def test_axial_stress_is_limited() -> None:
+    resistance = ShearResistanceWithoutReinforcement(
+        f_ck=20e6, f_cd=20e6 / 1.5, gamma_c=1.5, d=0.45, b_w=0.3, rho_l=0.003, area=0.15
+    )
+    sigma_cp = np.array([[0.0, 1e6, 3e6], [-1e6, 2e6, 10e6]])
+
+    v_rd_c = resistance(-sigma_cp * 0.15)
+
+    expected = [
+        [v_rd_c_in_mm(20, 450, 300, 405, min(s / 1e6, 0.2 * 20 / 1.5)) for s in row]
+        for row in sigma_cp
+    ]
+    np.testing.assert_allclose(v_rd_c, expected)
+
+
+def test_members_without_shear_reinforcement() -> None:
+    material = ConcreteMaterial(strength_class="C20/25")
+    section = ConcreteSection(
+        label="A",
+        points=[[0.0, 0.0], [0.3, 0.0], [0.3, 0.5], [0.0, 0.5]],
+        material=material,
+        v_rd=None,
+        m_rd_positive=30e3,
+        m_rd_negative=-40e3,
+        d=0.45,
+        b_w=0.3,
+        A_sl=4.02e-4,
+    )
+    model = DesignModelFrameXZ()
+    fixed = ["fixed", "free", "fixed", "free", "fixed", "free"]
+    node_1 = model.add_node("1", [0, 0, 0], fixity=fixed)
+    node_2 = model.add_node("2", [6, 0, 0], fixity=["free", "free", "fixed", "free", "free", "free"])
+    member = model.add_concrete_member("1-2", "navier", [node_1, node_2], section)
+    g = model.add_design_load_case("G", load_type="permanent")
+    member.add_distributed_load(np.array([0, 0, 10, 0, 0, 10]) * 1e3, g)
+    model.add_design_load_case_combination("CO1", "ULS", "basic", [g], None, [])
+    LinearStaticSolver(model).solve()
+
+    model.perform_uls_checks()
+
+    check = next(iter(member.design_checks.shear_check.values()))
+    assert isinstance(check, ShearCheckWithoutShearReinforcement)
+    np.testing.assert_allclose(check.v_rd, v_rd_c_in_mm(20, 450, 300, 402))
+    # The resistance without axial force is evaluated once per member
+    assert member.shear_resistance is member.shear_resistance
+
+    summaries = member.design_checks.summarize()
+    member.design_checks.summaries.clear()
+    member.design_checks.perform_fused_uls_checks(list(member.design_checks.shear_check))
+    fused = {s.family: s.max_usage for s in member.design_checks.summaries.values()}
+    assert fused == pytest.approx({s.family: s.max_usage for s in summaries})
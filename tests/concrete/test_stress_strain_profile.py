@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from desssign.concrete.concrete_material import ConcreteMaterial
+from desssign.concrete.rebar_material import RebarMaterial
+from desssign.concrete.stress_strain_profile import CompiledProfiles
+from desssign.concrete.stress_strain_profile import ConcreteStressStrainProfile
+from desssign.concrete.stress_strain_profile import ProfileCacheStats
+from desssign.concrete.stress_strain_profile import ProfileFactory
+from desssign.concrete.stress_strain_profile import ReinforcementSSP
+from desssign.concrete.stress_strain_profile import ReinforcementStressStrainProfile
+from desssign.concrete.stress_strain_profile import StressStrainProfile
+
+CONCRETE = ConcreteStressStrainProfile(ConcreteMaterial("C30/37"), "SLS")
+STEEL = ReinforcementStressStrainProfile(
+    RebarMaterial("B500B"), "ULS", ReinforcementSSP.ELASTIC_PLASTIC_WITH_HARDENING
+)
+
+
+@pytest.mark.parametrize("profile", [CONCRETE, STEEL])
+def test_compiled_stresses_match_the_interpolation(profile: StressStrainProfile) -> None:
+    rng = np.random.default_rng(0)
+    span = profile.max_strain - profile.min_strain
+    strains = np.concatenate(
+        (
+            rng.uniform(profile.min_strain - 0.1 * span, profile.max_strain + 0.1 * span, 1000),
+            profile.strains,
+        )
+    )
+
+    np.testing.assert_allclose(
+        profile.compiled.get_stresses(strains), profile.get_stresses(strains), atol=1e-3
+    )
+
+
+def test_tangent_moduli() -> None:
+    elastic_plastic = StressStrainProfile(
+        [-0.01, -0.002, 0.002, 0.01], [-400e6, -400e6, 400e6, 400e6]
+    )
+
+    tangents = elastic_plastic.get_tangents(
+        np.array([-0.02, -0.005, -0.002, 0.0, 0.002, 0.005, 0.02])
+    )
+
+    np.testing.assert_allclose(tangents, [0.0, 0.0, 0.0, 200e9, 200e9, 0.0, 0.0])
+
+
+def test_batch_of_profiles_with_material_ids() -> None:
+    profiles = CompiledProfiles([CONCRETE, STEEL])
+    strains = np.array([[-0.003, 0.0001, 0.05], [-0.003, 0.0001, 0.05]])
+    ids = np.array([[0, 0, 0], [1, 1, 1]])
+
+    stresses = profiles.get_stresses(strains, ids)
+
+    np.testing.assert_allclose(stresses[0], CONCRETE.get_stresses(strains[0]))
+    np.testing.assert_allclose(stresses[1], STEEL.get_stresses(strains[1]))
+    np.testing.assert_allclose(
+        profiles.get_tangents(strains[1], 1), STEEL.get_tangents(strains[1])
+    )
+
+
+def test_factory_shares_equal_profiles() -> None:
+    factory = ProfileFactory()
+    concrete = ConcreteMaterial("C30/37")
+
+    profile = factory.get_concrete_profile(concrete, "SLS", effective_creep_ratio=1)
+    shared = factory.get_concrete_profile(
+        ConcreteMaterial("C30/37"), "SLS", "nonlinear", effective_creep_ratio=1.0
+    )
+    assert shared is profile
+    assert factory.get_concrete_profile(concrete, "sls", effective_creep_ratio=1) is profile
+    assert factory.get_concrete_profile(concrete, "SLS", effective_creep_ratio=2.0) is not profile
+    assert factory.get_reinforcement_profile(RebarMaterial("B500B"), "ULS") is not profile
+    assert factory.stats == ProfileCacheStats(hits=2, misses=3, entries=3)
+
+    constructed = ConcreteStressStrainProfile(concrete, "SLS", effective_creep_ratio=1)
+    np.testing.assert_allclose(profile.strains, constructed.strains)
+    with pytest.raises(ValueError, match="read-only"):
+        profile.stresses[0] = 0.0
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+import pytest
+from framesss.solvers.linear_static import LinearStaticSolver
+
+from desssign.common.model import DesignModelFrameXZ
+from desssign.concrete.concrete_material import ConcreteMaterial
+from desssign.concrete.concrete_section import ConcreteSection
+from desssign.wood.enums import ServiceClass
+from desssign.wood.wood_material import WoodMaterial
+from desssign.wood.wood_section import WoodRectangularSection
+
+
+def solve_wood_model(load_factor: float = 1.0) -> DesignModelFrameXZ:
+    """Build and solve a continuous wood beam with two ULS combinations."""
+    material = WoodMaterial("C24", ServiceClass.SC2)
+    section = WoodRectangularSection("100/200", 0.1, 0.2, material)
+
+    model = DesignModelFrameXZ()
+    pinned = ["fixed", "free", "fixed", "free", "free", "free"]
+    roller = ["free", "free", "fixed", "free", "free", "free"]
+    nodes = [
+        model.add_node(str(i), [3.0 * i, 0, 0], fixity=pinned if i == 0 else roller)
+        for i in range(4)
+    ]
+    members = [
+        model.add_wood_member(
+            f"{i}-{i + 1}", "navier", [nodes[i], nodes[i + 1]], section
+        )
+        for i in range(3)
+    ]
+
+    g = model.add_design_load_case("G", load_type="permanent")
+    q = model.add_design_load_case(
+        "Q", load_type="variable", category="a", load_duration_class="medium-term"
+    )
+    for i, member in enumerate(members):
+        permanent = np.array([0, 0, 1 + i, 0, 0, 1 + i]) * 1e3 * load_factor
+        imposed = np.array([0, 0, 2, 0, 0, 2]) * 1e3 * load_factor
+        member.add_distributed_load(permanent, g)
+        member.add_distributed_load(imposed, q)
+    nodes[-1].add_nodal_load([-5e3, 0, 0, 0, 0, 0], g)
+
+    model.add_design_load_case_combination("CO1", "ULS", "basic", [g], q, [])
+    model.add_design_load_case_combination("CO2", "ULS", "basic", [g], None, [])
+
+    LinearStaticSolver(model).solve()
+    return model
+
+
+@pytest.fixture
+def solved_wood_model() -> Callable[..., DesignModelFrameXZ]:
+    """Return a factory of solved continuous wood beams with two ULS combinations."""
+    return solve_wood_model
+
+
+def solve_concrete_model(sections: bool = False) -> DesignModelFrameXZ:
+    """Build and solve a propped cantilever concrete beam with two ULS combinations and an envelope."""
+    material = ConcreteMaterial(strength_class="C20/25")
+    section_a = ConcreteSection(
+        label="A",
+        points=[[0.0, 0.0], [0.3, 0.0], [0.3, 0.5], [0.0, 0.5]],
+        material=material,
+        v_rd=60e3,
+        m_rd_positive=30e3,
+        m_rd_negative=-40e3,
+    )
+    section_b = ConcreteSection(
+        label="B",
+        points=[[0.0, 0.0], [0.6, 0.0], [0.6, 1.0], [0.0, 1.0]],
+        material=material,
+        v_rd=120e3,
+        m_rd_positive=60e3,
+        m_rd_negative=-80e3,
+    )
+
+    model = DesignModelFrameXZ()
+    fixed = ["fixed", "free", "fixed", "free", "fixed", "free"]
+    roller = ["free", "free", "fixed", "free", "free", "free"]
+    node_1 = model.add_node("1", [0, 0, 0], fixity=fixed)
+    node_2 = model.add_node("2", [6, 0, 0], fixity=roller)
+    member = model.add_concrete_member("1-2", "navier", [node_1, node_2], section_a)
+    if sections:
+        member.define_sections({(0.0, 3.0): section_a, (3.0, 6.0): section_b})
+
+    q = model.add_design_load_case("Q", load_type="variable", category="a")
+    g = model.add_design_load_case("G", load_type="permanent")
+    member.add_distributed_load(np.array([0, 0, 25, 0, 0, 25]) * 1e3, q)
+    member.add_distributed_load(np.array([0, 0, 50, 0, 0, 50]) * 1e3, g)
+
+    co1 = model.add_design_load_case_combination("CO1", "ULS", "basic", [g], q, [])
+    co2 = model.add_design_load_case_combination("CO2", "ULS", "basic", [g], None, [])
+    model.add_envelope("ULS", [co1, co2])
+
+    LinearStaticSolver(model).solve()
+    return model
+
+
+@pytest.fixture
+def solved_concrete_model() -> Callable[..., DesignModelFrameXZ]:
+    """Return a factory of solved concrete beams with two ULS combinations and an envelope."""
+    return solve_concrete_model
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from desssign.loads.enums import LOAD_DURATION_MAPPING
+from desssign.loads.enums import LoadDurationClass
+from desssign.wood.enums import ServiceClass
+from desssign.wood.wood_material import WoodMaterial
+
+
+@pytest.fixture
+def material() -> WoodMaterial:
+    return WoodMaterial(strength_class="C24", service_class=ServiceClass.SC3)
+
+
+@pytest.mark.parametrize("load_duration_class", list(LoadDurationClass))
+def test_design_strength_table_matches_design_value(
+    material: WoodMaterial, load_duration_class: LoadDurationClass
+) -> None:
+    code = LOAD_DURATION_MAPPING[load_duration_class]
+
+    for design, characteristic in (
+        ("f_md", material.f_mk),
+        ("f_t0d", material.f_t0k),
+        ("f_c0d", material.f_c0k),
+        ("f_vd", material.f_vk),
+    ):
+        assert material.get_design_strength(design, code) == pytest.approx(
+            material.get_design_value(characteristic, load_duration_class)
+        )
+
+
+def test_design_strengths_batch(material: WoodMaterial) -> None:
+    codes = np.array([5, 2, 2, 1])
+
+    expected = [material.get_design_strength("f_c0d", code) for code in codes]
+
+    assert_allclose(material.get_design_strengths("f_c0d", codes), expected)
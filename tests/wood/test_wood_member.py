@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from desssign.common.model import DesignModelFrameXZ
+from desssign.wood.enums import ServiceClass
+from desssign.wood.wood_material import WoodMaterial
+from desssign.wood.wood_member import WoodMember1D
+from desssign.wood.wood_section import WoodRectangularSection
+
+
+@pytest.fixture
+def material() -> WoodMaterial:
+    return WoodMaterial(strength_class="C24", service_class=ServiceClass.SC1)
+
+
+@pytest.fixture
+def member(material: WoodMaterial) -> WoodMember1D:
+    model = DesignModelFrameXZ()
+    node_1 = model.add_node("1", [0, 0, 0])
+    node_2 = model.add_node("2", [0, 0, 3])
+    section = WoodRectangularSection("100/160", 0.1, 0.16, material)
+    return model.add_wood_member("1-2", "navier", [node_1, node_2], section)
+
+
+def test_stability_factors_are_cached(member: WoodMember1D) -> None:
+    k_cz = member.k_cz
+
+    assert member.__dict__["k_cz"] == k_cz
+    assert member.k_cz is k_cz
+
+
+def test_section_change_invalidates_stability_factors(
+    member: WoodMember1D, material: WoodMaterial
+) -> None:
+    k_cy, k_cz, k_crit = member.k_cy, member.k_cz, member.k_crit
+
+    member.section = WoodRectangularSection("120/200", 0.12, 0.2, material)
+
+    assert member.k_cy > k_cy
+    assert member.k_cz > k_cz
+    assert member.k_crit >= k_crit
+
+
+def test_buckling_length_invalidates_stability_factors(member: WoodMember1D) -> None:
+    k_cz = member.k_cz
+
+    member.buckling_length_z = 0.5 * member.length
+
+    assert member.L_cr_z == pytest.approx(1.5)
+    assert member.k_cz > k_cz
+
+
+def test_lateral_restraints_invalidate_k_crit(member: WoodMember1D) -> None:
+    member.length = 12.0
+    assert member.k_crit < 1.0
+
+    member.is_prevented_lateral_displacement_at_compressive_edge = True
+    member.is_prevented_torsional_rotation_at_supports = True
+
+    assert member.k_crit == 1.0